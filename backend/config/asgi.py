@@ -0,0 +1,19 @@
+"""
+ASGI config for Game Providers Platform.
+
+Run with an ASGI server, e.g.:
+    gunicorn config.asgi -k uvicorn_worker.UvicornWorker
+    uvicorn config.asgi:application
+"""
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Persistent connections aren't reused under ASGI: each request's sync ORM
+# work runs in its own thread context, so a kept-open connection is only
+# closed once it expires. Close them per request unless DB_CONN_MAX_AGE is
+# set explicitly; use DB_POOL=true to reuse connections.
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+
+application = get_asgi_application()
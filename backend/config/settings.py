@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -37,7 +38,9 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'providers.middleware.AsyncWhiteNoiseMiddleware',
+    'providers.middleware.RequestMetricsMiddleware',
+    'providers.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -68,10 +71,25 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
 # Use DATABASE_URL from environment (Railway-ready)
+#
+# Connections are persistent by default (DB_CONN_MAX_AGE seconds, with a
+# health check before reuse), except under ASGI, where config/asgi.py
+# defaults DB_CONN_MAX_AGE to 0. Set DB_POOL=true to use a psycopg 3
+# connection pool instead (requires `pip install "psycopg[binary,pool]"`);
+# pooling and persistent connections are mutually exclusive, so
+# CONN_MAX_AGE is 0 then.
+DB_POOL = os.environ.get('DB_POOL', 'False').lower() in ('true', '1', 'yes')
+DB_CONN_MAX_AGE = 0 if DB_POOL else int(os.environ.get('DB_CONN_MAX_AGE', '600'))
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'True').lower() in ('true', '1', 'yes')
+
 DATABASE_URL = os.environ.get('DATABASE_URL')
 if DATABASE_URL:
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL)
+        'default': dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=DB_CONN_HEALTH_CHECKS,
+        )
     }
 else:
     # Fallback for local development without Docker
@@ -83,9 +101,18 @@ else:
             'PASSWORD': 'changeme',
             'HOST': 'localhost',
             'PORT': '5432',
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
         }
     }
 
+if DB_POOL and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', '10')),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', '10')),
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -128,14 +155,99 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'providers.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'providers.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
     ],
     'EXCEPTION_HANDLER': 'providers.exceptions.custom_exception_handler',
 }
 
+# Cache
+# REDIS_URL -> shared Redis cache (requires `pip install redis`);
+# CACHE_DIR -> file cache shared by workers on one host;
+# otherwise per-process local memory.
+REDIS_URL = os.environ.get('REDIS_URL')
+CACHE_DIR = os.environ.get('CACHE_DIR')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+elif CACHE_DIR:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': CACHE_DIR,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'game-providers',
+        }
+    }
+
+# WEB_CONCURRENCY is gunicorn's worker count. Invalidations (catalog writes,
+# logouts, user changes) only reach other workers through a shared cache, so
+# with several workers and no REDIS_URL/CACHE_DIR the response cache, the
+# session cache and the user cache are all turned off.
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', '1'))
+CACHE_SHARED = bool(REDIS_URL or CACHE_DIR) or WEB_CONCURRENCY <= 1
+
+# API response cache (keyed by catalog version, see providers/cache.py); 0 disables
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', '300'))
+
+# Responses smaller than this (bytes) are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+
+# Per-request SQL/serialize/render timing: Server-Timing header + JSON log line
+# (providers.middleware.RequestMetricsMiddleware, which records the Prometheus
+# request histograms either way); budgets flag slow requests
+REQUEST_METRICS = os.environ.get('REQUEST_METRICS', 'False').lower() in ('true', '1', 'yes')
+REQUEST_QUERY_BUDGET = int(os.environ.get('REQUEST_QUERY_BUDGET', '20'))
+REQUEST_LATENCY_BUDGET_MS = int(os.environ.get('REQUEST_LATENCY_BUDGET_MS', '500'))
+
+# Prometheus metrics at /api/admin/metrics/ (providers/prometheus.py).
+# METRICS_DIR: directory shared by all workers so the endpoint aggregates them
+# (per-process otherwise); METRICS_TOKEN: bearer token for scrapers, in
+# addition to superuser sessions.
+METRICS_DIR = os.environ.get('METRICS_DIR', '')
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Authentication: cache user lookups for session-authenticated requests
+if CACHE_SHARED:
+    AUTHENTICATION_BACKENDS = ['providers.auth.CachedModelBackend']
+else:
+    AUTHENTICATION_BACKENDS = ['django.contrib.auth.backends.ModelBackend']
+USER_CACHE_TIMEOUT = int(os.environ.get('USER_CACHE_TIMEOUT', '300'))
+
 # Session settings
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# SESSION_STORE=cached_db (default): cache first, django_session as backing store.
+# SESSION_STORE=cache: cache only -- use with REDIS_URL or CACHE_DIR, since
+# local-memory sessions are not shared between workers or restarts.
+# Without a shared cache and with several workers, sessions are plain
+# database sessions (run `manage.py clearsessions` from cron).
+SESSION_STORE = os.environ.get('SESSION_STORE', 'cached_db').lower()
+if SESSION_STORE == 'cache':
+    if not CACHE_SHARED:
+        raise ImproperlyConfigured('SESSION_STORE=cache with WEB_CONCURRENCY > 1 needs REDIS_URL or CACHE_DIR.')
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+elif CACHE_SHARED:
+    SESSION_ENGINE = 'providers.sessions'
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+SESSION_PURGE_INTERVAL = int(os.environ.get('SESSION_PURGE_INTERVAL', '3600'))
 SESSION_COOKIE_AGE = 86400 * 7  # 7 days
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'
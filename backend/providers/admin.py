@@ -1,11 +1,140 @@
 """
 Admin configuration for Game Providers Platform.
+
+Changelists are built to stay fast on large catalogs: counts are annotated,
+related rows are joined up front, the provider filter is an autocomplete
+instead of a full list, and unfiltered totals use the planner's estimate.
 """
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
+from .cache import bump_catalog_version
 from .models import Country, CryptoCurrency, FiatCurrency, Game, Provider, Restriction
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL's row estimate for unfiltered querysets.
+
+    Exact COUNT(*) is still used for filtered querysets and for small tables,
+    where it is cheap.
+    """
+
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where:
+            estimate = self._estimate(queryset)
+            if estimate is not None and estimate > self.exact_count_threshold:
+                return estimate
+        return super().count
+
+    def _estimate(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+
+
+class ProviderAutocompleteFilter(admin.RelatedFieldListFilter):
+    """
+    Provider filter rendered as an admin autocomplete box.
+
+    Only the currently selected provider is loaded; options are fetched from
+    the admin autocomplete view (requires ProviderAdmin.search_fields).
+    """
+
+    template = 'admin/providers/autocomplete_filter.html'
+
+    def field_choices(self, field, request, model_admin):
+        if not self.lookup_val:
+            return []
+        return field.get_choices(
+            include_blank=False,
+            limit_choices_to={'pk__in': self.lookup_val},
+        )
+
+    def has_output(self):
+        return True
+
+    @property
+    def app_label(self):
+        return self.field.model._meta.app_label
+
+    @property
+    def model_name(self):
+        return self.field.model._meta.model_name
+
+
+class ScalableChangeListMixin:
+    """Shared changelist settings for tables that grow with the catalog."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class InvalidatesCatalogMixin:
+    """
+    Bump the catalog version (expiring cached API responses) after edits,
+    passing on which providers' rows changed (see cache.bump_catalog_version).
+    """
+
+    def _provider_id(self, obj):
+        # Country rows belong to no provider
+        return obj.pk if self.model is Provider else getattr(obj, 'provider_id', None)
+
+    def _changes(self, provider_ids):
+        if self.model is Country:
+            # Country codes feed every provider's availability
+            return None
+        changes = {self.model: set(provider_ids)}
+        # Provider forms also edit currencies and restrictions inline
+        for inline in self.inlines:
+            changes[inline.model] = set(provider_ids)
+        return changes
+
+    def save_related(self, request, form, formsets, change):
+        # Runs after save_model and inlines, for both change forms and list_editable
+        super().save_related(request, form, formsets, change)
+        bump_catalog_version(self._changes([self._provider_id(form.instance)]))
+
+    def delete_model(self, request, obj):
+        provider_id = self._provider_id(obj)  # obj.pk is cleared by the delete
+        super().delete_model(request, obj)
+        bump_catalog_version(self._changes([provider_id]))
+
+    def delete_queryset(self, request, queryset):
+        provider_ids = set()
+        if self.model is not Country:
+            field = 'pk' if self.model is Provider else 'provider_id'
+            provider_ids = set(queryset.values_list(field, flat=True))
+        super().delete_queryset(request, queryset)
+        bump_catalog_version(self._changes(provider_ids))
+
+
+AUTOCOMPLETE_FILTER_MEDIA = {
+    'css': {'all': ('admin/css/vendor/select2/select2.css', 'admin/css/autocomplete.css')},
+    'js': (
+        'admin/js/vendor/jquery/jquery.js',
+        'admin/js/vendor/select2/select2.full.js',
+        'admin/js/jquery.init.js',
+        'admin/js/autocomplete.js',
+        'providers/js/autocomplete_filter.js',
+    ),
+}
+
+
 class FiatCurrencyInline(admin.TabularInline):
     model = FiatCurrency
     extra = 0
@@ -22,56 +151,73 @@ class RestrictionInline(admin.TabularInline):
 
 
 @admin.register(Provider)
-class ProviderAdmin(admin.ModelAdmin):
+class ProviderAdmin(InvalidatesCatalogMixin, admin.ModelAdmin):
     list_display = ['provider_name', 'status', 'currency_mode', 'game_count', 'last_synced']
     list_filter = ['status', 'currency_mode']
     search_fields = ['provider_name']
     ordering = ['provider_name']
     inlines = [FiatCurrencyInline, CryptoCurrencyInline, RestrictionInline]
 
+    def get_queryset(self, request):
+        queryset = Provider.objects.with_game_count_subquery()
+        ordering = self.get_ordering(request)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
+    @admin.display(description='Games', ordering='game_count')
     def game_count(self, obj):
-        return obj.games.count()
-    game_count.short_description = 'Games'
+        return obj.game_count
 
 
 @admin.register(Game)
-class GameAdmin(admin.ModelAdmin):
+class GameAdmin(InvalidatesCatalogMixin, ScalableChangeListMixin, admin.ModelAdmin):
     list_display = ['game_title', 'provider', 'game_type', 'rtp', 'volatility', 'enabled']
-    list_filter = ['provider', 'game_type', 'enabled', 'fun_mode']
-    search_fields = ['game_title', 'title', 'provider__provider_name']
+    list_filter = [('provider', ProviderAutocompleteFilter), 'game_type', 'enabled', 'fun_mode']
+    list_select_related = ['provider']
+    # Trigram-indexed on PostgreSQL (see migration 0004); filter by provider
+    # with the autocomplete instead of joining provider names into the search.
+    search_fields = ['game_title', 'title']
     ordering = ['game_title']
     raw_id_fields = ['provider']
 
+    class Media:
+        css = AUTOCOMPLETE_FILTER_MEDIA['css']
+        js = AUTOCOMPLETE_FILTER_MEDIA['js']
+
 
 @admin.register(FiatCurrency)
-class FiatCurrencyAdmin(admin.ModelAdmin):
+class FiatCurrencyAdmin(InvalidatesCatalogMixin, ScalableChangeListMixin, admin.ModelAdmin):
     list_display = ['provider', 'currency_code', 'display', 'source']
     list_filter = ['currency_code', 'display']
     search_fields = ['provider__provider_name', 'currency_code']
     ordering = ['provider__provider_name', 'currency_code']
+    list_select_related = ['provider']
     raw_id_fields = ['provider']
 
 
 @admin.register(CryptoCurrency)
-class CryptoCurrencyAdmin(admin.ModelAdmin):
+class CryptoCurrencyAdmin(InvalidatesCatalogMixin, ScalableChangeListMixin, admin.ModelAdmin):
     list_display = ['provider', 'currency_code', 'display', 'source']
     list_filter = ['currency_code', 'display']
     search_fields = ['provider__provider_name', 'currency_code']
     ordering = ['provider__provider_name', 'currency_code']
+    list_select_related = ['provider']
     raw_id_fields = ['provider']
 
 
 @admin.register(Restriction)
-class RestrictionAdmin(admin.ModelAdmin):
+class RestrictionAdmin(InvalidatesCatalogMixin, ScalableChangeListMixin, admin.ModelAdmin):
     list_display = ['provider', 'country_code', 'restriction_type', 'source']
     list_filter = ['restriction_type', 'country_code']
     search_fields = ['provider__provider_name', 'country_code']
     ordering = ['provider__provider_name', 'country_code']
+    list_select_related = ['provider']
     raw_id_fields = ['provider']
 
 
 @admin.register(Country)
-class CountryAdmin(admin.ModelAdmin):
+class CountryAdmin(InvalidatesCatalogMixin, admin.ModelAdmin):
     list_display = ['iso3', 'iso2', 'name']
     search_fields = ['name', 'iso2', 'iso3']
     ordering = ['name']
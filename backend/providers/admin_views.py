@@ -4,17 +4,30 @@ Admin-only API views for Game Providers Platform.
 All endpoints require superuser permissions.
 """
 import csv
+import hmac
 import io
+from datetime import timedelta
 from io import StringIO
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.core.management import call_command
-from django.db import transaction
-from django.db.models import Count
+from django.db import connections, transaction
+from django.db.models import Count, F, Max, Min, Q
+from django.http import HttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_POST
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAdminUser
+from rest_framework.permissions import BasePermission, IsAdminUser
 from rest_framework.response import Response
 
+from . import prometheus, reference
+from .bulk import bulk_load
+from .cache import invalidates_catalog, note_catalog_change
+from .filters import ExactProviderFilter, GameFilter, applied_filters
+from .instrumentation import span
 from .models import (
     Country,
     CryptoCurrency,
@@ -23,11 +36,14 @@ from .models import (
     Provider,
     Restriction,
 )
+from .pagination import AdminPagination
 from .serializers import (
+    AdminProviderListSerializer,
     GameSerializer,
     ProviderDetailSerializer,
-    ProviderListSerializer,
+    RowSerializer,
 )
+from .views import json_response
 
 
 # ---------------------------------------------------------------------------
@@ -53,18 +69,77 @@ def admin_stats(request):
     return Response(data)
 
 
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+class IsAdminUserOrMetricsToken(BasePermission):
+    """Superusers, or scrapers sending ``Authorization: Bearer <METRICS_TOKEN>``."""
+
+    def has_permission(self, request, view):
+        token = settings.METRICS_TOKEN
+        header = request.headers.get('Authorization', '')
+        if token and hmac.compare_digest(header, f'Bearer {token}'):
+            return True
+        return IsAdminUser().has_permission(request, view)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUserOrMetricsToken])
+def admin_metrics(request):
+    """Prometheus metrics for all workers, plus sync ages read from the DB."""
+    synced = Provider.objects.aggregate(
+        newest=Max('last_synced'),
+        oldest=Min('last_synced'),
+        never=Count('id', filter=Q(last_synced__isnull=True)),
+    )
+    now = timezone.now()
+
+    def age(value):
+        return (now - value).total_seconds() if value else None
+
+    body = prometheus.render({
+        'providers_last_sync_age_seconds': (
+            'Seconds since the most recently synced provider was synced.', age(synced['newest'])),
+        'providers_oldest_sync_age_seconds': (
+            'Seconds since the least recently synced provider was synced.', age(synced['oldest'])),
+        'providers_never_synced': (
+            'Providers that have never been synced.', synced['never']),
+    })
+    return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 # ---------------------------------------------------------------------------
 # Sync
 # ---------------------------------------------------------------------------
 
-@api_view(['POST'])
-@permission_classes([IsAdminUser])
-def admin_sync(request):
-    """Trigger provider sync from external API."""
+def _run_sync(out):
+    try:
+        call_command('sync_providers', stdout=out, stderr=out)
+    finally:
+        # This thread isn't a request thread, so nothing else closes its connection
+        connections.close_all()
+
+
+@require_POST
+async def admin_sync(request):
+    """
+    Trigger provider sync from external API.
+
+    An async view, so the sync (which takes minutes) runs on a thread of its
+    own. As a sync view it would hold the one thread per process that sync
+    views and async ORM calls share under ASGI, stalling every other request.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return json_response({'detail': 'Authentication credentials were not provided.'}, status=403)
+    if not user.is_staff:
+        return json_response({'detail': 'You do not have permission to perform this action.'}, status=403)
+
     out = StringIO()
 
     try:
-        call_command('sync_providers', stdout=out, stderr=out)
+        await sync_to_async(_run_sync, thread_sensitive=False)(out)
         output = out.getvalue()
 
         # Parse summary from output
@@ -88,9 +163,9 @@ def admin_sync(request):
                 except (ValueError, IndexError):
                     pass
 
-        return Response(stats)
+        return json_response(stats)
     except Exception as e:
-        return Response({
+        return json_response({
             'success': False,
             'error': str(e),
             'output': out.getvalue(),
@@ -103,6 +178,7 @@ def admin_sync(request):
 
 @api_view(['POST'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_import(request):
     """Import data from uploaded file (CSV or Excel)."""
     if 'file' not in request.FILES:
@@ -133,34 +209,57 @@ def admin_import(request):
         )
 
 
+IMPORT_FIELDS = ('provider_name', 'status', 'currency_mode')
+
+
+def _clean_import_row(row_num, values):
+    """
+    Validate one import row (``IMPORT_FIELDS`` values) against the Provider fields.
+
+    Returns (cleaned, error): rows are checked before the bulk load, so a bad
+    row is reported and skipped instead of failing the whole COPY.
+    """
+    cleaned = []
+    for name, value in zip(IMPORT_FIELDS, values):
+        try:
+            cleaned.append(Provider._meta.get_field(name).clean(value, None))
+        except ValidationError as e:
+            return None, f'Row {row_num}: {name}: {" ".join(e.messages)}'
+    return cleaned, None
+
+
 def _import_csv(file):
     """Import providers from CSV file."""
     content = file.read().decode('utf-8-sig')  # Handle BOM
     reader = csv.DictReader(io.StringIO(content), delimiter=';')
 
+    entries = {}
     imported = 0
     skipped = 0
     errors = []
 
     for row_num, row in enumerate(reader, start=2):
-        try:
-            provider_name = row.get('Provider Name') or row.get('provider_name')
-            if not provider_name:
-                errors.append(f'Row {row_num}: Missing provider name')
-                skipped += 1
-                continue
+        provider_name = (row.get('Provider Name') or row.get('provider_name') or '').strip()
+        if not provider_name:
+            errors.append(f'Row {row_num}: Missing provider name')
+            skipped += 1
+            continue
 
-            Provider.objects.update_or_create(
-                provider_name=provider_name,
-                defaults={
-                    'status': row.get('Status', row.get('status', 'DRAFT')),
-                    'currency_mode': row.get('Currency Mode', row.get('currency_mode', 'ALL_FIAT')),
-                }
-            )
-            imported += 1
-        except Exception as e:
-            errors.append(f'Row {row_num}: {str(e)}')
+        cleaned, error = _clean_import_row(row_num, (
+            provider_name,
+            row.get('Status') or row.get('status') or 'DRAFT',
+            row.get('Currency Mode') or row.get('currency_mode') or 'ALL_FIAT',
+        ))
+        if error:
+            errors.append(error)
             skipped += 1
+            continue
+
+        name, status_value, currency_mode = cleaned
+        entries[name] = (status_value, currency_mode)
+        imported += 1
+
+    _upsert_providers(entries)
 
     return {
         'imported': imported,
@@ -194,25 +293,28 @@ def _import_excel(file):
     if name_col is None:
         return {'imported': 0, 'skipped': 0, 'errors': ['No provider name column found']}
 
+    entries = {}
     imported = 0
     skipped = 0
     errors = []
 
     for row_num, row in enumerate(rows[1:], start=2):
-        try:
-            provider_name = row[name_col] if name_col < len(row) else None
-            if not provider_name:
-                skipped += 1
-                continue
+        provider_name = row[name_col] if name_col < len(row) else None
+        if provider_name is None or not str(provider_name).strip():
+            skipped += 1
+            continue
 
-            Provider.objects.update_or_create(
-                provider_name=str(provider_name).strip(),
-                defaults={'status': 'DRAFT', 'currency_mode': 'ALL_FIAT'}
-            )
-            imported += 1
-        except Exception as e:
-            errors.append(f'Row {row_num}: {str(e)}')
+        cleaned, error = _clean_import_row(row_num, (str(provider_name).strip(), 'DRAFT', 'ALL_FIAT'))
+        if error:
+            errors.append(error)
             skipped += 1
+            continue
+
+        name, status_value, currency_mode = cleaned
+        entries[name] = (status_value, currency_mode)
+        imported += 1
+
+    _upsert_providers(entries)
 
     return {
         'imported': imported,
@@ -221,24 +323,92 @@ def _import_excel(file):
     }
 
 
+def _upsert_providers(entries: dict[str, tuple[str, str]]):
+    """
+    Create or update providers from {provider_name: (status, currency_mode)}.
+
+    Existing providers are updated with one bulk UPDATE; new ones are
+    streamed in with bulk_load instead of one update_or_create per row.
+    """
+    if not entries:
+        return
+
+    with transaction.atomic():
+        existing = list(Provider.objects.filter(provider_name__in=list(entries)))
+        for provider in existing:
+            provider.status, provider.currency_mode = entries[provider.provider_name]
+        Provider.objects.bulk_update(existing, ['status', 'currency_mode'], batch_size=500)
+
+        existing_names = {p.provider_name for p in existing}
+        bulk_load(
+            Provider,
+            ('provider_name', 'status', 'currency_mode'),
+            (
+                (name, status_value, currency_mode)
+                for name, (status_value, currency_mode) in entries.items()
+                if name not in existing_names
+            ),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Provider CRUD
 # ---------------------------------------------------------------------------
 
+# ?ordering= values accepted by the admin provider list (prefix with - for desc)
+ADMIN_PROVIDER_ORDERING = {
+    'name': 'provider_name',
+    'game_count': 'game_count',
+    'last_synced': 'last_synced',
+    'status': 'status',
+}
+
+
 @api_view(['GET', 'POST'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_providers(request):
     """List all providers or create a new one."""
     if request.method == 'GET':
-        search = request.query_params.get('search', '')
-        queryset = Provider.objects.with_game_count()
+        params = request.query_params
+        queryset = Provider.objects.with_game_count_subquery()
 
+        search = params.get('search', '')
         if search:
             queryset = queryset.filter(provider_name__icontains=search)
+        if params.get('status'):
+            queryset = queryset.filter(status=params['status'])
+        if params.get('currency_mode'):
+            queryset = queryset.filter(currency_mode=params['currency_mode'])
+        if params.get('stale_days'):
+            try:
+                stale_days = int(params['stale_days'])
+            except ValueError:
+                return Response(
+                    {'detail': 'stale_days must be an integer.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            cutoff = timezone.now() - timedelta(days=stale_days)
+            queryset = queryset.filter(
+                Q(last_synced__isnull=True) | Q(last_synced__lt=cutoff)
+            )
 
-        queryset = queryset.order_by('provider_name')
-        serializer = ProviderListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        ordering = params.get('ordering', 'name')
+        field = ADMIN_PROVIDER_ORDERING.get(ordering.lstrip('-'))
+        if field is None:
+            return Response(
+                {'detail': f'Invalid ordering. Use one of: {", ".join(ADMIN_PROVIDER_ORDERING)}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        descending = ordering.startswith('-')
+        sort = F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True)
+        queryset = queryset.order_by(sort, 'id')
+
+        paginator = AdminPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        with span('serialize'):
+            data = AdminProviderListSerializer(page, many=True).data
+        return paginator.get_paginated_response(data)
 
     elif request.method == 'POST':
         data = request.data
@@ -264,6 +434,7 @@ def admin_providers(request):
             currency_mode=data.get('currency_mode', 'ALL_FIAT'),
             notes=data.get('notes', ''),
         )
+        note_catalog_change(request, Provider, [provider.pk])
 
         # Re-fetch with game_count annotation
         provider = Provider.objects.with_game_count().get(pk=provider.pk)
@@ -273,6 +444,7 @@ def admin_providers(request):
 
 @api_view(['GET', 'PUT', 'DELETE'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_provider_detail(request, pk):
     """Get, update, or delete a provider."""
     try:
@@ -314,12 +486,14 @@ def admin_provider_detail(request, pk):
             provider.notes = data['notes']
 
         provider.save()
+        note_catalog_change(request, Provider, [provider.pk])
         serializer = ProviderDetailSerializer(provider)
         return Response(serializer.data)
 
     elif request.method == 'DELETE':
         name = provider.provider_name
         provider.delete()
+        note_catalog_change(request, Provider, [pk])
         return Response({'detail': f'Provider "{name}" deleted.'})
 
 
@@ -327,15 +501,20 @@ def admin_provider_detail(request, pk):
 # Game CRUD
 # ---------------------------------------------------------------------------
 
+# values_list() fast path; provider_name is a joined column
+ADMIN_GAME_ROWS = RowSerializer(GameSerializer)
+
+
 @api_view(['GET', 'POST'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_games(request):
     """List games (optionally by provider) or create a new game."""
     if request.method == 'GET':
         provider_id = request.query_params.get('provider')
         search = request.query_params.get('search', '')
 
-        queryset = Game.objects.select_related('provider')
+        queryset = Game.objects.all()
 
         if provider_id:
             queryset = queryset.filter(provider_id=provider_id)
@@ -344,8 +523,10 @@ def admin_games(request):
             queryset = queryset.filter(game_title__icontains=search)
 
         queryset = queryset.order_by('game_title')[:500]  # Limit for performance
-        serializer = GameSerializer(queryset, many=True)
-        return Response(serializer.data)
+        rows = list(queryset.values_list(*ADMIN_GAME_ROWS.columns))
+        with span('serialize'):
+            data = ADMIN_GAME_ROWS.serialize(rows)
+        return Response(data)
 
     elif request.method == 'POST':
         data = request.data
@@ -386,6 +567,7 @@ def admin_games(request):
             thumbnail=data.get('thumbnail', ''),
             source='manual',
         )
+        note_catalog_change(request, Game, [provider.pk])
 
         serializer = GameSerializer(game)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -393,6 +575,7 @@ def admin_games(request):
 
 @api_view(['GET', 'PUT', 'DELETE'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_game_detail(request, pk):
     """Get, update, or delete a game."""
     try:
@@ -432,12 +615,14 @@ def admin_game_detail(request, pk):
             game.thumbnail = data['thumbnail']
 
         game.save()
+        note_catalog_change(request, Game, [game.provider_id])
         serializer = GameSerializer(game)
         return Response(serializer.data)
 
     elif request.method == 'DELETE':
         title = game.game_title
         game.delete()
+        note_catalog_change(request, Game, [game.provider_id])
         return Response({'detail': f'Game "{title}" deleted.'})
 
 
@@ -447,6 +632,7 @@ def admin_game_detail(request, pk):
 
 @api_view(['GET', 'POST'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_provider_currencies(request, pk):
     """List or add currencies for a provider."""
     try:
@@ -467,52 +653,27 @@ def admin_provider_currencies(request, pk):
 
     elif request.method == 'POST':
         data = request.data
-        currency_codes = data.get('currency_codes', '')
+        codes = _parse_codes(data.get('currency_codes', ''))
         currency_type = data.get('type', 'fiat').lower()
+        model = CryptoCurrency if currency_type == 'crypto' else FiatCurrency
 
-        if isinstance(currency_codes, str):
-            codes = [c.strip().upper() for c in currency_codes.split(',') if c.strip()]
-        else:
-            codes = [str(c).strip().upper() for c in currency_codes if c]
-
-        if not codes:
-            return Response(
-                {'detail': 'No currency codes provided.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        error = _check_codes(model, 'currency_code', codes, 'currency')
+        if error:
+            return error
 
-        added = 0
-        skipped = 0
-
-        with transaction.atomic():
-            for code in codes:
-                if currency_type == 'crypto':
-                    _, created = CryptoCurrency.objects.get_or_create(
-                        provider=provider,
-                        currency_code=code,
-                        defaults={'source': 'manual'}
-                    )
-                else:
-                    _, created = FiatCurrency.objects.get_or_create(
-                        provider=provider,
-                        currency_code=code,
-                        defaults={'source': 'manual'}
-                    )
-
-                if created:
-                    added += 1
-                else:
-                    skipped += 1
+        diff = _apply_codes(model, 'currency_code', [provider.pk], codes, 'add')[provider.pk]
+        note_catalog_change(request, model, [provider.pk])
 
         return Response({
-            'added': added,
-            'skipped': skipped,
+            'added': diff['added'],
+            'skipped': diff['skipped'],
             'total_codes': len(codes),
         })
 
 
 @api_view(['DELETE'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_provider_currency_delete(request, pk, code):
     """Delete a currency from a provider."""
     try:
@@ -528,16 +689,12 @@ def admin_provider_currency_delete(request, pk, code):
 
     deleted = False
 
-    if currency_type == 'crypto':
-        deleted_count, _ = CryptoCurrency.objects.filter(
-            provider=provider, currency_code=code_upper
-        ).delete()
-        deleted = deleted_count > 0
-    else:
-        deleted_count, _ = FiatCurrency.objects.filter(
-            provider=provider, currency_code=code_upper
-        ).delete()
-        deleted = deleted_count > 0
+    model = CryptoCurrency if currency_type == 'crypto' else FiatCurrency
+    deleted_count, _ = model.objects.filter(
+        provider=provider, currency_code=code_upper
+    ).delete()
+    deleted = deleted_count > 0
+    note_catalog_change(request, model, [provider.pk])
 
     if deleted:
         return Response({'detail': f'Currency {code_upper} removed.'})
@@ -554,6 +711,7 @@ def admin_provider_currency_delete(request, pk, code):
 
 @api_view(['GET', 'POST'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_provider_restrictions(request, pk):
     """List or add restrictions for a provider."""
     try:
@@ -568,63 +726,43 @@ def admin_provider_restrictions(request, pk):
         restrictions = list(provider.restrictions.values(
             'id', 'country_code', 'restriction_type'
         ))
+        ref = reference.get()
+        for restriction in restrictions:
+            restriction['country_name'] = ref.country_names.get(restriction['country_code'])
         return Response(restrictions)
 
     elif request.method == 'POST':
         data = request.data
-        country_codes = data.get('country_codes', '')
         restriction_type = data.get('restriction_type', 'RESTRICTED').upper()
 
-        if restriction_type not in ('RESTRICTED', 'REGULATED'):
+        if restriction_type not in Restriction.RestrictionType.values:
             return Response(
                 {'detail': 'Invalid restriction type. Use RESTRICTED or REGULATED.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        if isinstance(country_codes, str):
-            codes = [c.strip().upper() for c in country_codes.split(',') if c.strip()]
-        else:
-            codes = [str(c).strip().upper() for c in country_codes if c]
-
-        if not codes:
-            return Response(
-                {'detail': 'No country codes provided.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        codes = _parse_codes(data.get('country_codes', ''))
+        error = _check_codes(Restriction, 'country_code', codes, 'country')
+        if error:
+            return error
 
-        added = 0
-        updated = 0
-        skipped = 0
-
-        with transaction.atomic():
-            for code in codes:
-                obj, created = Restriction.objects.get_or_create(
-                    provider=provider,
-                    country_code=code,
-                    defaults={
-                        'restriction_type': restriction_type,
-                        'source': 'manual',
-                    }
-                )
-                if created:
-                    added += 1
-                elif obj.restriction_type != restriction_type:
-                    obj.restriction_type = restriction_type
-                    obj.save()
-                    updated += 1
-                else:
-                    skipped += 1
+        diff = _apply_codes(
+            Restriction, 'country_code', [provider.pk], codes, 'add',
+            type_field=('restriction_type', restriction_type),
+        )[provider.pk]
+        note_catalog_change(request, Restriction, [provider.pk])
 
         return Response({
-            'added': added,
-            'updated': updated,
-            'skipped': skipped,
+            'added': diff['added'],
+            'updated': diff['updated'],
+            'skipped': diff['skipped'],
             'total_codes': len(codes),
         })
 
 
 @api_view(['DELETE'])
 @permission_classes([IsAdminUser])
+@invalidates_catalog
 def admin_provider_restriction_delete(request, pk, restriction_id):
     """Delete a restriction from a provider."""
     try:
@@ -638,6 +776,7 @@ def admin_provider_restriction_delete(request, pk, restriction_id):
     deleted_count, _ = Restriction.objects.filter(
         provider=provider, id=restriction_id
     ).delete()
+    note_catalog_change(request, Restriction, [provider.pk])
 
     if deleted_count > 0:
         return Response({'detail': 'Restriction removed.'})
@@ -646,3 +785,443 @@ def admin_provider_restriction_delete(request, pk, restriction_id):
             {'detail': 'Restriction not found.'},
             status=status.HTTP_404_NOT_FOUND
         )
+
+
+# ---------------------------------------------------------------------------
+# Bulk currency / restriction editing (many providers at once)
+# ---------------------------------------------------------------------------
+
+BULK_CODE_MODES = ('add', 'remove', 'replace')
+
+
+def _parse_codes(value) -> list[str]:
+    """Normalize a comma-separated string or list of codes (upper-cased, de-duplicated)."""
+    if isinstance(value, str):
+        codes = [c.strip().upper() for c in value.split(',') if c.strip()]
+    elif isinstance(value, list):
+        codes = [str(c).strip().upper() for c in value if c]
+    else:
+        codes = []
+    return list(dict.fromkeys(codes))
+
+
+def _check_codes(model, code_field, codes, label):
+    """400 response when ``codes`` is empty or has codes too long for ``code_field``, else None."""
+    if not codes:
+        return Response(
+            {'detail': f'No {label} codes provided.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    max_length = model._meta.get_field(code_field).max_length
+    too_long = [code for code in codes if len(code) > max_length]
+    if too_long:
+        return Response(
+            {'detail': f'Codes longer than {max_length} characters: {", ".join(too_long)}.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return None
+
+
+def _filtered_queryset(data, queryset, filterset_class, ids_key='ids'):
+    """
+    Narrow ``queryset`` to the target set of a bulk request.
+
+    Accepts either ``ids_key`` (list of primary keys) or ``filters`` (a dict of
+    ``filterset_class`` query params). Returns (queryset, error_response).
+    """
+    ids = data.get(ids_key)
+    filters = data.get('filters')
+
+    if ids:
+        try:
+            if not isinstance(ids, list):
+                raise TypeError
+            pks = [int(pk) for pk in ids]
+        except (TypeError, ValueError):
+            return None, Response(
+                {'detail': f'{ids_key} must be a list of integers.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return queryset.filter(pk__in=pks), None
+
+    if isinstance(filters, dict) and filters:
+        unknown = sorted(set(filters) - set(filterset_class.base_filters))
+        if unknown:
+            return None, Response(
+                {'detail': f'Unknown filters: {", ".join(unknown)}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        filterset = filterset_class(filters, queryset=queryset)
+        if not filterset.is_valid():
+            return None, Response(
+                {'detail': 'Invalid filters.', 'errors': filterset.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        # Empty values are dropped by the filterset; never act on everything
+        if not applied_filters(filterset):
+            return None, Response(
+                {'detail': 'Filters must set at least one non-empty value.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return filterset.qs, None
+
+    return None, Response(
+        {'detail': f'Provide {ids_key} or filters.'},
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+def _resolve_providers(data):
+    """
+    Resolve the target provider set of a bulk code request.
+
+    Returns (providers, error_response) where providers is a list of
+    (id, provider_name) tuples.
+    """
+    queryset, error = _filtered_queryset(
+        data, Provider.objects.all(), ExactProviderFilter, ids_key='provider_ids'
+    )
+    if error:
+        return None, error
+
+    providers = list(queryset.order_by('provider_name').values_list('id', 'provider_name'))
+    if not providers:
+        return None, Response(
+            {'detail': 'No providers matched.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    return providers, None
+
+
+def _apply_codes(model, code_field, provider_ids, codes, mode, type_field=None) -> dict:
+    """
+    Add, remove or replace ``codes`` for every provider in ``provider_ids``.
+
+    Set-based: one SELECT of the current rows, one bulk_create(ignore_conflicts),
+    at most one UPDATE (``type_field`` changes) and one DELETE, all in a single
+    transaction. ``type_field`` is an optional (field_name, value) pair that new
+    and existing rows are set to (e.g. Restriction.restriction_type). With a
+    ``type_field``, replace only removes rows of that type: replacing the
+    REGULATED list leaves RESTRICTED countries alone.
+
+    Returns {provider_id: {'added', 'updated', 'removed', 'skipped'}}.
+    """
+    code_set = set(codes)
+    field_name, field_value = type_field or (None, None)
+    diff = {
+        pid: {'added': 0, 'updated': 0, 'removed': 0, 'skipped': 0}
+        for pid in provider_ids
+    }
+
+    with transaction.atomic():
+        current = model.objects.filter(provider_id__in=provider_ids)
+        listed = Q(**{f'{code_field}__in': codes})
+        if mode != 'replace':
+            current = current.filter(listed)
+        elif field_name:
+            current = current.filter(listed | Q(**{field_name: field_value}))
+        columns = ['provider_id', code_field] + ([field_name] if field_name else [])
+
+        existing = {pid: {} for pid in provider_ids}
+        for row in current.values_list(*columns):
+            existing[row[0]][row[1]] = row[2] if field_name else None
+
+        to_create = []
+        for pid in provider_ids:
+            have = existing[pid]
+            counts = diff[pid]
+            if mode == 'remove':
+                removed = len(code_set & have.keys())
+                counts['removed'] = removed
+                counts['skipped'] = len(codes) - removed
+                continue
+
+            for code in codes:
+                if code not in have:
+                    values = {'provider_id': pid, code_field: code, 'source': 'manual'}
+                    if field_name:
+                        values[field_name] = field_value
+                    to_create.append(model(**values))
+                    counts['added'] += 1
+                elif field_name and have[code] != field_value:
+                    counts['updated'] += 1
+                else:
+                    counts['skipped'] += 1
+            if mode == 'replace':
+                counts['removed'] = sum(
+                    1 for code, value in have.items()
+                    if code not in code_set and (not field_name or value == field_value)
+                )
+
+        if to_create:
+            model.objects.bulk_create(to_create, batch_size=1000, ignore_conflicts=True)
+
+        scoped = model.objects.filter(provider_id__in=provider_ids)
+        if field_name and mode != 'remove':
+            scoped.filter(**{f'{code_field}__in': codes}).exclude(
+                **{field_name: field_value}
+            ).update(**{field_name: field_value})
+        if mode == 'remove':
+            scoped.filter(**{f'{code_field}__in': codes}).delete()
+        elif mode == 'replace':
+            if field_name:
+                scoped = scoped.filter(**{field_name: field_value})
+            scoped.exclude(listed).delete()
+
+    return diff
+
+
+def _bulk_code_response(providers, diff) -> Response:
+    """Build the per-provider diff response shared by the bulk endpoints."""
+    per_provider = [
+        {'provider_id': pid, 'provider_name': name, **diff[pid]}
+        for pid, name in providers
+    ]
+    totals = {
+        key: sum(d[key] for d in diff.values())
+        for key in ('added', 'updated', 'removed', 'skipped')
+    }
+    return Response({
+        'providers': len(providers),
+        **totals,
+        'per_provider': per_provider,
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+@invalidates_catalog
+def admin_bulk_currencies(request):
+    """Add, remove or replace currencies across a set of providers."""
+    data = request.data
+    mode = str(data.get('mode', 'add')).lower()
+    currency_type = str(data.get('type', 'fiat')).lower()
+    codes = _parse_codes(data.get('currency_codes', ''))
+
+    if mode not in BULK_CODE_MODES:
+        return Response(
+            {'detail': 'Invalid mode. Use add, remove or replace.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    model = CryptoCurrency if currency_type == 'crypto' else FiatCurrency
+    error = _check_codes(model, 'currency_code', codes, 'currency')
+    if error:
+        return error
+
+    providers, error = _resolve_providers(data)
+    if error:
+        return error
+
+    provider_ids = [pid for pid, _ in providers]
+    diff = _apply_codes(model, 'currency_code', provider_ids, codes, mode)
+    note_catalog_change(request, model, provider_ids)
+    return _bulk_code_response(providers, diff)
+
+
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+@invalidates_catalog
+def admin_bulk_restrictions(request):
+    """Add, remove or replace country restrictions across a set of providers."""
+    data = request.data
+    mode = str(data.get('mode', 'add')).lower()
+    restriction_type = str(data.get('restriction_type', 'RESTRICTED')).upper()
+    codes = _parse_codes(data.get('country_codes', ''))
+
+    if mode not in BULK_CODE_MODES:
+        return Response(
+            {'detail': 'Invalid mode. Use add, remove or replace.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if restriction_type not in Restriction.RestrictionType.values:
+        return Response(
+            {'detail': 'Invalid restriction type. Use RESTRICTED or REGULATED.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    error = _check_codes(Restriction, 'country_code', codes, 'country')
+    if error:
+        return error
+
+    providers, error = _resolve_providers(data)
+    if error:
+        return error
+
+    provider_ids = [pid for pid, _ in providers]
+    diff = _apply_codes(
+        Restriction, 'country_code', provider_ids, codes, mode,
+        type_field=('restriction_type', restriction_type),
+    )
+    note_catalog_change(request, Restriction, provider_ids)
+    return _bulk_code_response(providers, diff)
+
+
+# ---------------------------------------------------------------------------
+# Bulk update / delete (filter-driven)
+# ---------------------------------------------------------------------------
+
+GAME_PATCH_FIELDS = (
+    'game_title', 'title', 'game_type', 'platform', 'subtype', 'vendor',
+    'rtp', 'volatility', 'enabled', 'fun_mode', 'features', 'themes',
+    'tags', 'thumbnail',
+)
+PROVIDER_PATCH_FIELDS = (
+    'status', 'currency_mode', 'logo_url_dark', 'logo_url_light', 'notes',
+)
+# Fields a batch-created game may set, with their defaults (title defaults to game_title)
+BATCH_GAME_DEFAULTS = {
+    'game_title': None, 'title': None, 'game_type': '', 'platform': '', 'rtp': None,
+    'volatility': '', 'enabled': True, 'features': '', 'themes': '', 'thumbnail': '',
+}
+
+
+def _clean_patch(model, patch, allowed):
+    """
+    Validate a bulk field patch against the model fields.
+
+    Returns (cleaned, error_response).
+    """
+    if not isinstance(patch, dict) or not patch:
+        return None, Response(
+            {'detail': 'No fields to update.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    unknown = sorted(set(patch) - set(allowed))
+    if unknown:
+        return None, Response(
+            {'detail': f'Fields cannot be bulk-updated: {", ".join(unknown)}.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    cleaned = {}
+    errors = {}
+    for name, value in patch.items():
+        field = model._meta.get_field(name)
+        if value == '' and field.null:
+            value = None
+        try:
+            cleaned[name] = field.clean(value, None)
+        except ValidationError as e:
+            errors[name] = e.messages
+    if errors:
+        return None, Response(
+            {'detail': 'Invalid field values.', 'errors': errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return cleaned, None
+
+
+def _clean_batch_game(item):
+    """
+    Validate one batch-created game against the model fields.
+
+    Returns (values, errors): cleaned field values and {field: messages}.
+    """
+    if not item.get('game_title'):
+        return {}, {'game_title': ['Game title is required.']}
+    values = {}
+    errors = {}
+    for name, default in BATCH_GAME_DEFAULTS.items():
+        value = item.get(name, default)
+        if name == 'title' and value is None:
+            value = item['game_title']
+        try:
+            values[name] = Game._meta.get_field(name).clean(value, None)
+        except ValidationError as e:
+            errors[name] = e.messages
+    return values, errors
+
+
+def _bulk_update_or_delete(request, model, filterset_class, allowed):
+    """Shared PATCH/DELETE handler: one UPDATE or DELETE for the whole set."""
+    data = request.data
+    queryset, error = _filtered_queryset(data, model.objects.all(), filterset_class)
+    if error:
+        return error
+
+    # Filters may add joins/distinct(); re-target by primary key so the write
+    # is a single statement with a subquery.
+    target = model.objects.filter(pk__in=queryset.values('pk'))
+    provider_field = 'pk' if model is Provider else 'provider_id'
+
+    if request.method == 'PATCH':
+        patch, error = _clean_patch(model, data.get('patch'), allowed)
+        if error:
+            return error
+        with transaction.atomic():
+            provider_ids = set(target.values_list(provider_field, flat=True).distinct())
+            updated = target.update(**patch)
+        note_catalog_change(request, model, provider_ids)
+        return Response({'updated': updated, 'fields': sorted(patch)})
+
+    with transaction.atomic():
+        provider_ids = set(target.values_list(provider_field, flat=True).distinct())
+        deleted, per_model = target.delete()
+    note_catalog_change(request, model, provider_ids)
+    return Response({'deleted': per_model.get(model._meta.label, 0), 'total_deleted': deleted})
+
+
+@api_view(['POST', 'PATCH', 'DELETE'])
+@permission_classes([IsAdminUser])
+@invalidates_catalog
+def admin_games_bulk(request):
+    """Create games in batch, or update/delete every game matching ids or GameFilter params."""
+    if request.method != 'POST':
+        return _bulk_update_or_delete(request, Game, GameFilter, GAME_PATCH_FIELDS)
+
+    items = request.data.get('games')
+    if not isinstance(items, list) or not items:
+        return Response(
+            {'detail': 'No games provided.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    provider_ids = []
+    for item in items:
+        try:
+            provider_ids.append(int(item.get('provider')))
+        except (AttributeError, TypeError, ValueError):
+            provider_ids.append(None)
+    existing_ids = set(
+        Provider.objects.filter(pk__in={pk for pk in provider_ids if pk is not None})
+        .values_list('pk', flat=True)
+    )
+
+    games = []
+    errors = {}
+    for index, (item, provider_id) in enumerate(zip(items, provider_ids)):
+        if not isinstance(item, dict):
+            errors[str(index)] = {'non_field_errors': ['Expected an object.']}
+            continue
+        values, item_errors = _clean_batch_game(item)
+        if provider_id is None:
+            item_errors['provider'] = ['A valid integer is required.']
+        elif provider_id not in existing_ids:
+            item_errors['provider'] = ['Provider not found.']
+        if item_errors:
+            errors[str(index)] = item_errors
+            continue
+        games.append(Game(provider_id=provider_id, source='manual', **values))
+
+    if errors:
+        return Response(
+            {'detail': 'Invalid games.', 'errors': errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    with transaction.atomic():
+        created = Game.objects.bulk_create(games, batch_size=1000)
+    note_catalog_change(request, Game, {g.provider_id for g in games})
+
+    return Response(
+        {'created': len(created), 'ids': [g.pk for g in created]},
+        status=status.HTTP_201_CREATED
+    )
+
+
+@api_view(['PATCH', 'DELETE'])
+@permission_classes([IsAdminUser])
+@invalidates_catalog
+def admin_providers_bulk(request):
+    """Update or delete every provider matching ids or ProviderFilter params."""
+    return _bulk_update_or_delete(request, Provider, ExactProviderFilter, PROVIDER_PATCH_FIELDS)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ProvidersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'providers'
+
+    def ready(self):
+        from . import auth, availability, search
+        auth.connect_signals()
+        availability.connect_signals()
+        search.connect_signals()
@@ -0,0 +1,47 @@
+"""
+Cached authentication lookups.
+
+Every authenticated request resolves ``request.user`` from the session's user
+id. The default ModelBackend does that with a SELECT on ``auth_user``; this
+backend keeps the user object in the cache and drops it whenever the user row
+is saved or deleted (which includes password changes and last_login updates).
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+USER_CACHE_TIMEOUT = getattr(settings, 'USER_CACHE_TIMEOUT', 300)
+
+
+def _cache():
+    return caches[settings.SESSION_CACHE_ALIAS]
+
+
+def _user_key(user_id) -> str:
+    return f'auth:user:{user_id}'
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose get_user() is served from the cache when possible."""
+
+    def get_user(self, user_id):
+        key = _user_key(user_id)
+        user = _cache().get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            if user is None:
+                return None
+            _cache().set(key, user, USER_CACHE_TIMEOUT)
+        return user if self.user_can_authenticate(user) else None
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    _cache().delete(_user_key(instance.pk))
+
+
+def connect_signals():
+    user_model = get_user_model()
+    post_save.connect(invalidate_cached_user, sender=user_model, dispatch_uid='auth_user_cache_save')
+    post_delete.connect(invalidate_cached_user, sender=user_model, dispatch_uid='auth_user_cache_delete')
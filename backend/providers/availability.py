@@ -0,0 +1,193 @@
+"""
+Precomputed provider availability per country x currency.
+
+``/api/availability/`` answers "which providers can a player in country X
+use with currency Y" from the Availability table in one indexed lookup,
+instead of joining providers, currencies, restrictions and games per request.
+
+A provider is available for (country, currency) when it is ACTIVE, is not
+RESTRICTED in the country (by its ISO2 or ISO3 code), and supports the
+currency: fiat through its currency list or ``currency_mode == ALL_FIAT``,
+crypto through its crypto list. ``game_count`` counts their enabled games.
+
+Countries are keyed by ISO2 (ISO3 when a country has no ISO2); restriction
+codes with no Country row are included as-is.
+
+The table is refreshed after every catalog write (``catalog_changed``, sent
+by ``bump_catalog_version``) once the writing transaction commits, and by
+the ``refresh_availability`` command. A refresh recounts the enabled games
+of the providers the write touched only (kept in ProviderGameCount),
+recomputes the combinations from the provider, currency and restriction
+tables, and writes just the rows whose value changed.
+"""
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count
+
+from .bulk import rebuild_lock
+from .cache import catalog_changed
+from .models import (
+    Availability,
+    Country,
+    CryptoCurrency,
+    FiatCurrency,
+    Game,
+    Provider,
+    ProviderGameCount,
+    Restriction,
+)
+
+logger = logging.getLogger(__name__)
+
+# Writes that can change availability; a Country edit rebuilds everything
+AFFECTING_MODELS = (Provider, Game, FiatCurrency, CryptoCurrency, Restriction)
+ROW_FIELDS = ('currency_type', 'provider_ids', 'provider_count', 'game_count')
+
+
+def _count_games(provider_ids=None) -> dict[int, int]:
+    """Enabled games per provider, for ``provider_ids`` (None: all)."""
+    games = Game.objects.filter(enabled=True)
+    if provider_ids is not None:
+        games = games.filter(provider_id__in=provider_ids)
+    return dict(
+        games.values('provider_id').annotate(n=Count('pk')).order_by()
+        .values_list('provider_id', 'n')
+    )
+
+
+def compute_availability(game_counts=None) -> list[Availability]:
+    """
+    Availability rows for the current catalog (unsaved), skipping empty combinations.
+
+    ``game_counts`` ({provider_id: enabled games}) defaults to counting every game.
+    """
+    providers = dict(
+        Provider.objects.filter(status=Provider.Status.ACTIVE).values_list('pk', 'currency_mode')
+    )
+    games = _count_games() if game_counts is None else game_counts
+
+    def by_code(queryset, field):
+        rows = defaultdict(set)
+        for provider_id, code in queryset.values_list('provider_id', field):
+            if provider_id in providers:
+                rows[code].add(provider_id)
+        return rows
+
+    all_fiat = {pk for pk, mode in providers.items() if mode == Provider.CurrencyMode.ALL_FIAT}
+    fiat = by_code(FiatCurrency.objects.all(), 'currency_code')
+    crypto = by_code(CryptoCurrency.objects.all(), 'currency_code')
+    restricted = by_code(
+        Restriction.objects.filter(restriction_type=Restriction.RestrictionType.RESTRICTED),
+        'country_code',
+    )
+
+    currencies = {code: (Availability.CurrencyType.FIAT, ids | all_fiat) for code, ids in fiat.items()}
+    for code, ids in crypto.items():
+        # A code listed as both is crypto, as in the filter options
+        fiat_ids = currencies.get(code, (None, set()))[1]
+        currencies[code] = (Availability.CurrencyType.CRYPTO, ids | fiat_ids)
+
+    countries = {}
+    for iso3, iso2 in Country.objects.values_list('iso3', 'iso2'):
+        countries[iso2 or iso3] = {iso3, iso2} - {None}
+    known = set().union(*countries.values())
+    for code in Restriction.objects.values_list('country_code', flat=True).distinct().order_by():
+        if code not in known:
+            countries[code] = {code}
+
+    rows = []
+    for country, codes in countries.items():
+        blocked = set().union(*(restricted.get(code, ()) for code in codes))
+        for currency, (currency_type, supported) in currencies.items():
+            ids = sorted(supported - blocked)
+            if ids:
+                rows.append(Availability(
+                    country_code=country,
+                    currency_code=currency,
+                    currency_type=currency_type,
+                    provider_ids=ids,
+                    provider_count=len(ids),
+                    game_count=sum(games.get(pk, 0) for pk in ids),
+                ))
+    return rows
+
+
+def _update_game_counts(provider_ids=None) -> dict[int, int]:
+    """Recount ``provider_ids``' enabled games (None: all); returns every provider's count."""
+    fresh = _count_games(provider_ids)
+    stored = ProviderGameCount.objects.all()
+    if provider_ids is not None:
+        stored = stored.filter(provider_id__in=provider_ids)
+    old = dict(stored.values_list('provider_id', 'enabled_games'))
+
+    ProviderGameCount.objects.bulk_create(
+        [ProviderGameCount(provider_id=pk, enabled_games=n) for pk, n in fresh.items() if old.get(pk) != n],
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=['provider'],
+        update_fields=['enabled_games'],
+    )
+    gone = old.keys() - fresh.keys()
+    if gone:
+        ProviderGameCount.objects.filter(provider_id__in=gone).delete()
+    return dict(ProviderGameCount.objects.values_list('provider_id', 'enabled_games'))
+
+
+def refresh_availability(provider_ids=None) -> int:
+    """
+    Bring the Availability table up to date; returns the number of rows written.
+
+    ``provider_ids`` are the providers whose games changed (None: recount all).
+    Only rows whose value differs are upserted and only vanished combinations
+    deleted. Concurrent refreshes are serialized by ``rebuild_lock``.
+    """
+    with transaction.atomic():
+        rebuild_lock(Availability)
+        rows = compute_availability(_update_game_counts(provider_ids))
+        current = {
+            (country, currency): (pk, values)
+            for pk, country, currency, *values in Availability.objects.values_list(
+                'pk', 'country_code', 'currency_code', *ROW_FIELDS
+            )
+        }
+        changed = []
+        for row in rows:
+            key = (row.country_code, row.currency_code)
+            values = [getattr(row, field) for field in ROW_FIELDS]
+            if current.pop(key, (None, None))[1] != values:
+                changed.append(row)
+        Availability.objects.bulk_create(
+            changed,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['country_code', 'currency_code'],
+            update_fields=list(ROW_FIELDS),
+        )
+        # Combinations left over have no available provider any more
+        if current:
+            Availability.objects.filter(pk__in=[pk for pk, _ in current.values()]).delete()
+    return len(changed) + len(current)
+
+
+def _refresh(provider_ids):
+    try:
+        refresh_availability(provider_ids)
+    except Exception:
+        # The write that triggered it has committed; don't fail its response
+        logger.exception('Availability refresh failed; run manage.py refresh_availability')
+
+
+def _schedule_refresh(changes=None, **kwargs):
+    if changes is None or Country in changes:
+        provider_ids = None
+    else:
+        provider_ids = set().union(*(changes.get(model, ()) for model in AFFECTING_MODELS))
+        if not provider_ids:
+            return
+    transaction.on_commit(lambda: _refresh(provider_ids))
+
+
+def connect_signals():
+    catalog_changed.connect(_schedule_refresh, dispatch_uid='availability_refresh')
@@ -0,0 +1,175 @@
+"""
+Bulk-load helpers for Game Providers Platform.
+
+Large writes (API sync, SQLite migration, admin import) skip model
+instantiation and stream plain row tuples straight to the database:
+
+- PostgreSQL: ``COPY <table> (<columns>) FROM STDIN`` (text format)
+- Other backends: batched ``executemany`` INSERTs
+
+Signals and ``save()`` are not called, so only use this for plain data rows.
+
+``rebuild_lock`` serializes rebuilds of derived tables (availability, search
+documents) that run concurrently in several workers.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+
+from django.db import connections, router
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def bulk_load(
+    model,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    using: str | None = None,
+) -> int:
+    """
+    Insert ``rows`` (tuples ordered like ``columns``) into ``model``'s table.
+
+    ``columns`` are field names or attnames (e.g. ``provider_id``). Values are
+    prepared with each field's ``get_db_prep_save`` so Decimals, booleans and
+    dates behave exactly as they would through the ORM.
+
+    Returns the number of rows written. Callers own the transaction.
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    fields = [model._meta.get_field(name) for name in columns]
+    prepared = _prepare_rows(fields, rows, connection)
+
+    if connection.vendor == 'postgresql':
+        return _copy_rows(model, fields, prepared, connection)
+    return _insert_rows(model, fields, prepared, connection, batch_size)
+
+
+def _prepare_rows(fields, rows, connection) -> Iterator[tuple]:
+    """Convert python values to DB-ready values, one row at a time."""
+    preps = [field.get_db_prep_save for field in fields]
+    for row in rows:
+        yield tuple(
+            prep(value, connection=connection) if value is not None else None
+            for prep, value in zip(preps, row)
+        )
+
+
+def _column_list(fields, connection) -> str:
+    quote = connection.ops.quote_name
+    return ', '.join(quote(field.column) for field in fields)
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL COPY
+# ---------------------------------------------------------------------------
+
+_COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def _copy_value(value) -> str:
+    """Encode a single value for COPY text format."""
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _copy_line(row) -> str:
+    return '\t'.join(_copy_value(v) for v in row) + '\n'
+
+
+class _CopyStream:
+    """Minimal file-like object feeding COPY text lines to psycopg2."""
+
+    def __init__(self, rows: Iterator[tuple]):
+        self._rows = rows
+        self._buffer = ''
+        self.count = 0
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                row = next(self._rows)
+            except StopIteration:
+                break
+            self._buffer += _copy_line(row)
+            self.count += 1
+        if size < 0:
+            chunk, self._buffer = self._buffer, ''
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def _copy_rows(model, fields, rows, connection) -> int:
+    """Stream rows through COPY FROM STDIN (psycopg2 or psycopg 3)."""
+    sql = 'COPY {} ({}) FROM STDIN'.format(
+        connection.ops.quote_name(model._meta.db_table),
+        _column_list(fields, connection),
+    )
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        if hasattr(raw, 'copy_expert'):
+            stream = _CopyStream(rows)
+            raw.copy_expert(sql, stream, size=65536)
+            return stream.count
+
+        count = 0
+        with raw.copy(sql) as copy:
+            for row in rows:
+                copy.write(_copy_line(row))
+                count += 1
+        return count
+
+
+# ---------------------------------------------------------------------------
+# Generic fallback
+# ---------------------------------------------------------------------------
+
+def _insert_rows(model, fields, rows, connection, batch_size: int) -> int:
+    """Insert rows with batched executemany on non-Postgres backends."""
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        connection.ops.quote_name(model._meta.db_table),
+        _column_list(fields, connection),
+        ', '.join(['%s'] * len(fields)),
+    )
+    count = 0
+    with connection.cursor() as cursor:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            cursor.executemany(sql, batch)
+            count += len(batch)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Derived table rebuilds
+# ---------------------------------------------------------------------------
+
+def rebuild_lock(model, using: str | None = None):
+    """
+    Block until no other transaction is rebuilding ``model``'s table.
+
+    A PostgreSQL transaction-level advisory lock, released at commit or
+    rollback, so call it inside ``transaction.atomic()`` before reading.
+    SQLite serializes writers itself; other backends are not locked.
+    """
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_xact_lock(hashtext(%s))', [model._meta.db_table])
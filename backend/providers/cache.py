@@ -0,0 +1,239 @@
+"""
+Catalog version stamp and API response cache.
+
+Every write to catalog data (providers, games, currencies, restrictions)
+bumps a version stamp held in the cache. Cached API responses are keyed by
+that version, so a write makes all of them miss at once without tracking
+individual keys. Write paths call ``bump_catalog_version()`` directly or use
+the ``invalidates_catalog`` decorator; bulk ORM operations don't send
+model signals, so there are no model signal handlers. Derived tables that
+must follow catalog writes listen to ``catalog_changed`` instead, which the
+bump sends (see availability.py, search.py). It carries ``changes``: the
+models written and the providers they belong to, when the write path
+recorded them (``note_catalog_change``), else None, meaning anything may
+have changed.
+
+Cached responses store the rendered body plus precompressed variants for
+each supported encoding, so hits are served without recompressing.
+
+``CatalogSnapshot`` holds per-process data derived from the catalog (see
+reference.py, facets.py), rebuilt when the version changes.
+
+Both rely on every process seeing the same version stamp, so production
+needs a shared cache (Redis or a file cache). With a per-process memory cache
+a worker only sees its own writes: the others keep serving cached responses
+and snapshots until they expire. Response caching is therefore turned off
+when the cache is per-process and there are several workers (``CACHE_SHARED``).
+
+Settings:
+    API_CACHE_TIMEOUT: seconds to keep cached responses (0 disables caching)
+    CACHE_SHARED: False when several workers each have their own memory cache
+"""
+import hashlib
+import logging
+import threading
+import time
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.dispatch import Signal
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import urlencode
+from rest_framework.permissions import SAFE_METHODS
+
+from . import compression, prometheus
+
+CATALOG_VERSION_KEY = 'catalog:version'
+
+logger = logging.getLogger(__name__)
+
+# Sent after every catalog version bump
+catalog_changed = Signal()
+
+
+def catalog_version() -> int:
+    """Current catalog version (initialised on first use or after eviction)."""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+async def acatalog_version() -> int:
+    version = await cache.aget(CATALOG_VERSION_KEY)
+    if version is None:
+        await cache.aadd(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version(changes=None):
+    """
+    Invalidate everything derived from catalog data.
+
+    ``changes`` ({model: provider ids}) lets ``catalog_changed`` listeners
+    update only what the write touched; None means anything may have changed.
+    """
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+    catalog_changed.send(sender=None, changes=changes)
+
+
+def note_catalog_change(request, model, provider_ids):
+    """Record that ``request`` wrote ``model`` rows of ``provider_ids`` (see invalidates_catalog)."""
+    changes = request.__dict__.setdefault('catalog_changes', {})
+    changes.setdefault(model, set()).update(provider_ids)
+
+
+def invalidates_catalog(view):
+    """
+    Bump the catalog version after a successful unsafe request to ``view``.
+
+    Passes on the changes the view recorded with ``note_catalog_change``; a
+    view that records none is treated as having changed anything.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = view(request, *args, **kwargs)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            bump_catalog_version(request.__dict__.get('catalog_changes'))
+        return response
+    return wrapper
+
+
+class CatalogSnapshot:
+    """
+    Per-process value built by ``load()`` and rebuilt when the catalog version changes.
+
+    Also rebuilt after ``max_age`` seconds, which bounds staleness where the
+    version stamp is not shared between processes (per-process memory caches).
+    A current snapshot costs one cache read and no queries.
+    """
+
+    def __init__(self, load, max_age=300):
+        self.load = load
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._state = None  # (version, loaded_at, value)
+
+    def get(self):
+        version = catalog_version()
+        state = self._state
+        if not self._is_current(state, version):
+            state = self._reload(version)
+        return state[2]
+
+    async def aget(self):
+        version = await acatalog_version()
+        state = self._state
+        if not self._is_current(state, version):
+            state = await sync_to_async(self._reload)(version)
+        return state[2]
+
+    def _is_current(self, state, version) -> bool:
+        return (
+            state is not None and state[0] == version
+            and time.monotonic() - state[1] < self.max_age
+        )
+
+    def _reload(self, version):
+        with self._lock:
+            # Another thread may have rebuilt it while this one waited
+            if not self._is_current(self._state, version):
+                self._state = (version, time.monotonic(), self.load())
+            return self._state
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+_warned_unshared = False
+
+
+def response_cache_timeout() -> int:
+    """
+    ``API_CACHE_TIMEOUT``, or 0 when the cache is per-process and there are several workers.
+
+    Another worker's writes would not reach this one's cached responses until
+    they expired, so serving them would mean serving stale data.
+    """
+    global _warned_unshared
+    timeout = getattr(settings, 'API_CACHE_TIMEOUT', 0)
+    if timeout and not getattr(settings, 'CACHE_SHARED', True):
+        if not _warned_unshared:
+            _warned_unshared = True
+            logger.warning(
+                'API response caching is disabled: WEB_CONCURRENCY=%s with a per-process cache. '
+                'Set REDIS_URL or CACHE_DIR to share the cache between workers.',
+                settings.WEB_CONCURRENCY,
+            )
+        return 0
+    return timeout
+
+
+def _response_key(request, version) -> str:
+    # Host is part of the key: pagination links are absolute URLs
+    query = urlencode(sorted(request.GET.lists()), doseq=True)
+    url = f'{request.scheme}://{request.get_host()}{request.path}?{query}'
+    return f'api:{version}:{hashlib.md5(url.encode()).hexdigest()}'
+
+
+def _build_entry(response) -> dict:
+    content = response.content
+    encoded = {}
+    if len(content) >= compression.min_size():
+        for encoding in compression.ENCODINGS:
+            compressed = compression.compress(content, encoding)
+            if len(compressed) < len(content):
+                encoded[encoding] = compressed
+    return {
+        'content': content,
+        'content_type': response['Content-Type'],
+        'encoded': encoded,
+    }
+
+
+def _entry_response(request, entry) -> HttpResponse:
+    encoding = compression.negotiate(request)
+    if encoding in entry['encoded']:
+        response = HttpResponse(entry['encoded'][encoding], content_type=entry['content_type'])
+        response['Content-Encoding'] = encoding
+    else:
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+    if entry['encoded']:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def cached_response(view):
+    """
+    Cache an async view's 200 responses per URL and catalog version.
+
+    Other statuses and streaming responses are returned uncached.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        timeout = response_cache_timeout()
+        if not timeout:
+            return await view(request, *args, **kwargs)
+
+        key = _response_key(request, await acatalog_version())
+        entry = await cache.aget(key)
+        prometheus.inc(
+            'api_cache_requests_total', view=view.__name__, result='miss' if entry is None else 'hit',
+        )
+        if entry is None:
+            response = await view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            entry = _build_entry(response)
+            await cache.aset(key, entry, timeout)
+        return _entry_response(request, entry)
+    return wrapper
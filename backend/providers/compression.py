@@ -0,0 +1,106 @@
+"""
+Response compression helpers (gzip, plus brotli when installed).
+
+Used by CompressionMiddleware for live responses and by the API response
+cache, which stores precompressed bodies so cache hits skip compression.
+
+Brotli is optional: ``pip install brotli`` to enable ``br``.
+"""
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+from django.conf import settings
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+# Preference order when the client accepts several
+ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+COMPRESSIBLE_TYPES = (
+    'application/json',
+    'application/javascript',
+    'text/',
+)
+
+# gzip filename padding against BREACH-style length oracles (as GZipMiddleware)
+MAX_RANDOM_BYTES = 100
+
+
+def min_size() -> int:
+    """Smallest body (bytes) worth compressing; ``COMPRESSION_MIN_SIZE`` setting."""
+    return getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+
+
+def is_compressible(response) -> bool:
+    content_type = response.get('Content-Type', '')
+    return (
+        not response.has_header('Content-Encoding')
+        and content_type.startswith(COMPRESSIBLE_TYPES)
+    )
+
+
+def negotiate(request) -> str | None:
+    """Pick the preferred encoding the client accepts (``q=0`` means refused)."""
+    accepted = set()
+    for part in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        name, _, params = part.strip().partition(';')
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    for encoding in ENCODINGS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    return compress_string(data, max_random_bytes=MAX_RANDOM_BYTES)
+
+
+class StreamCompressor:
+    """Incremental compressor: one compressed stream across all chunks."""
+
+    def __init__(self, encoding: str):
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=5)
+            self._process = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._process = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def process(self, chunk: bytes) -> bytes:
+        return self._process(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def compress_stream(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    compressor = StreamCompressor(encoding)
+    for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_stream(chunks: AsyncIterable[bytes], encoding: str) -> AsyncIterator[bytes]:
+    compressor = StreamCompressor(encoding)
+    async for chunk in chunks:
+        data = compressor.process(chunk)
+        if data:
+            yield data
+    yield compressor.finish()
@@ -0,0 +1,139 @@
+"""
+Per-process bitmap index of provider facets.
+
+Maps each value of the ProviderFilter facets (game type, fiat and crypto
+currency, restricted country) and of provider status to a bitset of the
+providers that have it, so any combination of facet filters is answered with
+bitwise AND/OR/NOT instead of joins. The result is a list of provider ids for a single ``pk__in``.
+
+Bitsets are Python ints; bit ``i`` stands for ``FacetIndex.ids[i]``. The
+index is rebuilt after a catalog write (see ``CatalogSnapshot`` in cache.py).
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+
+from .cache import CatalogSnapshot
+from .models import CryptoCurrency, FiatCurrency, Game, Provider, Restriction
+
+# Indexed facets; the regulated_country filter reads restricted_country
+FACETS = ('status', 'game_type', 'fiat_currency', 'crypto_currency', 'restricted_country')
+# ProviderFilter params answered from the index, with the facet each reads
+FILTERS = {
+    'game_type': 'game_type',
+    'fiat_currency': 'fiat_currency',
+    'crypto_currency': 'crypto_currency',
+    'restricted_country': 'restricted_country',
+    'regulated_country': 'restricted_country',
+}
+
+
+@dataclass(frozen=True)
+class FacetIndex:
+    """Bitsets of provider ids per facet value."""
+
+    ids: tuple            # provider ids by bit position
+    everyone: int         # bitset of all providers
+    values: dict          # facet -> value -> bitset
+
+    def any_of(self, facet: str, values) -> int:
+        """Providers having at least one of ``values`` for ``facet``."""
+        bits = self.values[facet]
+        mask = 0
+        for value in values:
+            mask |= bits.get(value, 0)
+        return mask
+
+    def match(self, game_type=(), fiat_currency=(), crypto_currency=(),
+              restricted_country=(), regulated_country=()) -> int:
+        """
+        Bitset for a ProviderFilter facet combination.
+
+        Each facet matches any of its values; facets are ANDed. Regulated
+        countries match providers *not* restricted in any of them.
+        """
+        mask = self.everyone
+        if game_type:
+            mask &= self.any_of('game_type', game_type)
+        if fiat_currency:
+            mask &= self.any_of('fiat_currency', fiat_currency)
+        if crypto_currency:
+            mask &= self.any_of('crypto_currency', crypto_currency)
+        if restricted_country:
+            mask &= self.any_of('restricted_country', restricted_country)
+        if regulated_country:
+            mask &= ~self.any_of('restricted_country', regulated_country)
+        return mask
+
+    def counts(self, base: int, params: dict) -> dict:
+        """
+        Provider count per value of every facet filter, within ``base``.
+
+        Counts are disjunctive: each filter's counts apply all of ``params``
+        except that filter's own values, so they show what selecting another
+        value of it would return. Regulated counts are providers *not*
+        restricted in the country.
+        """
+        own = {name: self.match(**{name: values}) for name, values in params.items()}
+        result = {}
+        for name, facet in FILTERS.items():
+            mask = base
+            for other, bits in own.items():
+                if other != name:
+                    mask &= bits
+            values = self.values[facet]
+            if name == 'regulated_country':
+                result[name] = {value: (mask & ~values[value]).bit_count() for value in sorted(values)}
+            else:
+                result[name] = {value: (mask & values[value]).bit_count() for value in sorted(values)}
+        return result
+
+    def bits_of(self, provider_ids) -> int:
+        """Bitset of ``provider_ids`` (ids not in the index are ignored)."""
+        position = {pk: i for i, pk in enumerate(self.ids)}
+        mask = 0
+        for pk in provider_ids:
+            if pk in position:
+                mask |= 1 << position[pk]
+        return mask
+
+    def provider_ids(self, mask: int) -> list[int]:
+        """Provider ids in ``mask``, ascending."""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self.ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
+
+
+def _load() -> FacetIndex:
+    providers = list(Provider.objects.order_by('pk').values_list('pk', 'status'))
+    ids = tuple(pk for pk, _ in providers)
+    bit = {pk: 1 << position for position, pk in enumerate(ids)}
+    values = {facet: defaultdict(int) for facet in FACETS}
+
+    def add(facet, rows):
+        bits = values[facet]
+        for provider_id, value in rows:
+            # Rows written after the provider list was read are left out
+            bits[value] |= bit.get(provider_id, 0)
+
+    add('status', providers)
+    add('game_type', Game.objects.exclude(game_type__isnull=True).exclude(game_type='')
+        .values_list('provider_id', 'game_type').distinct().order_by())
+    add('fiat_currency', FiatCurrency.objects.values_list('provider_id', 'currency_code'))
+    add('crypto_currency', CryptoCurrency.objects.values_list('provider_id', 'currency_code'))
+    add('restricted_country', Restriction.objects.filter(
+        restriction_type=Restriction.RestrictionType.RESTRICTED,
+    ).values_list('provider_id', 'country_code'))
+
+    return FacetIndex(
+        ids=ids,
+        everyone=(1 << len(ids)) - 1,
+        values={facet: dict(bits) for facet, bits in values.items()},
+    )
+
+
+_snapshot = CatalogSnapshot(_load)
+get = _snapshot.get
+aget = _snapshot.aget
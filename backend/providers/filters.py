@@ -6,11 +6,28 @@ Uses django_filters.FilterSet for query param filtering.
 import django_filters
 from django.db.models import Q
 
-from .models import Game, Provider
+from . import facets, search
+from .models import Game, Provider, Restriction
+
+# ProviderFilter params answered from the facet index (facets.py)
+FACET_FILTERS = tuple(facets.FILTERS)
+
+
+def _split(value) -> list[str]:
+    """Comma-separated filter value as a list of non-empty, stripped items."""
+    return [v.strip() for v in (value or '').split(',') if v.strip()]
 
 
 class ProviderFilter(django_filters.FilterSet):
-    """Filter for providers list endpoint."""
+    """
+    Filter for providers list endpoint.
+
+    The facet filters (FACET_FILTERS) are combined on the per-process bitmap
+    index and applied as a single ``pk__in``; their ``filter_*`` methods are
+    the SQL equivalent, used when ``use_facet_index`` is False.
+    """
+
+    use_facet_index = True
 
     search = django_filters.CharFilter(method='filter_search')
     game_type = django_filters.CharFilter(method='filter_game_type')
@@ -24,11 +41,50 @@ class ProviderFilter(django_filters.FilterSet):
         model = Provider
         fields = ['status', 'currency_mode']
 
+    def filter_queryset(self, queryset):
+        if not self.use_facet_index:
+            return super().filter_queryset(queryset)
+        params = self._facet_params()
+        if params:
+            index = facets.get()
+            queryset = queryset.filter(pk__in=index.provider_ids(index.match(**params)))
+        return self._filter_non_facets(queryset)
+
+    def facet_counts(self) -> dict:
+        """
+        Provider count per facet value under the current filters (see FacetIndex.counts).
+
+        Other filters (status, currency_mode, search) narrow the counted set
+        with one id query when set; the facets come from the index.
+        """
+        index = facets.get()
+        base = index.everyone
+        if any(value not in (None, '') for name, value in self.form.cleaned_data.items()
+               if name not in FACET_FILTERS):
+            ids = self._filter_non_facets(self.queryset).values_list('pk', flat=True)
+            base = index.bits_of(ids)
+        return index.counts(base, self._facet_params())
+
+    def _facet_params(self) -> dict:
+        params = {name: _split(self.form.cleaned_data.get(name)) for name in FACET_FILTERS}
+        return {name: values for name, values in params.items() if values}
+
+    def _filter_non_facets(self, queryset):
+        for name, value in self.form.cleaned_data.items():
+            if name not in FACET_FILTERS:
+                queryset = self.filters[name].filter(queryset, value)
+        return queryset
+
     def filter_search(self, queryset, name, value):
-        """Case-insensitive search by provider name."""
+        """
+        Search provider names, and game titles, vendors and themes through the
+        provider search document (search.py); annotates ``search_rank``.
+        """
         if not value:
             return queryset
-        return queryset.filter(provider_name__icontains=value)
+        return queryset.filter(
+            Q(provider_name__icontains=value) | search.match(value, prefix='search_document__')
+        ).annotate(search_rank=search.rank(value, prefix='search_document__'))
 
     def filter_game_type(self, queryset, name, value):
         """Filter providers that have games of the specified types (comma-separated)."""
@@ -80,10 +136,57 @@ class ProviderFilter(django_filters.FilterSet):
         codes = [c.strip() for c in value.split(',') if c.strip()]
         if not codes:
             return queryset
-        return queryset.exclude(
-            restrictions__country_code__in=codes,
-            restrictions__restriction_type='RESTRICTED'
-        )
+        # A subquery, so code and type must match on the same restriction row
+        return queryset.exclude(pk__in=Restriction.objects.filter(
+            country_code__in=codes,
+            restriction_type='RESTRICTED'
+        ).values('provider_id'))
+
+
+class ExactProviderFilter(ProviderFilter):
+    """
+    ProviderFilter evaluated in SQL, for writes that must not act on a stale
+    index. ``search`` matches provider names only, not the search document.
+    """
+
+    use_facet_index = False
+
+    def filter_search(self, queryset, name, value):
+        """Case-insensitive search by provider name."""
+        if not value:
+            return queryset
+        return queryset.filter(provider_name__icontains=value)
+
+
+def indexed_provider_ids(params, names=FACET_FILTERS) -> list[int] | None:
+    """
+    Ids of providers matching the facet filters ``names`` and ``status`` in
+    ``params`` (a QueryDict), from the facet index; None when none is set.
+    """
+    facet_params = {name: _split(params.get(name)) for name in names}
+    facet_params = {name: values for name, values in facet_params.items() if values}
+    statuses = _split(params.get('status'))
+    if not facet_params and not statuses:
+        return None
+    index = facets.get()
+    mask = index.match(**facet_params)
+    if statuses:
+        mask &= index.any_of('status', statuses)
+    return index.provider_ids(mask)
+
+
+def applied_filters(filterset) -> list[str]:
+    """
+    Names of the filters that narrow a validated ``filterset``.
+
+    Empty values are skipped, and so are ProviderFilter facet lists holding
+    only separators (``","``), which the ``filter_*`` methods drop as well.
+    """
+    facet_names = FACET_FILTERS if isinstance(filterset, ProviderFilter) else ()
+    return [
+        name for name, value in filterset.form.cleaned_data.items()
+        if (_split(value) if name in facet_names else value not in (None, ''))
+    ]
 
 
 class GameFilter(django_filters.FilterSet):
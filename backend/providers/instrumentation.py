@@ -0,0 +1,84 @@
+"""
+Per-request instrumentation.
+
+RequestMetricsMiddleware puts a RequestMetrics object in a context variable
+for the duration of each request. Context variables follow the request into
+``sync_to_async`` threads, so the same object collects:
+
+- SQL count and time, via a query wrapper installed on every DB connection
+- named spans (``serialize``, ``render``) timed with ``span()``
+
+Views time their serialization with ``with span('serialize'):``; the JSON
+renderer times ``render`` itself.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+_current: ContextVar['RequestMetrics | None'] = ContextVar('request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Counters for one request."""
+
+    def __init__(self, request_id: str | None):
+        self.request_id = request_id
+        self.start = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.spans = defaultdict(float)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+
+def current() -> RequestMetrics | None:
+    return _current.get()
+
+
+def activate(metrics: RequestMetrics):
+    """Make ``metrics`` current; returns a token for ``deactivate``."""
+    return _current.set(metrics)
+
+
+def deactivate(token):
+    _current.reset(token)
+
+
+@contextmanager
+def span(name: str):
+    """Add the wall time of the block to the current request's ``name`` span."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.spans[name] += time.perf_counter() - start
+
+
+def record_query(execute, sql, params, many, context):
+    """Connection execute wrapper counting queries for the current request."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_time += time.perf_counter() - start
+
+
+def install_query_recorder(sender=None, connection=None, **kwargs):
+    """``connection_created`` receiver; also called for already-open connections."""
+    targets = [connection] if connection is not None else connections.all(initialized_only=True)
+    for conn in targets:
+        if record_query not in conn.execute_wrappers:
+            conn.execute_wrappers.append(record_query)
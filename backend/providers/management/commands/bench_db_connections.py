@@ -0,0 +1,108 @@
+"""
+Management command to benchmark per-request database connection overhead.
+
+Runs the same cheap endpoint through the full WSGI handler (so Django's
+request_started/request_finished connection handling applies) once with a
+new connection per request (CONN_MAX_AGE=0) and once with the configured
+connection settings (persistent or pooled). The response cache is off for the
+run, so every request reaches the database.
+
+Usage:
+    docker compose exec backend python manage.py bench_db_connections --requests 200
+"""
+import statistics
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory, override_settings
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-request latency with and without persistent DB connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per mode (default: 200)',
+        )
+        parser.add_argument(
+            '--path',
+            default='/api/stats/',
+            help='Endpoint to request (default: /api/stats/)',
+        )
+
+    def handle(self, *args, **options):
+        self.handler = WSGIHandler()
+        self.path = options['path']
+        hosts = [h for h in settings.ALLOWED_HOSTS if h != '*' and not h.startswith('.')]
+        self.factory = RequestFactory(HTTP_HOST=hosts[0] if hosts else 'localhost')
+
+        db = connections['default']
+        configured_age = db.settings_dict['CONN_MAX_AGE']
+        pooled = bool(db.settings_dict.get('OPTIONS', {}).get('pool'))
+
+        self.stdout.write(f'Endpoint: {self.path}  Requests per mode: {options["requests"]}')
+        self.stdout.write(f'Backend: {db.vendor}  Configured: ' + (
+            'psycopg pool' if pooled else f'CONN_MAX_AGE={configured_age}'
+        ))
+        self.stdout.write('')
+
+        results = []
+        # Cache hits would skip the database, which is what is being measured
+        with override_settings(API_CACHE_TIMEOUT=0):
+            try:
+                if not pooled:
+                    db.settings_dict['CONN_MAX_AGE'] = 0
+                    results.append(('new connection per request', self._run(options['requests'])))
+                    db.settings_dict['CONN_MAX_AGE'] = configured_age
+                results.append(('configured', self._run(options['requests'])))
+            finally:
+                db.settings_dict['CONN_MAX_AGE'] = configured_age
+                db.close()
+
+        self.stdout.write(f"{'MODE':<28} {'MEAN ms':>8} {'P50 ms':>8} {'P95 ms':>8} {'CONNECTS':>9}")
+        for label, (timings, connects) in results:
+            timings.sort()
+            p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+            self.stdout.write(
+                f'{label:<28} {statistics.mean(timings):8.2f} '
+                f'{statistics.median(timings):8.2f} {p95:8.2f} {connects:9d}'
+            )
+
+        if len(results) == 2:
+            baseline = statistics.mean(results[0][1][0])
+            configured = statistics.mean(results[1][1][0])
+            self.stdout.write('')
+            self.stdout.write(self.style.SUCCESS(
+                f'Saved {baseline - configured:.2f} ms per request '
+                f'({(1 - configured / baseline) * 100:.0f}%)'
+            ))
+
+    def _run(self, count: int) -> tuple[list[float], int]:
+        """Issue ``count`` requests; return latencies (ms) and connections opened."""
+        connects = 0
+
+        def on_connect(sender, **kwargs):
+            nonlocal connects
+            connects += 1
+
+        connections['default'].close()
+        connection_created.connect(on_connect)
+        timings = []
+        try:
+            for _ in range(count):
+                environ = self.factory.get(self.path).environ
+                start = time.perf_counter()
+                response = self.handler(environ, lambda status, headers: None)
+                b''.join(response)
+                response.close()  # fires request_finished -> close_old_connections
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            connection_created.disconnect(on_connect)
+        return timings, connects
@@ -0,0 +1,296 @@
+"""
+Management command to load-test the public and admin GET endpoints.
+
+Each endpoint gets ``--requests`` requests from ``--concurrency`` threads,
+either in-process through the Django test client (default) or over HTTP
+against a running server (``--url``, e.g. a local gunicorn). Results are
+written as JSON so runs on different commits can be compared:
+
+    {"meta": {...}, "endpoints": {"<name>": {"throughput_rps": ..., "p50_ms": ...,
+                                             "p95_ms": ..., "p99_ms": ..., "errors": ...}}}
+
+Admin endpoints run as the first superuser in-process, or as
+``--username``/``--password`` over HTTP; they are skipped otherwise. Write
+endpoints are not benchmarked. Seed data first with ``seed_catalog``.
+
+Usage:
+    docker compose exec backend python manage.py bench_endpoints --output bench.json
+    docker compose exec backend python manage.py bench_endpoints --url http://localhost:9000 \\
+        --username admin --password secret --concurrency 16 --output bench.json
+    docker compose exec backend python manage.py bench_endpoints --compare bench-main.json
+"""
+import json
+import statistics
+import subprocess
+import threading
+import time
+import warnings
+from pathlib import Path
+
+import requests
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.utils import timezone
+
+from providers.models import Game, Provider
+
+# (name, path, admin). {provider} is the largest provider, {game} one of its games.
+ENDPOINTS = [
+    ('stats', '/api/stats/', False),
+    ('filters', '/api/filters/', False),
+    ('providers', '/api/providers/', False),
+    ('providers_filtered', '/api/providers/?status=ACTIVE&game_type=slots&ordering=-game_count', False),
+    ('provider_detail', '/api/providers/{provider}/', False),
+    ('provider_games', '/api/providers/{provider}/games/', False),
+    ('provider_games_large_page', '/api/providers/{provider}/games/?page_size=100&ordering=-rtp', False),
+    ('provider_games_search', '/api/providers/{provider}/games/?search=gold', False),
+    ('games', '/api/games/?ordering=-rtp', False),
+    ('games_filtered', '/api/games/?game_type=slots&rtp_min=96&status=ACTIVE&fiat_currency=EUR', False),
+    ('provider_search', '/api/search/?q=diamond dragon', False),
+    ('availability', '/api/availability/?country=DE&currency=EUR', False),
+    ('providers_export', '/api/providers/export/', False),
+    ('provider_games_export', '/api/providers/{provider}/games/export/', False),
+    ('admin_stats', '/api/admin/stats/', True),
+    ('admin_providers', '/api/admin/providers/', True),
+    ('admin_provider_detail', '/api/admin/providers/{provider}/', True),
+    ('admin_games', '/api/admin/games/?provider={provider}', True),
+    ('admin_game_detail', '/api/admin/games/{game}/', True),
+    ('admin_provider_currencies', '/api/admin/providers/{provider}/currencies/', True),
+    ('admin_provider_restrictions', '/api/admin/providers/{provider}/restrictions/', True),
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark endpoint throughput and p50/p95/p99 latency under concurrency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint (default: 200)')
+        parser.add_argument('--concurrency', type=int, default=8, help='Concurrent clients (default: 8)')
+        parser.add_argument('--warmup', type=int, default=5, help='Untimed requests per endpoint (default: 5)')
+        parser.add_argument('--url', help='Benchmark a running server instead of the in-process test client')
+        parser.add_argument('--username', help='Superuser for admin endpoints with --url')
+        parser.add_argument('--password', help='Password for --username')
+        parser.add_argument('--only', help='Comma-separated endpoint names to run')
+        parser.add_argument(
+            '--cold',
+            action='store_true',
+            help='Disable the API response cache (in-process only)',
+        )
+        parser.add_argument('--output', help='Write results as JSON to this file')
+        parser.add_argument('--compare', help='Print the change against an earlier --output file')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be at least 1.')
+        baseline = self._load(options['compare']) if options['compare'] else None
+
+        provider = Provider.objects.annotate(n=Count('games')).order_by('-n', 'pk').first()
+        if provider is None:
+            raise CommandError('No providers to benchmark; run seed_catalog first.')
+        game = Game.objects.filter(provider=provider).order_by('pk').first()
+        params = {'provider': provider.pk, 'game': game.pk if game else 0}
+
+        # The test client drains async CSV streams synchronously; that is expected here
+        warnings.filterwarnings('ignore', message='StreamingHttpResponse must consume')
+
+        self.url = options['url'].rstrip('/') if options['url'] else None
+        self.admin = self._admin(options)
+        endpoints = self._select(options['only'])
+
+        cache_timeout = 0 if options['cold'] else settings.API_CACHE_TIMEOUT
+        self.stdout.write(
+            f"{'in-process' if not self.url else self.url}  concurrency={options['concurrency']}  "
+            f"requests={options['requests']}  largest provider={provider.pk} ({provider.n} games)"
+        )
+        results = {}
+        with override_settings(API_CACHE_TIMEOUT=cache_timeout):
+            for name, path, admin in endpoints:
+                if admin and self.admin is None:
+                    continue
+                url = path.format(**params)
+                results[name] = self._bench(url, admin, options)
+                self._print(name, results[name], (baseline or {}).get(name))
+
+        report = {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'commit': self._commit(),
+                'target': self.url or 'in-process',
+                'database': connections['default'].vendor,
+                'concurrency': options['concurrency'],
+                'requests': options['requests'],
+                'api_cache_timeout': cache_timeout,
+                'catalog': {
+                    'providers': Provider.objects.count(),
+                    'games': Game.objects.count(),
+                    'largest_provider_games': provider.n,
+                },
+            },
+            'endpoints': results,
+        }
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(report, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+    # -----------------------------------------------------------------------
+    # Running
+    # -----------------------------------------------------------------------
+
+    def _bench(self, url: str, admin: bool, options) -> dict:
+        """Run one endpoint; returns throughput and latency percentiles."""
+        remaining = options['requests']
+        lock = threading.Lock()
+        # Workers warm up, then all start timing together
+        ready = threading.Barrier(options['concurrency'] + 1)
+        timings = []
+        errors = []
+
+        def take() -> bool:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                return remaining >= 0
+
+        def worker():
+            try:
+                fetch = self._client(admin)
+                for _ in range(-(-options['warmup'] // options['concurrency'])):
+                    fetch(url)
+            except Exception as exc:
+                with lock:
+                    errors.append(repr(exc))
+                connections.close_all()
+                return
+            finally:
+                ready.wait()
+            try:
+                while take():
+                    start = time.perf_counter()
+                    try:
+                        status = fetch(url)
+                    except Exception as exc:
+                        status = repr(exc)
+                    elapsed = (time.perf_counter() - start) * 1000
+                    with lock:
+                        timings.append(elapsed)
+                        if not isinstance(status, int) or status >= 400:
+                            errors.append(status)
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(options['concurrency'])]
+        for thread in threads:
+            thread.start()
+        ready.wait()
+        wall = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - wall
+
+        if not timings:
+            raise CommandError(f'{url}: no successful requests ({errors[0] if errors else "no workers"})')
+        timings.sort()
+        cuts = statistics.quantiles(timings, n=100, method='inclusive') if len(timings) > 1 else timings * 99
+        return {
+            'path': url,
+            'requests': len(timings),
+            'errors': len(errors),
+            'first_error': str(errors[0]) if errors else None,
+            'throughput_rps': round(len(timings) / wall, 1),
+            'mean_ms': round(statistics.mean(timings), 2),
+            'p50_ms': round(cuts[49], 2),
+            'p95_ms': round(cuts[94], 2),
+            'p99_ms': round(cuts[98], 2),
+            'max_ms': round(timings[-1], 2),
+        }
+
+    def _client(self, admin: bool):
+        """Return ``fetch(url) -> status`` for one worker thread."""
+        if self.url:
+            session = requests.Session()
+            if admin:
+                session.cookies.update(self.admin)
+
+            def fetch(url):
+                response = session.get(self.url + url, timeout=60)
+                response.content
+                return response.status_code
+            return fetch
+
+        hosts = [h for h in settings.ALLOWED_HOSTS if h != '*' and not h.startswith('.')]
+        client = Client(HTTP_HOST=hosts[0] if hosts else 'localhost')
+        if admin:
+            client.force_login(self.admin)
+
+        def fetch(url):
+            response = client.get(url)
+            if response.streaming:
+                b''.join(response)
+            return response.status_code
+        return fetch
+
+    def _admin(self, options):
+        """Superuser (in-process) or logged-in session cookies (HTTP); None skips admin endpoints."""
+        if not self.url:
+            return User.objects.filter(is_superuser=True, is_active=True).order_by('pk').first()
+        if not options['username']:
+            return None
+        session = requests.Session()
+        session.get(f'{self.url}/api/auth/csrf/', timeout=30)
+        response = session.post(
+            f'{self.url}/api/auth/login/',
+            json={'username': options['username'], 'password': options['password'] or ''},
+            headers={'X-CSRFToken': session.cookies.get('csrftoken', ''), 'Referer': self.url},
+            timeout=30,
+        )
+        if response.status_code != 200:
+            raise CommandError(f'Login failed ({response.status_code}): {response.text[:200]}')
+        return session.cookies.get_dict()
+
+    # -----------------------------------------------------------------------
+    # Reporting
+    # -----------------------------------------------------------------------
+
+    def _select(self, only):
+        if not only:
+            return ENDPOINTS
+        names = {name.strip() for name in only.split(',') if name.strip()}
+        unknown = names - {name for name, _, _ in ENDPOINTS}
+        if unknown:
+            raise CommandError(
+                f'Unknown endpoint(s): {", ".join(sorted(unknown))}. '
+                f'Available: {", ".join(name for name, _, _ in ENDPOINTS)}'
+            )
+        return [endpoint for endpoint in ENDPOINTS if endpoint[0] in names]
+
+    def _load(self, path):
+        try:
+            return json.loads(Path(path).read_text())['endpoints']
+        except (OSError, ValueError, KeyError) as e:
+            raise CommandError(f'Cannot read {path}: {e}')
+
+    def _commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5,
+            ).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    def _print(self, name, result, before):
+        line = (
+            f"{name:<30} {result['throughput_rps']:>8.1f} rps  p50 {result['p50_ms']:>7.2f}  "
+            f"p95 {result['p95_ms']:>7.2f}  p99 {result['p99_ms']:>7.2f} ms"
+        )
+        if result['errors']:
+            line += self.style.ERROR(f"  {result['errors']} errors ({result['first_error']})")
+        if before:
+            change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100 if before['p95_ms'] else 0
+            style = self.style.SUCCESS if change <= 0 else self.style.WARNING
+            line += style(f'  p95 {change:+.0f}% vs {before["p95_ms"]:.2f}')
+        self.stdout.write(line)
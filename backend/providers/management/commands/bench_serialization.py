@@ -0,0 +1,111 @@
+"""
+Management command to benchmark the list-endpoint JSON fast path.
+
+Times one page of games (and of providers) two ways and checks that both
+produce identical bytes:
+
+- stock: ModelSerializer over model instances + DRF JSONRenderer
+- fast:  values_list() rows + RowSerializer + ORJSONRenderer
+
+Usage:
+    docker compose exec backend python manage.py bench_serialization --page-size 1000
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from rest_framework.renderers import JSONRenderer
+
+from providers.models import Game, Provider
+from providers.renderers import ORJSONRenderer
+from providers.serializers import GameSerializer, ProviderListSerializer, RowSerializer
+
+
+class Command(BaseCommand):
+    help = 'Benchmark ModelSerializer + JSONRenderer against the values_list/orjson fast path'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            default=1000,
+            help='Rows per page (default: 1000)',
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Timed runs per path (default: 20)',
+        )
+
+    def handle(self, *args, **options):
+        size = options['page_size']
+        repeat = options['repeat']
+
+        provider = (
+            Provider.objects.annotate(n=Count('games')).order_by('-n').first()
+        )
+        if provider is None or provider.n == 0:
+            raise CommandError('No games to benchmark; sync or seed the catalog first.')
+
+        games = Game.objects.filter(provider=provider).order_by('game_title')[:size]
+        game_rows = RowSerializer(GameSerializer, computed=['provider_name'])
+
+        def games_stock():
+            data = GameSerializer(games.select_related('provider'), many=True).data
+            return JSONRenderer().render(data)
+
+        def games_fast():
+            data = game_rows.serialize(
+                games.values_list(*game_rows.columns),
+                provider_name=provider.provider_name,
+            )
+            return ORJSONRenderer().render(data)
+
+        providers = Provider.objects.with_game_count_subquery().order_by('provider_name', 'id')[:size]
+        provider_rows = RowSerializer(ProviderListSerializer, computed=['supported_game_types'])
+
+        def providers_stock():
+            page = Provider.objects.attach_game_types(providers)
+            return JSONRenderer().render(ProviderListSerializer(page, many=True).data)
+
+        def providers_fast():
+            rows = list(providers.values_list(*provider_rows.columns))
+            id_index = provider_rows.column_names.index('id')
+            types = Provider.objects.game_types_by_provider([row[id_index] for row in rows])
+            data = provider_rows.serialize(
+                rows, supported_game_types=lambda item: types[item['id']],
+            )
+            return ORJSONRenderer().render(data)
+
+        self.stdout.write(
+            f'Games: {min(size, provider.n)} rows from "{provider.provider_name}"; '
+            f'{repeat} runs per path'
+        )
+        self.stdout.write('')
+        self.stdout.write(f"{'ENDPOINT':<12} {'STOCK ms':>9} {'FAST ms':>9} {'SPEEDUP':>8}  BYTES")
+        self._compare('games', games_stock, games_fast, repeat)
+        self._compare('providers', providers_stock, providers_fast, repeat)
+
+    def _compare(self, label, stock, fast, repeat):
+        stock_body, fast_body = stock(), fast()
+        if stock_body != fast_body:
+            raise CommandError(f'{label}: fast path output differs from the serializer output')
+
+        stock_ms = self._time(stock, repeat)
+        fast_ms = self._time(fast, repeat)
+        self.stdout.write(
+            f'{label:<12} {stock_ms:9.2f} {fast_ms:9.2f} {stock_ms / fast_ms:7.1f}x  '
+            f'{len(fast_body)} (identical)'
+        )
+
+    @staticmethod
+    def _time(func, repeat) -> float:
+        """Median wall time of ``func`` in milliseconds."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
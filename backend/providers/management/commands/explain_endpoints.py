@@ -0,0 +1,255 @@
+"""
+Management command to capture query plans for representative filter combinations.
+
+Requests ``/api/providers/`` and ``/api/providers/{id}/games/`` with each
+combination of ProviderFilter / GameFilter params (values picked from the
+current catalog), captures the exact SQL the views run, and EXPLAINs it:
+
+- PostgreSQL: ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)``; flags sequential
+  scans over ``--seq-scan-rows`` rows, sorts and hashes that spill to disk,
+  and row estimates off by more than ``--misestimate`` times
+- other backends: the backend's plain EXPLAIN, with full-table scans flagged
+
+ANALYZE executes the queries, so run it against a replica or a seeded
+database (``seed_catalog``). The response cache is bypassed.
+
+Usage:
+    docker compose exec backend python manage.py explain_endpoints --json plans.json --html plans.html
+"""
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.template.loader import render_to_string
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import urlencode
+
+from providers.models import CryptoCurrency, FiatCurrency, Game, Provider, Restriction
+from providers.pagination import StandardPagination
+
+
+class Command(BaseCommand):
+    help = 'EXPLAIN (ANALYZE, BUFFERS) the provider and game list queries for each filter combination'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--json', help='Write the JSON report to this file')
+        parser.add_argument('--html', help='Write the HTML report to this file')
+        parser.add_argument(
+            '--seq-scan-rows',
+            type=int,
+            default=1000,
+            help='Flag sequential scans reading at least this many rows (default: 1000)',
+        )
+        parser.add_argument(
+            '--misestimate',
+            type=float,
+            default=10,
+            help='Flag nodes whose actual rows differ from the estimate by this factor (default: 10)',
+        )
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.analyze = connection.vendor == 'postgresql'
+        combinations = self._combinations()
+        hosts = [h for h in settings.ALLOWED_HOSTS if h != '*' and not h.startswith('.')]
+        client = Client(HTTP_HOST=hosts[0] if hosts else 'localhost')
+
+        entries = []
+        with override_settings(API_CACHE_TIMEOUT=0):
+            for name, url in combinations:
+                with CaptureQueriesContext(connection) as captured:
+                    response = client.get(url)
+                if response.status_code != 200:
+                    self.stdout.write(self.style.WARNING(f'{name}: HTTP {response.status_code}, skipped'))
+                    continue
+                queries = [
+                    self._explain(query['sql']) for query in captured.captured_queries
+                    if query['sql'].lstrip().upper().startswith('SELECT')
+                ]
+                entries.append({'name': name, 'url': url, 'queries': queries})
+                self._print(name, url, queries)
+
+        report = {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'database': connection.vendor,
+                'analyze': self.analyze,
+                'catalog': {'providers': Provider.objects.count(), 'games': Game.objects.count()},
+                'thresholds': {
+                    'seq_scan_rows': options['seq_scan_rows'],
+                    'misestimate': options['misestimate'],
+                },
+            },
+            'combinations': entries,
+        }
+        if options['json']:
+            Path(options['json']).write_text(json.dumps(report, indent=2, default=str) + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['json']}"))
+        if options['html']:
+            Path(options['html']).write_text(render_to_string('providers/explain_report.html', report))
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['html']}"))
+
+    # -----------------------------------------------------------------------
+    # Filter combinations
+    # -----------------------------------------------------------------------
+
+    def _combinations(self) -> list[tuple[str, str]]:
+        """(name, url) pairs using the most common values in the catalog."""
+        provider = Provider.objects.annotate(n=Count('games')).order_by('-n', 'pk').first()
+        if provider is None:
+            raise CommandError('No providers; sync or seed the catalog first.')
+
+        def common(queryset, field):
+            row = (
+                queryset.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+                .values(field).annotate(n=Count('pk')).order_by('-n').first()
+            )
+            return row[field] if row else None
+
+        game_type = common(Game.objects.all(), 'game_type')
+        fiat = common(FiatCurrency.objects.all(), 'currency_code')
+        crypto = common(CryptoCurrency.objects.all(), 'currency_code')
+        restricted = common(Restriction.objects.filter(restriction_type='RESTRICTED'), 'country_code')
+        volatility = common(Game.objects.filter(provider=provider), 'volatility')
+        word = (provider.provider_name.split() or [''])[0][:4]
+        title = Game.objects.filter(provider=provider).values_list('game_title', flat=True).first() or ''
+        title_word = (title.split() or [''])[0][:4]
+        last_page = max(1, -(-provider.n // StandardPagination.page_size))
+
+        providers = [
+            ('providers: default', {}),
+            ('providers: status', {'status': 'ACTIVE'}),
+            ('providers: search', {'search': word}),
+            ('providers: game_type', {'game_type': game_type}),
+            ('providers: fiat_currency', {'fiat_currency': fiat}),
+            ('providers: crypto_currency', {'crypto_currency': crypto}),
+            ('providers: restricted_country', {'restricted_country': restricted}),
+            ('providers: regulated_country', {'regulated_country': restricted}),
+            ('providers: restricted + fiat + game_type', {
+                'restricted_country': restricted, 'fiat_currency': fiat, 'game_type': game_type,
+            }),
+            ('providers: all filters, by game_count', {
+                'status': 'ACTIVE', 'game_type': game_type, 'fiat_currency': fiat,
+                'crypto_currency': crypto, 'regulated_country': restricted, 'ordering': '-game_count',
+            }),
+        ]
+        games = [
+            ('games: default', {}),
+            ('games: game_type', {'game_type': game_type}),
+            ('games: volatility', {'volatility': volatility}),
+            ('games: rtp range', {'rtp_min': 94, 'rtp_max': 97}),
+            ('games: search', {'search': title_word}),
+            ('games: theme', {'theme': 'fruit'}),
+            ('games: enabled', {'enabled': 'true'}),
+            ('games: all filters', {
+                'game_type': game_type, 'volatility': volatility, 'rtp_min': 94, 'search': title_word,
+            }),
+            ('games: last page', {'page': last_page}),
+        ]
+
+        def url(path, params):
+            params = {k: v for k, v in params.items() if v is not None}
+            return f'{path}?{urlencode(params)}' if params else path
+
+        return (
+            [(name, url('/api/providers/', params)) for name, params in providers]
+            + [(name, url(f'/api/providers/{provider.pk}/games/', params)) for name, params in games]
+        )
+
+    # -----------------------------------------------------------------------
+    # EXPLAIN
+    # -----------------------------------------------------------------------
+
+    def _explain(self, sql: str) -> dict:
+        if self.analyze:
+            prefix = connection.ops.explain_query_prefix(format='json', analyze=True, buffers=True)
+        else:
+            prefix = connection.ops.explain_query_prefix()
+        with connection.cursor() as cursor:
+            cursor.execute(f'{prefix} {sql}')
+            rows = cursor.fetchall()
+
+        if not self.analyze:
+            lines = [str(row[-1]) for row in rows]
+            findings = [
+                {'kind': 'seq_scan', 'detail': line.strip()}
+                for line in lines if ' SCAN ' in f' {line} ' and 'USING' not in line
+            ]
+            return {'sql': sql, 'plan_text': '\n'.join(lines), 'findings': findings}
+
+        result = rows[0][0]
+        result = (json.loads(result) if isinstance(result, str) else result)[0]
+        plan = result['Plan']
+        findings = []
+        lines = []
+        self._walk(plan, 0, findings, lines)
+        return {
+            'sql': sql,
+            'execution_ms': result.get('Execution Time'),
+            'planning_ms': result.get('Planning Time'),
+            'shared_hit_blocks': plan.get('Shared Hit Blocks'),
+            'shared_read_blocks': plan.get('Shared Read Blocks'),
+            'plan_text': '\n'.join(lines),
+            'findings': findings,
+            'plan': plan,
+        }
+
+    def _walk(self, node: dict, depth: int, findings: list, lines: list):
+        """Render ``node`` as an indented line and collect its findings, depth first."""
+        kind = node['Node Type']
+        relation = node.get('Relation Name') or node.get('Index Name') or ''
+        loops = node.get('Actual Loops') or 1
+        estimated = node.get('Plan Rows', 0)
+        actual = node.get('Actual Rows', 0)
+        label = f'{kind} on {relation}' if relation else kind
+
+        lines.append(
+            f"{'  ' * depth}{'-> ' if depth else ''}{label}  "
+            f"(rows est={estimated} actual={actual} loops={loops}, "
+            f"{node.get('Actual Total Time', 0):.2f} ms, "
+            f"buffers hit={node.get('Shared Hit Blocks', 0)} read={node.get('Shared Read Blocks', 0)})"
+        )
+
+        scanned = (actual + node.get('Rows Removed by Filter', 0)) * loops
+        if kind == 'Seq Scan' and scanned >= self.options['seq_scan_rows']:
+            findings.append({
+                'kind': 'seq_scan', 'node': label,
+                'detail': f'read {scanned} rows ({actual * loops} kept)',
+            })
+        if 'external' in node.get('Sort Method', '') or node.get('Sort Space Type') == 'Disk':
+            findings.append({
+                'kind': 'sort_spill', 'node': label,
+                'detail': f"{node.get('Sort Method')} ({node.get('Sort Space Used')} kB)",
+            })
+        if node.get('Hash Batches', 1) > 1:
+            findings.append({
+                'kind': 'hash_spill', 'node': label,
+                'detail': f"{node['Hash Batches']} batches (peak {node.get('Peak Memory Usage')} kB)",
+            })
+        low, high = sorted((estimated, actual))
+        if high >= 100 and high >= self.options['misestimate'] * max(low, 1):
+            findings.append({
+                'kind': 'misestimate', 'node': label,
+                'detail': f'estimated {estimated} rows, got {actual}',
+            })
+
+        for child in node.get('Plans', []):
+            self._walk(child, depth + 1, findings, lines)
+
+    # -----------------------------------------------------------------------
+    # Output
+    # -----------------------------------------------------------------------
+
+    def _print(self, name, url, queries):
+        findings = [f for q in queries for f in q['findings']]
+        total = sum(q.get('execution_ms') or 0 for q in queries)
+        timing = f'{total:8.2f} ms' if self.analyze else ''
+        status = self.style.WARNING(f'{len(findings)} finding(s)') if findings else self.style.SUCCESS('ok')
+        self.stdout.write(f'{name:<45} {len(queries)} queries {timing}  {status}')
+        for finding in findings:
+            self.stdout.write(f"    {finding['kind']}: {finding.get('node', '')} {finding['detail']}")
@@ -10,6 +10,8 @@ from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 
+from providers.bulk import bulk_load
+from providers.cache import bump_catalog_version
 from providers.models import (
     Country,
     CryptoCurrency,
@@ -19,6 +21,14 @@ from providers.models import (
     Restriction,
 )
 
+# Column order of the row tuples streamed by Command._migrate_games
+GAME_COLUMNS = (
+    'provider_id', 'wallet_game_id', 'game_title', 'game_provider', 'vendor',
+    'game_type', 'source', 'game_id', 'title', 'platform', 'subtype',
+    'enabled', 'fun_mode', 'rtp', 'volatility', 'features', 'themes', 'tags',
+    'thumbnail', 'api_provider',
+)
+
 
 class Command(BaseCommand):
     help = 'Migrate data from SQLite database to Postgres'
@@ -74,6 +84,7 @@ class Command(BaseCommand):
             raise CommandError(f'Migration failed: {e}')
         finally:
             conn.close()
+            bump_catalog_version()
 
     def _clear_data(self):
         """Clear all existing data."""
@@ -289,60 +300,41 @@ class Command(BaseCommand):
             'enabled, fun_mode, rtp, volatility, features, themes, tags, '
             'thumbnail, api_provider FROM games'
         )
-        rows = cursor.fetchall()
-
-        inserted = 0
         skipped = 0
-        errors = 0
-        batch = []
-        batch_size = 500
-
-        for row in rows:
-            provider_id = self._provider_id_map.get(row['provider_id'])
-            if not provider_id:
-                skipped += 1
-                continue
-
-            try:
-                game = Game(
-                    provider_id=provider_id,
-                    wallet_game_id=row['wallet_game_id'],
-                    game_title=row['game_title'] or 'Unknown',
-                    game_provider=row['game_provider'],
-                    vendor=row['vendor'],
-                    game_type=row['game_type'],
-                    source=row['source'],
-                    game_id=row['game_id'],
-                    title=row['title'],
-                    platform=row['platform'],
-                    subtype=row['subtype'],
-                    enabled=bool(row['enabled']) if row['enabled'] is not None else True,
-                    fun_mode=bool(row['fun_mode']) if row['fun_mode'] is not None else False,
-                    rtp=row['rtp'],
-                    volatility=row['volatility'],
-                    features=row['features'],
-                    themes=row['themes'],
-                    tags=row['tags'],
-                    thumbnail=row['thumbnail'],
-                    api_provider=row['api_provider'],
-                )
-                batch.append(game)
-
-                if len(batch) >= batch_size:
-                    Game.objects.bulk_create(batch, ignore_conflicts=True)
-                    inserted += len(batch)
-                    self.stdout.write(f'  ... {inserted} games processed')
-                    batch = []
 
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f"  Error: {row['game_title']} - {e}")
+        def game_rows():
+            nonlocal skipped
+            for row in cursor:
+                provider_id = self._provider_id_map.get(row['provider_id'])
+                if not provider_id:
+                    skipped += 1
+                    continue
+
+                yield (
+                    provider_id,
+                    row['wallet_game_id'],
+                    row['game_title'] or 'Unknown',
+                    row['game_provider'],
+                    row['vendor'],
+                    row['game_type'],
+                    row['source'],
+                    row['game_id'],
+                    row['title'],
+                    row['platform'],
+                    row['subtype'],
+                    bool(row['enabled']) if row['enabled'] is not None else True,
+                    bool(row['fun_mode']) if row['fun_mode'] is not None else False,
+                    row['rtp'],
+                    row['volatility'],
+                    row['features'],
+                    row['themes'],
+                    row['tags'],
+                    row['thumbnail'],
+                    row['api_provider'],
                 )
-                errors += 1
 
-        if batch:
-            Game.objects.bulk_create(batch, ignore_conflicts=True)
-            inserted += len(batch)
+        inserted = bulk_load(Game, GAME_COLUMNS, game_rows(), batch_size=2000)
+        errors = 0
 
         self.stdout.write(f'  Games: {inserted} inserted, {skipped} skipped')
         return {'inserted': inserted, 'skipped': skipped, 'errors': errors}
@@ -0,0 +1,25 @@
+"""
+Management command to rebuild the precomputed availability table.
+
+The table is rebuilt automatically after every catalog write; run this after
+migrating to populate it, or to repair it after a failed rebuild.
+
+Usage:
+    docker compose exec backend python manage.py refresh_availability
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from providers.availability import refresh_availability
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the country x currency availability table'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        rows = refresh_availability()
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {rows} availability rows in {time.perf_counter() - start:.2f}s'
+        ))
@@ -0,0 +1,25 @@
+"""
+Management command to rebuild the provider search documents.
+
+The documents are rebuilt automatically after every catalog write; run this
+after migrating to populate them, or to repair them after a failed rebuild.
+
+Usage:
+    docker compose exec backend python manage.py refresh_search_documents
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from providers.search import refresh_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized provider search documents'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        documents = refresh_search_documents()
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote {documents} search documents in {time.perf_counter() - start:.2f}s'
+        ))
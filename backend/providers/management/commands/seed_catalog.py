@@ -0,0 +1,223 @@
+"""
+Management command to generate a realistic synthetic catalog for load testing.
+
+Creates ``--providers`` providers named "Seed Provider NNNN" with
+``--games`` games spread over them with a Zipf-like skew (a few huge
+providers, a long tail of small ones, like the real catalog), plus fiat and
+crypto currencies, country restrictions, themes, features and tags.
+Generation is deterministic for a given ``--random-seed``.
+
+Only seeded providers (and their rows) are touched; ``--clear`` removes the
+previous seed first. Rows are written with COPY on PostgreSQL.
+
+Usage:
+    docker compose exec backend python manage.py seed_catalog --providers 150 --games 20000
+    docker compose exec backend python manage.py seed_catalog --clear --providers 0
+"""
+import json
+import random
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from providers.bulk import bulk_load
+from providers.cache import bump_catalog_version
+from providers.models import (
+    Country,
+    CryptoCurrency,
+    FiatCurrency,
+    Game,
+    Provider,
+    Restriction,
+)
+
+NAME_PREFIX = 'Seed Provider '
+
+COUNTRIES = [
+    ('USA', 'US', 'United States'), ('GBR', 'GB', 'United Kingdom'), ('DEU', 'DE', 'Germany'),
+    ('FRA', 'FR', 'France'), ('ESP', 'ES', 'Spain'), ('ITA', 'IT', 'Italy'),
+    ('NLD', 'NL', 'Netherlands'), ('BEL', 'BE', 'Belgium'), ('SWE', 'SE', 'Sweden'),
+    ('DNK', 'DK', 'Denmark'), ('NOR', 'NO', 'Norway'), ('FIN', 'FI', 'Finland'),
+    ('POL', 'PL', 'Poland'), ('PRT', 'PT', 'Portugal'), ('GRC', 'GR', 'Greece'),
+    ('CHE', 'CH', 'Switzerland'), ('AUT', 'AT', 'Austria'), ('IRL', 'IE', 'Ireland'),
+    ('CAN', 'CA', 'Canada'), ('AUS', 'AU', 'Australia'), ('NZL', 'NZ', 'New Zealand'),
+    ('BRA', 'BR', 'Brazil'), ('MEX', 'MX', 'Mexico'), ('ARG', 'AR', 'Argentina'),
+    ('COL', 'CO', 'Colombia'), ('PER', 'PE', 'Peru'), ('CHL', 'CL', 'Chile'),
+    ('JPN', 'JP', 'Japan'), ('KOR', 'KR', 'South Korea'), ('IND', 'IN', 'India'),
+    ('TUR', 'TR', 'Turkey'), ('ZAF', 'ZA', 'South Africa'), ('NGA', 'NG', 'Nigeria'),
+    ('PHL', 'PH', 'Philippines'), ('SGP', 'SG', 'Singapore'), ('UKR', 'UA', 'Ukraine'),
+    ('ISR', 'IL', 'Israel'), ('ARE', 'AE', 'United Arab Emirates'), ('CZE', 'CZ', 'Czechia'),
+    ('ROU', 'RO', 'Romania'),
+]
+FIAT = [
+    'USD', 'EUR', 'GBP', 'CAD', 'AUD', 'NZD', 'JPY', 'KRW', 'INR', 'BRL', 'MXN', 'ARS',
+    'CLP', 'COP', 'PEN', 'SEK', 'NOK', 'DKK', 'PLN', 'CZK', 'CHF', 'TRY', 'ZAR', 'NGN',
+    'PHP', 'SGD', 'UAH', 'ILS', 'AED', 'RON',
+]
+CRYPTO = ['BTC', 'ETH', 'USDT', 'USDC', 'LTC', 'DOGE', 'TRX', 'XRP', 'BNB', 'SOL', 'ADA', 'BCH']
+# (game_type, weight): slots dominate real catalogs
+GAME_TYPES = [
+    ('slots', 70), ('live', 10), ('table', 8), ('crash', 4), ('instant', 3),
+    ('bingo', 2), ('poker', 2), ('', 1),
+]
+PLATFORMS = ['desktop,mobile', 'mobile', 'desktop']
+VOLATILITIES = ['low', 'medium', 'medium-high', 'high', 'very-high', '']
+THEMES = [
+    'fruit', 'egypt', 'adventure', 'animals', 'asian', 'classic', 'fantasy', 'horror',
+    'irish', 'mythology', 'ocean', 'space', 'sports', 'treasure', 'western', 'christmas',
+]
+FEATURES = [
+    'free-spins', 'multiplier', 'wild', 'sticky-wild', 'bonus-buy', 'cascading',
+    'megaways', 'jackpot', 'respin', 'cluster-pays', 'hold-and-win',
+]
+TAGS = ['new', 'popular', 'exclusive', 'branded', 'hot', 'classic']
+TITLE_WORDS = [
+    'Gold', 'Fortune', 'Dragon', 'Book', 'Wild', 'Lucky', 'Mega', 'Diamond', 'Fire',
+    'Star', 'Queen', 'King', 'Magic', 'Treasure', 'Thunder', 'Moon', 'Sweet', 'Jungle',
+    'Pirate', 'Vegas', 'Rush', 'Legend', 'Crystal', 'Wolf', 'Phoenix', 'Gems',
+]
+GAME_COLUMNS = (
+    'provider_id', 'game_title', 'title', 'game_provider', 'game_type', 'platform', 'rtp',
+    'volatility', 'enabled', 'fun_mode', 'features', 'themes', 'tags', 'thumbnail', 'source',
+)
+
+
+class Command(BaseCommand):
+    help = 'Generate a synthetic catalog (skewed providers, games, currencies, restrictions)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--providers', type=int, default=150, help='Providers to create (default: 150)')
+        parser.add_argument('--games', type=int, default=20000, help='Total games (default: 20000)')
+        parser.add_argument(
+            '--skew',
+            type=float,
+            default=1.1,
+            help='Zipf exponent for games per provider; 0 = even split (default: 1.1)',
+        )
+        parser.add_argument('--random-seed', type=int, default=42, help='Random seed (default: 42)')
+        parser.add_argument('--clear', action='store_true', help='Delete previously seeded providers first')
+
+    def handle(self, *args, **options):
+        provider_count = options['providers']
+        game_count = options['games']
+        if provider_count < 0 or game_count < 0:
+            raise CommandError('--providers and --games must be positive.')
+        if game_count and not provider_count:
+            raise CommandError('Games need at least one provider.')
+        rng = random.Random(options['random_seed'])
+
+        seeded = Provider.objects.filter(provider_name__startswith=NAME_PREFIX)
+        if seeded.exists() and not options['clear'] and provider_count:
+            raise CommandError(
+                f'{seeded.count()} seeded providers already exist; pass --clear to replace them.'
+            )
+
+        with transaction.atomic():
+            if options['clear']:
+                deleted, _ = seeded.delete()
+                self.stdout.write(f'Deleted {deleted} seeded rows')
+            if provider_count:
+                self._seed_countries()
+                stats = self._seed(rng, provider_count, game_count, options['skew'])
+        bump_catalog_version()
+
+        if provider_count:
+            self.stdout.write(self.style.SUCCESS(
+                'Seeded {providers} providers, {games} games (largest provider: {largest}), '
+                '{fiat} fiat / {crypto} crypto currencies, {restrictions} restrictions'.format(**stats)
+            ))
+
+    def _seed_countries(self):
+        Country.objects.bulk_create(
+            [Country(iso3=iso3, iso2=iso2, name=name) for iso3, iso2, name in COUNTRIES],
+            ignore_conflicts=True,
+        )
+
+    def _seed(self, rng, provider_count, game_count, skew) -> dict:
+        now = timezone.now()
+        providers = Provider.objects.bulk_create([
+            Provider(
+                provider_name=f'{NAME_PREFIX}{i:04}',
+                status=Provider.Status.ACTIVE if rng.random() < 0.85 else Provider.Status.DRAFT,
+                currency_mode=(
+                    Provider.CurrencyMode.ALL_FIAT if rng.random() < 0.3 else Provider.CurrencyMode.LIST
+                ),
+                logo_url_dark=f'https://cdn.example.com/logos/seed-{i:04}-dark.svg',
+                logo_url_light=f'https://cdn.example.com/logos/seed-{i:04}-light.svg',
+                last_synced=now - timedelta(hours=rng.randint(1, 24 * 30)) if rng.random() < 0.8 else None,
+                notes='',
+            )
+            for i in range(provider_count)
+        ])
+
+        sizes = self._game_counts(rng, provider_count, game_count, skew)
+        games = bulk_load(Game, GAME_COLUMNS, (
+            self._game_row(rng, provider, n)
+            for provider, size in zip(providers, sizes)
+            for n in range(size)
+        ))
+
+        fiat = bulk_load(FiatCurrency, ('provider_id', 'currency_code', 'display', 'source'), (
+            (provider.pk, code, True, 'seed')
+            for provider in providers
+            if provider.currency_mode == Provider.CurrencyMode.LIST
+            for code in rng.sample(FIAT, rng.randint(3, len(FIAT)))
+        ))
+        crypto = bulk_load(CryptoCurrency, ('provider_id', 'currency_code', 'display', 'source'), (
+            (provider.pk, code, True, 'seed')
+            for provider in providers
+            for code in rng.sample(CRYPTO, rng.randint(0, len(CRYPTO)))
+        ))
+        restrictions = bulk_load(Restriction, ('provider_id', 'country_code', 'restriction_type', 'source'), (
+            (
+                provider.pk, iso2,
+                Restriction.RestrictionType.RESTRICTED if rng.random() < 0.7
+                else Restriction.RestrictionType.REGULATED,
+                'seed',
+            )
+            for provider in providers
+            for _, iso2, _ in rng.sample(COUNTRIES, rng.randint(0, 15))
+        ))
+        return {
+            'providers': len(providers),
+            'games': games,
+            'largest': max(sizes, default=0),
+            'fiat': fiat,
+            'crypto': crypto,
+            'restrictions': restrictions,
+        }
+
+    def _game_counts(self, rng, provider_count, game_count, skew) -> list[int]:
+        """Split ``game_count`` over providers by Zipf weights (shuffled, each >= 1 when possible)."""
+        weights = [1 / (rank + 1) ** skew for rank in range(provider_count)]
+        total = sum(weights)
+        floor = 1 if game_count >= provider_count else 0
+        spare = game_count - floor * provider_count
+        sizes = [floor + int(spare * w / total) for w in weights]
+        for i in range(game_count - sum(sizes)):
+            sizes[i % provider_count] += 1
+        rng.shuffle(sizes)
+        return sizes
+
+    def _game_row(self, rng, provider, n) -> tuple:
+        game_type = rng.choices([t for t, _ in GAME_TYPES], weights=[w for _, w in GAME_TYPES])[0]
+        title = ' '.join(rng.sample(TITLE_WORDS, rng.randint(2, 3)))
+        return (
+            provider.pk,
+            f'{title} {n}',
+            f'{title} {n}',
+            provider.provider_name,
+            game_type,
+            rng.choice(PLATFORMS),
+            round(rng.uniform(88, 98.5), 2) if rng.random() < 0.9 else None,
+            rng.choice(VOLATILITIES),
+            rng.random() < 0.95,
+            rng.random() < 0.6,
+            json.dumps(rng.sample(FEATURES, rng.randint(0, 4))),
+            json.dumps(rng.sample(THEMES, rng.randint(0, 3))),
+            json.dumps(rng.sample(TAGS, rng.randint(0, 2))),
+            f'https://cdn.example.com/games/{provider.pk}/{n}.webp',
+            'seed',
+        )
@@ -8,6 +8,7 @@ Usage:
 """
 import json
 import os
+import time
 from datetime import datetime
 
 import requests
@@ -16,6 +17,9 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.utils import timezone
 
+from providers import prometheus
+from providers.bulk import bulk_load
+from providers.cache import bump_catalog_version
 from providers.models import Game, Provider
 
 
@@ -178,6 +182,13 @@ PROVIDER_MAPPING = {
     "Winspinity": "Winspinity",
 }
 
+# Column order of the row tuples built by Command._game_row
+GAME_COLUMNS = (
+    'provider_id', 'game_id', 'game_title', 'title', 'platform', 'game_type',
+    'subtype', 'enabled', 'fun_mode', 'rtp', 'volatility', 'features',
+    'themes', 'tags', 'thumbnail', 'api_provider', 'source',
+)
+
 
 def normalize_provider_name(api_name: str) -> str:
     """Map API provider name to DB provider name."""
@@ -213,6 +224,7 @@ class Command(BaseCommand):
         self.stdout.write(f"API Base URL: {config['base_url']}")
         self.config = config
 
+        outcome = 'error'
         try:
             api_providers = self._fetch_providers()
             self.stdout.write(f'Found {len(api_providers)} API providers')
@@ -222,10 +234,24 @@ class Command(BaseCommand):
 
             stats = self._sync_providers(db_provider_groups)
             self._print_summary(stats)
+            outcome = 'success'
 
         except requests.RequestException as e:
             self.stdout.write(self.style.ERROR(f'API error: {e}'))
             raise
+        finally:
+            # Providers commit one by one, so even a failed run may have changed data
+            if not self.dry_run:
+                bump_catalog_version()
+                self._record_run(outcome)
+
+    def _record_run(self, outcome: str):
+        """Record the run for /api/admin/metrics/ (flushed now: cron runs exit right after)."""
+        elapsed = (datetime.now() - self.start_time).total_seconds()
+        prometheus.inc('sync_runs_total', outcome=outcome)
+        prometheus.observe('sync_duration_seconds', elapsed)
+        prometheus.set_gauge('sync_last_run_timestamp_seconds', time.time(), outcome=outcome)
+        prometheus.flush()
 
     def _get_api_config(self) -> dict:
         """Get API configuration from environment."""
@@ -346,41 +372,42 @@ class Command(BaseCommand):
         old_count = provider.games.filter(source='api_sync').count()
         provider.games.filter(source='api_sync').delete()
 
-        game_objects = []
-        for g in games:
-            details = g.get('details', {})
-            thumbnails = details.get('thumbnails', {})
-            thumbnail = (
-                thumbnails.get('440x590-jpg') or
-                thumbnails.get('440x590') or
-                thumbnails.get('300x300') or
-                next(iter(thumbnails.values()), None) if thumbnails else None
-            )
-
-            title = g.get('title') or 'Unknown'
-            game_objects.append(Game(
-                provider=provider,
-                game_id=g.get('id'),
-                game_title=title,
-                title=title,
-                platform=g.get('platform'),
-                game_type=g.get('type'),
-                subtype=g.get('subtype'),
-                enabled=g.get('enabled', True),
-                fun_mode=g.get('fun_mode', False),
-                rtp=details.get('rtp'),
-                volatility=details.get('volatility'),
-                features=json.dumps(details.get('features', [])),
-                themes=json.dumps(details.get('themes', [])),
-                tags=json.dumps(details.get('tags', [])),
-                thumbnail=thumbnail,
-                api_provider=g.get('provider'),
-                source='api_sync',
-            ))
-
-        Game.objects.bulk_create(game_objects)
+        rows = (self._game_row(provider.id, g) for g in games)
+        bulk_load(Game, GAME_COLUMNS, rows)
         return {'old_count': old_count, 'new_count': len(games)}
 
+    def _game_row(self, provider_id: int, g: dict) -> tuple:
+        """Build a row tuple (ordered like GAME_COLUMNS) from an API game."""
+        details = g.get('details', {})
+        thumbnails = details.get('thumbnails', {})
+        thumbnail = (
+            thumbnails.get('440x590-jpg') or
+            thumbnails.get('440x590') or
+            thumbnails.get('300x300') or
+            next(iter(thumbnails.values()), None) if thumbnails else None
+        )
+
+        title = g.get('title') or 'Unknown'
+        return (
+            provider_id,
+            g.get('id'),
+            title,
+            title,
+            g.get('platform'),
+            g.get('type'),
+            g.get('subtype'),
+            g.get('enabled', True),
+            g.get('fun_mode', False),
+            details.get('rtp'),
+            details.get('volatility'),
+            json.dumps(details.get('features', [])),
+            json.dumps(details.get('themes', [])),
+            json.dumps(details.get('tags', [])),
+            thumbnail,
+            g.get('provider'),
+            'api_sync',
+        )
+
     def _print_summary(self, stats: dict):
         """Print sync summary."""
         elapsed = datetime.now() - self.start_time
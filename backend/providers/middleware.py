@@ -0,0 +1,219 @@
+"""
+Middleware for Game Providers Platform.
+"""
+import json
+import logging
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.utils.cache import patch_vary_headers
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import compression, instrumentation, prometheus
+
+logger = logging.getLogger('providers.requests')
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that also runs natively under ASGI.
+
+    Stock WhiteNoiseMiddleware is sync-only, which makes Django run every
+    request through a worker thread. The static-file lookup is an in-memory
+    dict hit, so the async path does it inline and awaits the rest of the chain.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with the best encoding the client accepts.
+
+    gzip always, brotli when installed; bodies under ``COMPRESSION_MIN_SIZE``
+    are left alone. Streaming responses (CSV exports) are compressed as one
+    continuous stream rather than chunk by chunk. Responses that already carry
+    a Content-Encoding (e.g. precompressed cache hits) pass through untouched.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if not compression.is_compressible(response):
+            return response
+        if not response.streaming and len(response.content) < compression.min_size():
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = compression.negotiate(request)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = compression.acompress_stream(
+                    response.streaming_content, encoding,
+                )
+            else:
+                response.streaming_content = compression.compress_stream(
+                    response.streaming_content, encoding,
+                )
+            del response.headers['Content-Length']
+        else:
+            compressed = compression.compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # Strong ETags must become weak once the body is re-encoded
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Record SQL count/time, serialize and render time for every request.
+
+    Latency and query counts are always recorded per route for the Prometheus
+    endpoint (providers/prometheus.py).
+
+    With ``REQUEST_METRICS``, also adds a ``Server-Timing`` header and an
+    ``X-Request-ID`` (the incoming one if the client sent it), and logs one JSON
+    line per request to the ``providers.requests`` logger. Requests over
+    ``REQUEST_QUERY_BUDGET`` queries or ``REQUEST_LATENCY_BUDGET_MS`` are logged
+    at WARNING with the exceeded budgets listed.
+
+    For streaming responses the numbers cover the view, not the stream.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.detailed = getattr(settings, 'REQUEST_METRICS', False)
+        self.query_budget = getattr(settings, 'REQUEST_QUERY_BUDGET', 20)
+        self.latency_budget = getattr(settings, 'REQUEST_LATENCY_BUDGET_MS', 500)
+        connection_created.connect(
+            instrumentation.install_query_recorder, dispatch_uid='request_metrics',
+        )
+        instrumentation.install_query_recorder()
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = self._start(request)
+        token = instrumentation.activate(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            instrumentation.deactivate(token)
+        return self._finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = self._start(request)
+        token = instrumentation.activate(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            instrumentation.deactivate(token)
+        return self._finish(request, response, metrics)
+
+    def _start(self, request):
+        if not self.detailed:
+            return instrumentation.RequestMetrics(None)
+        request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex
+        request.request_id = request_id
+        return instrumentation.RequestMetrics(request_id)
+
+    def _finish(self, request, response, metrics):
+        match = getattr(request, 'resolver_match', None)
+        route = match.view_name if match else 'unmatched'
+        prometheus.inc(
+            'http_requests_total', route=route, method=request.method, status=response.status_code,
+        )
+        prometheus.observe('http_request_duration_seconds', metrics.elapsed, route=route)
+        prometheus.observe('http_request_db_queries', metrics.db_queries, route=route)
+        if self.detailed:
+            self._report(request, response, metrics)
+        return response
+
+    def _report(self, request, response, metrics):
+        """Server-Timing and X-Request-ID headers, and the JSON log line."""
+        total_ms = metrics.elapsed * 1000
+        db_ms = metrics.db_time * 1000
+        spans_ms = {name: seconds * 1000 for name, seconds in metrics.spans.items()}
+
+        timing = [f'db;dur={db_ms:.1f};desc="{metrics.db_queries} queries"']
+        timing += [f'{name};dur={ms:.1f}' for name, ms in spans_ms.items()]
+        timing.append(f'total;dur={total_ms:.1f}')
+        response['Server-Timing'] = ', '.join(timing)
+        response['X-Request-ID'] = metrics.request_id
+
+        exceeded = []
+        if metrics.db_queries > self.query_budget:
+            exceeded.append('queries')
+        if total_ms > self.latency_budget:
+            exceeded.append('latency')
+
+        record = {
+            'request_id': metrics.request_id,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round(total_ms, 1),
+            'db_queries': metrics.db_queries,
+            'db_ms': round(db_ms, 1),
+            **{f'{name}_ms': round(ms, 1) for name, ms in spans_ms.items()},
+        }
+        if exceeded:
+            record['budget_exceeded'] = exceeded
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:13
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+# Trigram GIN indexes backing the admin's icontains search on game titles.
+# Django compiles icontains to UPPER(col::text) LIKE UPPER(%s), so the index
+# is built on UPPER(col). PostgreSQL only; other backends skip this step.
+TRIGRAM_INDEXES = {
+    'game_title_trgm_idx': 'game_title',
+    'game_alt_title_trgm_idx': 'title',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON providers_game '
+            f'USING gin ((UPPER({column})) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0003_rename_logo_url_add_light'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['game_title'], name='game_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['game_type'], name='game_type_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
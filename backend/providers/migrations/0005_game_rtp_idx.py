@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0004_game_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['rtp', 'id'], name='game_rtp_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0005_game_rtp_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Availability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('country_code', models.CharField(max_length=10)),
+                ('currency_code', models.CharField(max_length=20)),
+                ('currency_type', models.CharField(choices=[('FIAT', 'Fiat'), ('CRYPTO', 'Crypto')], max_length=10)),
+                ('provider_ids', models.JSONField(default=list)),
+                ('provider_count', models.PositiveIntegerField(default=0)),
+                ('game_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Availability',
+                'ordering': ['country_code', 'currency_code'],
+                'indexes': [models.Index(fields=['currency_code', 'country_code'], name='availability_currency_idx')],
+                'unique_together': {('country_code', 'currency_code')},
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:54
+
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Full-text (tsvector) and trigram GIN indexes for the provider search
+# document. The trigram indexes are on the plain columns, which is what the
+# %> (word similarity) operator uses. PostgreSQL only; other backends skip
+# this step and search with LIKE.
+SEARCH_INDEXES = {
+    'search_vector_idx': 'USING gin (search_vector)',
+    'search_name_trgm_idx': 'USING gin (provider_name gin_trgm_ops)',
+    'search_titles_trgm_idx': 'USING gin (game_titles gin_trgm_ops)',
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, method in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON providers_providersearchdocument {method}'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0006_availability'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderSearchDocument',
+            fields=[
+                ('provider', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='providers.provider')),
+                ('provider_name', models.CharField(max_length=255)),
+                ('game_titles', models.TextField(blank=True, default='')),
+                ('vendors', models.TextField(blank=True, default='')),
+                ('themes', models.TextField(blank=True, default='')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(null=True)),
+            ],
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 01:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('providers', '0007_provider_search_document'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProviderGameCount',
+            fields=[
+                ('provider', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='providers.provider')),
+                ('enabled_games', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+    ]
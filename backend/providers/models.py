@@ -5,9 +5,13 @@ Entity relationship:
 - Provider has many FiatCurrencies, CryptoCurrencies, Restrictions, Games
 - Game belongs to a Provider
 - Country is a reference table for ISO codes
+- Availability is derived: providers per country x currency (see availability.py)
+- ProviderSearchDocument is derived: one search document per provider (see search.py)
 """
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models import Count
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 
 
 class ProviderManager(models.Manager):
@@ -17,6 +21,47 @@ class ProviderManager(models.Manager):
         """Annotate providers with their game count."""
         return self.annotate(game_count=Count('games'))
 
+    def with_game_count_subquery(self):
+        """
+        Annotate game count with a correlated subquery instead of JOIN + GROUP BY.
+
+        Only evaluated for the rows actually returned, and dropped from
+        ``count()`` queries, so paginated lists don't aggregate the whole games table.
+        """
+        games = (
+            Game.objects.filter(provider=OuterRef('pk'))
+            .order_by()
+            .values('provider')
+            .annotate(c=Count('pk'))
+            .values('c')
+        )
+        return self.annotate(
+            game_count=Coalesce(Subquery(games, output_field=IntegerField()), 0)
+        )
+
+    def game_types_by_provider(self, provider_ids) -> dict[int, list[str]]:
+        """Map each provider id to its sorted distinct game types (one query)."""
+        types = {pk: set() for pk in provider_ids}
+        rows = (
+            Game.objects.filter(provider_id__in=types)
+            .exclude(game_type__isnull=True)
+            .exclude(game_type='')
+            .order_by()
+            .values_list('provider_id', 'game_type')
+            .distinct()
+        )
+        for provider_id, game_type in rows:
+            types[provider_id].add(game_type)
+        return {pk: sorted(values) for pk, values in types.items()}
+
+    def attach_game_types(self, providers):
+        """Set ``prefetched_game_types`` on each provider using a single query."""
+        providers = list(providers)
+        types = self.game_types_by_provider([p.pk for p in providers])
+        for provider in providers:
+            provider.prefetched_game_types = types[provider.pk]
+        return providers
+
     def active(self):
         """Return only active providers."""
         return self.filter(status=Provider.Status.ACTIVE)
@@ -98,6 +143,12 @@ class Game(models.Model):
 
     class Meta:
         ordering = ['game_title']
+        indexes = [
+            models.Index(fields=['game_title'], name='game_title_idx'),
+            models.Index(fields=['game_type'], name='game_type_idx'),
+            # Keyset pagination and RTP ranges on /api/games/
+            models.Index(fields=['rtp', 'id'], name='game_rtp_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.game_title
@@ -186,3 +237,80 @@ class Country(models.Model):
 
     def __str__(self) -> str:
         return self.name or self.iso3
+
+
+class Availability(models.Model):
+    """
+    Active providers available in a country for a currency (derived data).
+
+    Rebuilt from the catalog by ``availability.refresh_availability()``;
+    never edited directly. Only combinations with at least one provider are stored.
+    """
+
+    class CurrencyType(models.TextChoices):
+        FIAT = 'FIAT', 'Fiat'
+        CRYPTO = 'CRYPTO', 'Crypto'
+
+    country_code = models.CharField(max_length=10)
+    currency_code = models.CharField(max_length=20)
+    currency_type = models.CharField(max_length=10, choices=CurrencyType.choices)
+    provider_ids = models.JSONField(default=list)
+    provider_count = models.PositiveIntegerField(default=0)
+    game_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['country_code', 'currency_code']
+        ordering = ['country_code', 'currency_code']
+        indexes = [
+            # Currency-only lookups; country lookups use the unique index
+            models.Index(fields=['currency_code', 'country_code'], name='availability_currency_idx'),
+        ]
+        verbose_name_plural = 'Availability'
+
+    def __str__(self) -> str:
+        return f"{self.country_code} / {self.currency_code} ({self.provider_count})"
+
+
+class ProviderGameCount(models.Model):
+    """
+    Enabled games per provider (derived data), the per-provider input to
+    ``Availability.game_count``.
+
+    Kept by ``availability.refresh_availability()`` so a rebuild only counts
+    the games of the providers that changed.
+    """
+
+    provider = models.OneToOneField(
+        Provider,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='+',
+    )
+    enabled_games = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.provider_id}: {self.enabled_games}"
+
+
+class ProviderSearchDocument(models.Model):
+    """
+    Denormalized search text for a provider and its games (derived data).
+
+    Rebuilt from the catalog by ``search.refresh_search_documents()``; never
+    edited directly. ``search_vector`` is only populated on PostgreSQL.
+    """
+
+    provider = models.OneToOneField(
+        Provider,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document',
+    )
+    provider_name = models.CharField(max_length=255)
+    game_titles = models.TextField(blank=True, default='')   # one title per line
+    vendors = models.TextField(blank=True, default='')       # one vendor per line
+    themes = models.TextField(blank=True, default='')        # one theme per line
+    search_vector = SearchVectorField(null=True)
+
+    def __str__(self) -> str:
+        return self.provider_name
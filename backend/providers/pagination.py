@@ -1,4 +1,13 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from django.http import Http404
+from rest_framework.exceptions import ParseError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class StandardPagination(PageNumberPagination):
@@ -7,3 +16,170 @@ class StandardPagination(PageNumberPagination):
     page_size = 24
     page_size_query_param = 'page_size'
     max_page_size = 10000
+
+
+class AdminPagination(StandardPagination):
+    """Pagination for admin tables."""
+
+    page_size = 50
+    max_page_size = 500
+
+
+class AsyncPage:
+    """One page of results for async views, mirroring PageNumberPagination."""
+
+    def __init__(self, request, objects: list, count: int, number: int, page_size: int):
+        self.request = request
+        self.objects = objects
+        self.count = count
+        self.number = number
+        self.page_size = page_size
+
+    def get_next_link(self) -> str | None:
+        if self.number * self.page_size >= self.count:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), 'page', self.number + 1)
+
+    def get_previous_link(self) -> str | None:
+        if self.number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.number == 2:
+            return remove_query_param(url, 'page')
+        return replace_query_param(url, 'page', self.number - 1)
+
+    def envelope(self, results) -> dict:
+        """Response body in the same shape as ``get_paginated_response``."""
+        return {
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': results,
+        }
+
+
+def _page_size(request, paginator) -> int:
+    try:
+        requested = int(request.GET.get(paginator.page_size_query_param, ''))
+        if requested > 0:
+            return min(requested, paginator.max_page_size)
+    except ValueError:
+        pass
+    return paginator.page_size
+
+
+async def apaginate(request, queryset, pagination_class=StandardPagination) -> AsyncPage:
+    """
+    Paginate ``queryset`` with the async ORM (``page`` / ``page_size`` params).
+
+    Raises Http404('Invalid page.') like DRF for out-of-range or bad page numbers.
+    """
+    paginator = pagination_class()
+    page_size = _page_size(request, paginator)
+
+    count = await queryset.acount()
+    page = request.GET.get(paginator.page_query_param, 1)
+    try:
+        number = int(page)
+    except (TypeError, ValueError):
+        raise Http404('Invalid page.')
+    last = max(1, -(-count // page_size))
+    if number < 1 or number > last:
+        raise Http404('Invalid page.')
+
+    offset = (number - 1) * page_size
+    objects = [obj async for obj in queryset[offset:offset + page_size]]
+    return AsyncPage(request, objects, count, number, page_size)
+
+
+# ---------------------------------------------------------------------------
+# Cursor (keyset) pagination
+# ---------------------------------------------------------------------------
+
+class CursorPage:
+    """One keyset page for async views; links to the next page only, no count."""
+
+    def __init__(self, request, objects: list, next_cursor: str | None):
+        self.request = request
+        self.objects = objects
+        self.next_cursor = next_cursor
+
+    def get_next_link(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), 'cursor', self.next_cursor)
+
+    def envelope(self, results) -> dict:
+        return {'next': self.get_next_link(), 'results': results}
+
+
+def _encode_cursor(value, pk) -> str:
+    raw = json.dumps([None if value is None else str(value), pk]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, pk = json.loads(raw)
+        return value, int(pk)
+    except (binascii.Error, ValueError, TypeError):
+        raise ParseError('Invalid cursor.')
+
+
+def _after(field, descending, nullable, value, pk) -> Q:
+    """Rows after (``value``, ``pk``) in (``field``, pk) order, nulls last."""
+    op = 'lt' if descending else 'gt'
+    if value is None:
+        return Q(**{f'{field}__isnull': True, f'pk__{op}': pk})
+    after = Q(**{f'{field}__{op}': value}) | Q(**{field: value, f'pk__{op}': pk})
+    if nullable:
+        after |= Q(**{f'{field}__isnull': True})
+    return after
+
+
+async def acursor_paginate(request, queryset, columns, ordering='pk',
+                           pagination_class=StandardPagination) -> CursorPage:
+    """
+    Keyset-paginate ``queryset.values_list(*columns)`` (``cursor`` / ``page_size`` params).
+
+    ``ordering`` is one field name, optionally prefixed with ``-``; the pk
+    breaks ties. Nulls sort last in both directions. Each page is one query
+    with no OFFSET and no COUNT, so deep pages cost the same as the first.
+
+    Raises ParseError('Invalid cursor.') (400) for a malformed cursor.
+    """
+    page_size = _page_size(request, pagination_class())
+    descending = ordering.startswith('-')
+    field = ordering.lstrip('-')
+    if field in ('pk', 'id'):
+        keys = ['pk']
+        order = ['-pk' if descending else 'pk']
+    else:
+        keys = [field, 'pk']
+        expression = F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True)
+        order = [expression, '-pk' if descending else 'pk']
+
+    cursor = request.GET.get('cursor')
+    if cursor:
+        value, pk = _decode_cursor(cursor)
+        if field in ('pk', 'id'):
+            queryset = queryset.filter(**{f'pk__{"lt" if descending else "gt"}': pk})
+        else:
+            model_field = queryset.model._meta.get_field(field)
+            try:
+                value = None if value is None else model_field.to_python(value)
+            except ValidationError:
+                raise ParseError('Invalid cursor.')
+            queryset = queryset.filter(_after(field, descending, model_field.null, value, pk))
+
+    rows = [
+        row async for row in
+        queryset.order_by(*order).values_list(*columns, *keys)[:page_size + 1]
+    ]
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1][len(columns):]
+        next_cursor = _encode_cursor(None, last[0]) if len(last) == 1 else _encode_cursor(*last)
+    return CursorPage(request, [row[:len(columns)] for row in rows], next_cursor)
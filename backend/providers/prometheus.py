@@ -0,0 +1,252 @@
+"""
+Prometheus metrics for Game Providers Platform (served at /api/admin/metrics/).
+
+Every process keeps its counters and histograms in memory. With METRICS_DIR
+set, a process also writes a snapshot to ``<METRICS_DIR>/<pid>.json`` from a
+background thread every ``FLUSH_INTERVAL`` seconds while it has new values (and
+at exit), so requests never wait on the file. ``render()`` merges the
+snapshots of all gunicorn workers and management commands sharing that
+directory. Without METRICS_DIR the endpoint reports the serving process only.
+
+Merging sums counters and histograms; gauges hold timestamps and take the max.
+
+Settings:
+    METRICS_DIR: directory shared by all processes of one deployment. Empty it
+        on deploy (e.g. a tmpfs), like prometheus_client's multiprocess mode.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+FLUSH_INTERVAL = 5.0
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SYNC_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+
+# name -> (type, help, histogram buckets)
+FAMILIES = {
+    'http_requests_total': (
+        'counter', 'Requests by route, method and status.', None),
+    'http_request_duration_seconds': (
+        'histogram', 'Request latency by route.', LATENCY_BUCKETS),
+    'http_request_db_queries': (
+        'histogram', 'SQL queries per request by route.', QUERY_BUCKETS),
+    'api_cache_requests_total': (
+        'counter', 'Response cache lookups by view and result (hit/miss).', None),
+    'export_bytes_total': (
+        'counter', 'Uncompressed CSV bytes streamed by export.', None),
+    'sync_runs_total': (
+        'counter', 'sync_providers runs by outcome.', None),
+    'sync_duration_seconds': (
+        'histogram', 'sync_providers run time.', SYNC_BUCKETS),
+    'sync_last_run_timestamp_seconds': (
+        'gauge', 'Unix time of the last sync_providers run by outcome.', None),
+}
+
+
+class Registry:
+    """Thread-safe in-memory metric values for one process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (name, labels) -> float, or [bucket counts..., sum] for histograms
+        self._values = {}
+        self._dirty = False
+        self._flusher_pid = None
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+            self._dirty = True
+        self._ensure_flusher()
+
+    def observe(self, name: str, value: float, **labels):
+        buckets = FAMILIES[name][2]
+        key = (name, _label_key(labels))
+        with self._lock:
+            slots = self._values.get(key)
+            if slots is None:
+                slots = self._values[key] = [0] * (len(buckets) + 2)
+            slots[_bucket_index(buckets, value)] += 1
+            slots[-1] += value
+            self._dirty = True
+        self._ensure_flusher()
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._values[(name, _label_key(labels))] = value
+            self._dirty = True
+        self._ensure_flusher()
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [
+                [name, list(labels), list(value) if isinstance(value, list) else value]
+                for (name, labels), value in self._values.items()
+            ]
+
+    def _ensure_flusher(self):
+        # Started lazily, and again in each forked worker (threads don't survive a fork)
+        pid = os.getpid()
+        if self._flusher_pid == pid or not _directory():
+            return
+        with self._lock:
+            if self._flusher_pid == pid:
+                return
+            self._flusher_pid = pid
+        threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True).start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            if self._dirty:
+                try:
+                    self.flush()
+                except OSError:
+                    pass  # retried on the next tick
+
+    def flush(self):
+        """Write this process's snapshot to METRICS_DIR (no-op without it)."""
+        directory = _directory()
+        if not directory:
+            return
+        self._dirty = False
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f'{os.getpid()}.json'
+        tmp = path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp, path)
+
+
+def _directory() -> Path | None:
+    directory = getattr(settings, 'METRICS_DIR', None)
+    return Path(directory) if directory else None
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _bucket_index(buckets, value) -> int:
+    for i, bound in enumerate(buckets):
+        if value <= bound:
+            return i
+    return len(buckets)
+
+
+registry = Registry()
+inc = registry.inc
+observe = registry.observe
+set_gauge = registry.set_gauge
+flush = registry.flush
+atexit.register(flush)
+
+
+# ---------------------------------------------------------------------------
+# Collection and exposition
+# ---------------------------------------------------------------------------
+
+def _merge(merged: dict, snapshot: list):
+    for name, labels, value in snapshot:
+        if name not in FAMILIES:
+            continue
+        key = (name, tuple(tuple(pair) for pair in labels))
+        current = merged.get(key)
+        if current is None:
+            merged[key] = value
+        elif FAMILIES[name][0] == 'gauge':
+            merged[key] = max(current, value)
+        elif isinstance(value, list):
+            merged[key] = [a + b for a, b in zip(current, value)]
+        else:
+            merged[key] = current + value
+
+
+def collect() -> dict:
+    """Metric values summed over every process sharing METRICS_DIR."""
+    merged = {}
+    directory = _directory()
+    own = f'{os.getpid()}.json'
+    if directory and directory.is_dir():
+        for path in directory.glob('*.json'):
+            if path.name == own:
+                continue
+            try:
+                _merge(merged, json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue  # being replaced or truncated; picked up next scrape
+    _merge(merged, registry.snapshot())
+    return merged
+
+
+def _format_labels(labels) -> str:
+    if not labels:
+        return ''
+    pairs = (
+        '{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in labels
+    )
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _family_lines(name, kind, help_text, samples, buckets=None) -> list[str]:
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+    for labels, value in sorted(samples):
+        if kind != 'histogram':
+            lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+            continue
+        cumulative = 0
+        for bound, count in zip((*buckets, '+Inf'), value[:-1]):
+            cumulative += count
+            le = bound if bound == '+Inf' else _format_value(float(bound))
+            lines.append(f'{name}_bucket{_format_labels((*labels, ("le", le)))} {cumulative}')
+        lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(float(value[-1]))}')
+        lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+    return lines
+
+
+def render(gauges: dict | None = None) -> str:
+    """
+    Prometheus text exposition (format 0.0.4) of all metrics.
+
+    ``gauges`` maps extra gauge names to ``(help, value)``; the admin view uses
+    it for values read from the database at scrape time.
+    """
+    merged = collect()
+    by_family = {}
+    for (name, labels), value in merged.items():
+        by_family.setdefault(name, []).append((labels, value))
+
+    lines = []
+    for name, (kind, help_text, buckets) in FAMILIES.items():
+        if name in by_family:
+            lines += _family_lines(name, kind, help_text, by_family[name], buckets)
+
+    cache_ratio = {}
+    for labels, value in by_family.get('api_cache_requests_total', []):
+        view = tuple(pair for pair in labels if pair[0] != 'result')
+        hits, total = cache_ratio.get(view, (0, 0))
+        cache_ratio[view] = (hits + (value if ('result', 'hit') in labels else 0), total + value)
+    if cache_ratio:
+        lines += _family_lines(
+            'api_cache_hit_ratio', 'gauge', 'Response cache hit ratio by view.',
+            [(view, hits / total) for view, (hits, total) in cache_ratio.items() if total],
+        )
+
+    for name, (help_text, value) in (gauges or {}).items():
+        if value is not None:
+            lines += _family_lines(name, 'gauge', help_text, [((), value)])
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,72 @@
+"""
+Per-process reference data: countries and the catalog's code vocabularies.
+
+Filter options, the countries endpoint and restriction rendering resolve
+country names and codes here instead of querying on every request. The data
+is loaded once per process and reloaded after a catalog write (see
+``CatalogSnapshot`` in cache.py).
+"""
+from dataclasses import dataclass
+
+from .cache import CatalogSnapshot
+from .models import Country, CryptoCurrency, FiatCurrency, Game, Restriction
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """Immutable snapshot of the reference tables."""
+
+    countries: list           # {iso3, iso2, name} rows, ordered by name
+    country_names: dict       # iso2 and iso3 code -> name
+    iso2_codes: dict          # iso3 -> iso2, for countries that have one
+    country_options: list     # {code, name} for every restriction code, by name
+    game_types: list
+    fiat_currencies: list     # excludes codes also used as crypto
+    crypto_currencies: list
+
+
+def _load() -> ReferenceData:
+    countries = list(Country.objects.values('iso3', 'iso2', 'name'))
+    names = {}
+    for country in countries:
+        names[country['iso2']] = country['name']
+        names[country['iso3']] = country['name']
+
+    codes = sorted(Restriction.objects.values_list('country_code', flat=True).distinct())
+    crypto = list(
+        CryptoCurrency.objects.values_list('currency_code', flat=True)
+        .distinct()
+        .order_by('currency_code')
+    )
+    crypto_codes = set(crypto)
+    fiat = [
+        code for code in
+        FiatCurrency.objects.values_list('currency_code', flat=True)
+        .distinct()
+        .order_by('currency_code')
+        if code not in crypto_codes
+    ]
+    game_types = list(
+        Game.objects.exclude(game_type__isnull=True)
+        .exclude(game_type='')
+        .values_list('game_type', flat=True)
+        .distinct()
+        .order_by('game_type')
+    )
+    return ReferenceData(
+        countries=countries,
+        country_names=names,
+        iso2_codes={country['iso3']: country['iso2'] for country in countries if country['iso2']},
+        country_options=sorted(
+            [{'code': code, 'name': names.get(code, code)} for code in codes],
+            key=lambda option: option['name'],
+        ),
+        game_types=game_types,
+        fiat_currencies=fiat,
+        crypto_currencies=crypto,
+    )
+
+
+_snapshot = CatalogSnapshot(_load)
+get = _snapshot.get
+aget = _snapshot.aget
@@ -0,0 +1,53 @@
+"""
+orjson-based JSON renderer.
+
+Produces the same bytes as DRF's JSONRenderer for compact, non-ASCII-escaped
+output (the project defaults): same separators, same string escaping, and
+``\\u2028`` / ``\\u2029`` escaped. Anything orjson can't encode natively
+(Decimal, lazy strings, querysets, datetimes) goes through DRF's JSONEncoder.
+Subclasses of str, int, dict and list are converted to the base type first:
+orjson would otherwise read their C storage directly, which renders
+``UserList`` hybrids such as Django's ``ErrorList`` as ``[]``.
+Indented output (browsable API, ``Accept: application/json; indent=4``) falls
+back to the stock renderer.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+from .instrumentation import span
+
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS
+)
+_encoder = encoders.JSONEncoder()
+
+
+def _default(obj):
+    """Encode what orjson passes through: builtin subclasses, then DRF's JSONEncoder."""
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, list):
+        return list(obj)
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Drop-in JSONRenderer that encodes with orjson."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        with span('render'):
+            ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        # Same strict-javascript-subset escaping as JSONRenderer
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
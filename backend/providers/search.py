@@ -0,0 +1,271 @@
+"""
+Provider search documents: each provider's name with its game titles, vendors and themes.
+
+``ProviderSearchDocument`` holds one denormalized row per provider, so a
+search for a game ("Sweet Bonanza") finds its provider in one query instead
+of scanning games. The provider grid's ``search`` filter and ``/api/search/``
+read it.
+
+On PostgreSQL the document has a weighted tsvector (name A, game titles B,
+vendors and themes C) and trigram indexes on the name and titles (migration
+0007). A provider matches on full text or on trigram word similarity, which
+tolerates typos and partial words. It is ranked by ``ts_rank`` plus the name's
+word similarity, so provider-name hits come before game-title hits. Other
+backends fall back to case-insensitive LIKE with a fixed rank per field.
+
+Matching games are highlighted in Python from the document's titles, for the
+returned rows only. After a catalog write (``catalog_changed``) the
+documents of the providers whose name or games changed are rebuilt once the
+writing transaction commits; currency and restriction edits leave them
+alone. ``refresh_search_documents`` rebuilds them all.
+"""
+import json
+import logging
+import re
+from difflib import SequenceMatcher
+
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+from django.db import connection, transaction
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Coalesce
+
+from .bulk import rebuild_lock
+from .cache import catalog_changed
+from .models import Game, Provider, ProviderSearchDocument
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration: titles are names, so no stemming or stop words
+CONFIG = 'simple'
+VECTOR = (
+    SearchVector('provider_name', weight='A', config=CONFIG)
+    + SearchVector('game_titles', weight='B', config=CONFIG)
+    + SearchVector('vendors', 'themes', weight='C', config=CONFIG)
+)
+# Rank per matching field where there is no full-text search
+LIKE_WEIGHTS = {'provider_name': 1.0, 'game_titles': 0.4, 'vendors': 0.2, 'themes': 0.2}
+# Title words at least this similar to a query word are highlighted (typos)
+FUZZY_RATIO = 0.8
+GAME_MATCH_LIMIT = 5
+# Writes that can change a document's text
+AFFECTING_MODELS = (Provider, Game)
+DOCUMENT_FIELDS = ['provider_name', 'game_titles', 'vendors', 'themes']
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def _parse_list(value) -> list[str]:
+    """Themes are stored as a JSON array or comma-separated text."""
+    if not value:
+        return []
+    try:
+        items = json.loads(value)
+    except ValueError:
+        items = value.split(',')
+    if not isinstance(items, list):
+        items = [items]
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def build_documents(provider_ids=None) -> list[ProviderSearchDocument]:
+    """
+    Search documents for ``provider_ids`` (None: every provider), unsaved and
+    without ``search_vector``.
+    """
+    providers = Provider.objects.all()
+    games = Game.objects.all()
+    if provider_ids is not None:
+        providers = providers.filter(pk__in=provider_ids)
+        games = games.filter(provider_id__in=provider_ids)
+    parts = {
+        pk: {'name': name, 'titles': {}, 'vendors': {}, 'themes': {}}
+        for pk, name in providers.values_list('pk', 'provider_name')
+    }
+    games = (
+        games.order_by('provider_id', 'game_title')
+        .values_list('provider_id', 'game_title', 'vendor', 'game_provider', 'themes')
+    )
+    for provider_id, title, vendor, game_provider, themes in games.iterator(chunk_size=5000):
+        part = parts.get(provider_id)
+        if part is None:
+            continue
+        # Dicts keep first-seen order and drop duplicates
+        part['titles'][title] = None
+        for name in (vendor, game_provider):
+            if name:
+                part['vendors'][name] = None
+        for theme in _parse_list(themes):
+            part['themes'][theme] = None
+
+    return [
+        ProviderSearchDocument(
+            provider_id=pk,
+            provider_name=part['name'],
+            game_titles='\n'.join(part['titles']),
+            vendors='\n'.join(part['vendors']),
+            themes='\n'.join(part['themes']),
+        )
+        for pk, part in parts.items()
+    ]
+
+
+def refresh_search_documents(provider_ids=None) -> int:
+    """
+    Rebuild the documents of ``provider_ids`` (None: all); returns the number written.
+
+    Documents are upserted, and concurrent refreshes serialized by
+    ``rebuild_lock``. Deleted providers' documents go with them (cascade).
+    """
+    with transaction.atomic():
+        rebuild_lock(ProviderSearchDocument)
+        documents = build_documents(provider_ids)
+        ProviderSearchDocument.objects.bulk_create(
+            documents,
+            batch_size=100,
+            update_conflicts=True,
+            unique_fields=['provider'],
+            update_fields=DOCUMENT_FIELDS,
+        )
+        if connection.vendor == 'postgresql':
+            written = ProviderSearchDocument.objects.all()
+            if provider_ids is not None:
+                written = written.filter(provider_id__in=provider_ids)
+            written.update(search_vector=VECTOR)
+    return len(documents)
+
+
+def _refresh(provider_ids):
+    try:
+        refresh_search_documents(provider_ids)
+    except Exception:
+        # The write that triggered it has committed; don't fail its response
+        logger.exception('Search document refresh failed; run manage.py refresh_search_documents')
+
+
+def _schedule_refresh(changes=None, **kwargs):
+    if changes is None:
+        provider_ids = None
+    else:
+        provider_ids = set().union(*(changes.get(model, ()) for model in AFFECTING_MODELS))
+        if not provider_ids:
+            return
+    transaction.on_commit(lambda: _refresh(provider_ids))
+
+
+def connect_signals():
+    catalog_changed.connect(_schedule_refresh, dispatch_uid='search_documents_refresh')
+
+
+# ---------------------------------------------------------------------------
+# Querying
+# ---------------------------------------------------------------------------
+
+def _query(term: str) -> SearchQuery:
+    return SearchQuery(term, config=CONFIG, search_type='websearch')
+
+
+def match(term: str, prefix: str = '') -> Q:
+    """
+    Condition for documents matching ``term``.
+
+    ``prefix`` is the path to the document from the queried model, e.g.
+    ``search_document__`` from Provider.
+    """
+    if connection.vendor == 'postgresql':
+        return (
+            Q(**{f'{prefix}search_vector': _query(term)})
+            | Q(TrigramWordSimilar(F(f'{prefix}provider_name'), term))
+            | Q(TrigramWordSimilar(F(f'{prefix}game_titles'), term))
+        )
+    condition = Q()
+    for field in LIKE_WEIGHTS:
+        condition |= Q(**{f'{prefix}{field}__icontains': term})
+    return condition
+
+
+def rank(term: str, prefix: str = ''):
+    """Relevance of a document for ``term`` (higher first; 0 without a document)."""
+    if connection.vendor == 'postgresql':
+        return (
+            Coalesce(SearchRank(F(f'{prefix}search_vector'), _query(term)), 0.0)
+            + Coalesce(TrigramWordSimilarity(term, f'{prefix}provider_name'), 0.0)
+        )
+    score = Value(0.0)
+    for field, weight in LIKE_WEIGHTS.items():
+        score = score + Case(
+            When(**{f'{prefix}{field}__icontains': term}, then=Value(weight)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+    return score
+
+
+def ranked(term: str):
+    """Documents matching ``term``, best first, annotated with ``rank``."""
+    return (
+        ProviderSearchDocument.objects.filter(match(term))
+        .annotate(rank=rank(term))
+        .order_by('-rank', 'provider_name')
+    )
+
+
+# ---------------------------------------------------------------------------
+# Highlighting
+# ---------------------------------------------------------------------------
+
+def terms(text: str) -> list[str]:
+    """Lowercased words of a query."""
+    return re.findall(r'\w+', text.lower())
+
+
+def _word_matches(word: str, term: str, fuzzy: bool) -> bool:
+    if word.startswith(term):
+        return True
+    if not fuzzy:
+        return False
+    matcher = SequenceMatcher(None, word, term)
+    return matcher.real_quick_ratio() >= FUZZY_RATIO and matcher.ratio() >= FUZZY_RATIO
+
+
+def highlight(text: str, words: list[str], fuzzy: bool = False) -> list[list[int]] | None:
+    """
+    ``[start, end)`` ranges of the words of ``text`` that match ``words``, or
+    None unless every query word matches one of them.
+
+    Words match by prefix; with ``fuzzy``, also by similarity (typos).
+    """
+    ranges = []
+    found = set()
+    for token in re.finditer(r'\w+', text):
+        word = token.group().lower()
+        hits = {term for term in words if _word_matches(word, term, fuzzy)}
+        if hits:
+            found |= hits
+            ranges.append([token.start(), token.end()])
+    return ranges if len(found) == len(set(words)) else None
+
+
+def matching_games(game_titles: str, words: list[str], limit=GAME_MATCH_LIMIT) -> tuple[list[dict], int]:
+    """
+    The first ``limit`` titles matching every query word, with highlight
+    ranges, and the number of matching titles.
+
+    Falls back to fuzzy matching when no title matches exactly, which is how
+    trigram-only (misspelt) hits get highlights.
+    """
+    titles = game_titles.split('\n') if game_titles else []
+    for fuzzy in (False, True):
+        games = []
+        count = 0
+        for title in titles:
+            ranges = highlight(title, words, fuzzy)
+            if ranges is not None:
+                count += 1
+                if len(games) < limit:
+                    games.append({'title': title, 'highlights': ranges})
+        if count:
+            break
+    return games, count
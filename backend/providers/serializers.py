@@ -5,9 +5,13 @@ Conventions:
 - ListSerializer: lightweight, for list views
 - DetailSerializer: nested relations, for detail views
 - Always define Meta.fields explicitly
+- RowSerializer: fast path for large lists, same output as a ModelSerializer
 """
+import copy
+
 from rest_framework import serializers
 
+from . import reference
 from .models import (
     Country,
     CryptoCurrency,
@@ -35,11 +39,20 @@ class CryptoCurrencySerializer(serializers.ModelSerializer):
 
 
 class RestrictionSerializer(serializers.ModelSerializer):
-    """Serializer for country restrictions."""
+    """Serializer for country restrictions, with the country name resolved."""
+
+    country_name = serializers.SerializerMethodField()
 
     class Meta:
         model = Restriction
-        fields = ['country_code', 'restriction_type', 'source']
+        fields = ['country_code', 'country_name', 'restriction_type', 'source']
+
+    def get_country_name(self, obj) -> str | None:
+        # Async views pass the reference data in, since it can't be loaded there
+        ref = self.context.get('reference')
+        if ref is None:
+            ref = self.context['reference'] = reference.get()
+        return ref.country_names.get(obj.country_code)
 
 
 class GameSerializer(serializers.ModelSerializer):
@@ -75,6 +88,17 @@ class GameSerializer(serializers.ModelSerializer):
         ]
 
 
+class GameTypesListSerializer(serializers.ListSerializer):
+    """``many=True`` provider serializer: loads game types for the whole list in one query."""
+
+    def to_representation(self, data):
+        providers = list(data.all() if hasattr(data, 'all') else data)
+        missing = [p for p in providers if not hasattr(p, 'prefetched_game_types')]
+        if missing:
+            Provider.objects.attach_game_types(missing)
+        return super().to_representation(providers)
+
+
 class ProviderListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for provider list views."""
 
@@ -83,6 +107,7 @@ class ProviderListSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Provider
+        list_serializer_class = GameTypesListSerializer
         fields = [
             'id',
             'provider_name',
@@ -101,7 +126,25 @@ class ProviderListSerializer(serializers.ModelSerializer):
         return obj.get_supported_game_types()
 
 
-class ProviderDetailSerializer(serializers.ModelSerializer):
+class AdminProviderListSerializer(ProviderListSerializer):
+    """Provider list row for the admin table (adds sync timestamp)."""
+
+    class Meta(ProviderListSerializer.Meta):
+        fields = ProviderListSerializer.Meta.fields + ['last_synced']
+
+
+class DynamicFieldsMixin:
+    """Accept ``fields=[...]`` to serialize only a subset of the declared fields."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ProviderDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """Full serializer for provider detail views with nested data."""
 
     game_count = serializers.IntegerField(read_only=True)
@@ -112,6 +155,7 @@ class ProviderDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Provider
+        list_serializer_class = GameTypesListSerializer
         fields = [
             'id',
             'provider_name',
@@ -131,6 +175,8 @@ class ProviderDetailSerializer(serializers.ModelSerializer):
 
     def get_supported_game_types(self, obj: Provider) -> list[str]:
         """Get distinct game types for this provider."""
+        if hasattr(obj, 'prefetched_game_types'):
+            return obj.prefetched_game_types
         return obj.get_supported_game_types()
 
 
@@ -157,3 +203,85 @@ class CountrySerializer(serializers.ModelSerializer):
     class Meta:
         model = Country
         fields = ['iso3', 'iso2', 'name']
+
+
+class RowSerializer:
+    """
+    Serialize ``values_list()`` rows exactly like ``serializer_class`` would.
+
+    Skips model instantiation and per-field ``to_representation`` calls: only
+    fields whose representation differs from the DB value (decimals, dates)
+    are converted. Dotted sources (``provider.provider_name``) become joined
+    lookups (``provider__provider_name``) unless listed in ``computed``.
+    Computed fields (and method fields, which must be computed) are supplied
+    to ``serialize()`` as a value or a callable taking the row dict.
+
+    Usage:
+        rows = RowSerializer(GameSerializer, computed=['provider_name'])
+        qs.values_list(*rows.columns)
+        rows.serialize(qs, provider_name=provider.provider_name)
+    """
+
+    CONVERTED_FIELDS = (
+        serializers.DecimalField,
+        serializers.DateTimeField,
+        serializers.DateField,
+        serializers.TimeField,
+    )
+
+    def __init__(self, serializer_class, computed=()):
+        self._fields = serializer_class().fields
+        self._all_computed = tuple(computed)
+        self._select(list(self._fields), ())
+
+    def _select(self, names, extra_columns):
+        fields = self._fields
+        self.names = names
+        self.computed = tuple(name for name in self._all_computed if name in names)
+        self.column_names = [name for name in names if name not in self.computed]
+        self.columns = [fields[name].source.replace('.', '__') for name in self.column_names]
+        # Columns read for computed fields but not emitted (values_list() with
+        # no arguments would select everything, so always read at least the pk)
+        hidden = [c for c in extra_columns if c not in self.column_names] or (
+            [] if self.columns else ['pk']
+        )
+        self.column_names += hidden
+        self.columns += hidden
+        self._reorder = bool(self.computed or hidden)
+        self.converters = [
+            (name, fields[name].to_representation)
+            for name in self.column_names
+            if name in fields and isinstance(fields[name], self.CONVERTED_FIELDS)
+        ]
+
+    def only(self, names, extra_columns=()) -> 'RowSerializer':
+        """
+        Copy narrowed to ``names`` (a sparse fieldset), keeping field order.
+
+        ``extra_columns`` are read from the DB for computed fields but not emitted.
+        """
+        clone = copy.copy(self)
+        clone._select([name for name in self.names if name in names], extra_columns)
+        return clone
+
+    def serialize(self, rows, **computed) -> list[dict]:
+        missing = set(self.computed) - set(computed)
+        if missing:
+            raise TypeError(f'Missing computed fields: {", ".join(sorted(missing))}')
+        computed = {name: value for name, value in computed.items() if name in self.computed}
+        names = self.names
+        column_names = self.column_names
+        converters = self.converters
+        reorder = self._reorder
+        data = []
+        for values in rows:
+            item = dict(zip(column_names, values))
+            for name, convert in converters:
+                if item[name] is not None:
+                    item[name] = convert(item[name])
+            for name, value in computed.items():
+                item[name] = value(item) if callable(value) else value
+            if reorder:
+                item = {name: item[name] for name in names}
+            data.append(item)
+        return data
@@ -0,0 +1,24 @@
+"""
+Session engine: cache-first sessions with periodic expired-row cleanup.
+
+Builds on Django's ``cached_db`` engine, so session reads are served from the
+cache and only fall back to ``django_session`` on a miss. Expired rows only
+accumulate when sessions are created, so creation also triggers
+``clear_expired()`` — at most once per ``SESSION_PURGE_INTERVAL`` seconds,
+coordinated through the cache so only one worker does it.
+
+``python manage.py clearsessions`` remains available for cron-based cleanup.
+"""
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.core.cache import caches
+
+SESSION_PURGE_INTERVAL = getattr(settings, 'SESSION_PURGE_INTERVAL', 3600)
+PURGE_KEY = 'sessions:purge'
+
+
+class SessionStore(CachedDBStore):
+    def create(self):
+        super().create()
+        if caches[settings.SESSION_CACHE_ALIAS].add(PURGE_KEY, True, SESSION_PURGE_INTERVAL):
+            self.clear_expired()
@@ -0,0 +1,19 @@
+'use strict';
+{
+    // Reload the changelist when an autocomplete list filter changes.
+    const $ = django.jQuery;
+
+    $(function() {
+        $('.autocomplete-filter select').on('change', function() {
+            const lookup = this.closest('.autocomplete-filter').dataset.lookup;
+            const url = new URL(window.location.href);
+            url.searchParams.delete('p');
+            if (this.value) {
+                url.searchParams.set(lookup, this.value);
+            } else {
+                url.searchParams.delete(lookup);
+            }
+            window.location.href = url.toString();
+        });
+    });
+}
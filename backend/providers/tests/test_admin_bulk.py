@@ -0,0 +1,204 @@
+"""
+Admin bulk endpoints: target selection, patch/delete and batch create.
+
+Run with ``python manage.py test providers``.
+"""
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from providers.models import Country, Game, Provider, Restriction
+
+
+class AdminGamesBulkTests(TestCase):
+    """PATCH/DELETE/POST /api/admin/games/bulk/."""
+
+    url = '/api/admin/games/bulk/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        cls.provider = Provider.objects.create(provider_name='Alpha')
+        Game.objects.bulk_create([
+            Game(provider=cls.provider, game_title=f'Game {n}', game_type='Slots' if n % 2 else 'Live',
+                 volatility='high')
+            for n in range(6)
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def send(self, method, data):
+        return getattr(self.client, method)(self.url, data=data, content_type='application/json')
+
+    def test_unknown_filter_is_rejected(self):
+        response = self.send('delete', {'filters': {'gametype': 'Live'}})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('gametype', response.json()['detail'])
+        self.assertEqual(Game.objects.count(), 6)
+
+    def test_empty_filter_values_are_rejected(self):
+        for filters in ({'game_type': ''}, {'game_type': '', 'search': None}):
+            with self.subTest(filters=filters):
+                response = self.send('delete', {'filters': filters})
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(Game.objects.count(), 6)
+
+    def test_missing_target_is_rejected(self):
+        for data in ({}, {'filters': {}}, {'ids': []}, {'ids': '12'}, {'ids': 12}):
+            with self.subTest(data=data):
+                self.assertEqual(self.send('patch', {**data, 'patch': {'enabled': False}}).status_code, 400)
+        self.assertFalse(Game.objects.filter(enabled=False).exists())
+
+    def test_delete_by_filter(self):
+        response = self.send('delete', {'filters': {'game_type': 'Live'}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['deleted'], 3)
+        self.assertFalse(Game.objects.filter(game_type='Live').exists())
+        self.assertEqual(Game.objects.count(), 3)
+
+    def test_patch_by_ids(self):
+        ids = list(Game.objects.order_by('pk').values_list('pk', flat=True)[:2])
+        response = self.send('patch', {'ids': ids, 'patch': {'volatility': 'low', 'rtp': '95.5'}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'updated': 2, 'fields': ['rtp', 'volatility']})
+        self.assertEqual(set(Game.objects.filter(volatility='low').values_list('pk', flat=True)), set(ids))
+
+    def test_patch_rejects_invalid_values_and_fields(self):
+        self.assertEqual(self.send('patch', {'ids': [1], 'patch': {'rtp': 'abc'}}).status_code, 400)
+        self.assertEqual(self.send('patch', {'ids': [1], 'patch': {'provider': 2}}).status_code, 400)
+
+    def test_batch_create(self):
+        response = self.send('post', {'games': [
+            {'provider': self.provider.pk, 'game_title': 'New', 'rtp': '96.10'},
+            {'provider': self.provider.pk, 'game_title': 'Newer', 'enabled': False},
+        ]})
+        self.assertEqual(response.status_code, 201)
+        created = Game.objects.filter(pk__in=response.json()['ids']).order_by('game_title')
+        self.assertEqual([(g.game_title, g.title, g.enabled) for g in created],
+                         [('New', 'New', True), ('Newer', 'Newer', False)])
+
+    def test_batch_create_reports_errors_per_item(self):
+        response = self.send('post', {'games': [
+            {'provider': self.provider.pk, 'game_title': 'Fine'},
+            {'provider': self.provider.pk, 'game_title': 'Bad RTP', 'rtp': 'abc'},
+            {'provider': self.provider.pk, 'game_title': 'Null enabled', 'enabled': None},
+            {'provider': 0, 'game_title': 'No provider'},
+            {'provider': self.provider.pk},
+            'not an object',
+            {'provider': [1], 'game_title': 'Unhashable provider'},
+            {'provider': 'abc', 'game_title': 'Text provider'},
+        ]})
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['errors']
+        self.assertEqual(sorted(errors), ['1', '2', '3', '4', '5', '6', '7'])
+        self.assertIn('rtp', errors['1'])
+        self.assertIn('enabled', errors['2'])
+        self.assertIn('provider', errors['3'])
+        self.assertIn('game_title', errors['4'])
+        self.assertIn('provider', errors['6'])
+        self.assertIn('provider', errors['7'])
+        self.assertFalse(Game.objects.filter(game_title='Fine').exists())
+
+
+class AdminProvidersBulkTests(TestCase):
+    """PATCH/DELETE /api/admin/providers/bulk/."""
+
+    url = '/api/admin/providers/bulk/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        Provider.objects.bulk_create([
+            Provider(provider_name='Alpha Games', status=Provider.Status.ACTIVE),
+            Provider(provider_name='Beta Games', status=Provider.Status.DRAFT),
+            Provider(provider_name='Gamma', status=Provider.Status.DRAFT),
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def send(self, method, data):
+        return getattr(self.client, method)(self.url, data=data, content_type='application/json')
+
+    def test_unknown_or_empty_filters_are_rejected(self):
+        for filters in ({'state': 'DRAFT'}, {'status': ''}, {'search': ''}, {'fiat_currency': ','},
+                        {'game_type': ' , ', 'regulated_country': ','}):
+            with self.subTest(filters=filters):
+                self.assertEqual(self.send('delete', {'filters': filters}).status_code, 400)
+        self.assertEqual(Provider.objects.count(), 3)
+
+    def test_patch_by_filter(self):
+        response = self.send('patch', {'filters': {'status': 'DRAFT'}, 'patch': {'status': 'ACTIVE'}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['updated'], 2)
+        self.assertEqual(Provider.objects.filter(status='ACTIVE').count(), 3)
+
+    def test_search_matches_provider_names_only(self):
+        response = self.send('delete', {'filters': {'search': 'games'}})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(Provider.objects.values_list('provider_name', flat=True)), ['Gamma'])
+
+
+class AdminBulkRestrictionsTests(TestCase):
+    """POST /api/admin/providers/bulk/restrictions/."""
+
+    url = '/api/admin/providers/bulk/restrictions/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        Country.objects.bulk_create([
+            Country(iso3=iso3, iso2=iso2, name=iso3) for iso3, iso2 in
+            (('DEU', 'DE'), ('FRA', 'FR'), ('GBR', 'GB'), ('MLT', 'MT'), ('USA', 'US'))
+        ])
+        cls.provider = Provider.objects.create(provider_name='Alpha')
+        Restriction.objects.bulk_create([
+            Restriction(provider=cls.provider, country_code='US', restriction_type='RESTRICTED'),
+            Restriction(provider=cls.provider, country_code='FR', restriction_type='RESTRICTED'),
+            Restriction(provider=cls.provider, country_code='GB', restriction_type='REGULATED'),
+            Restriction(provider=cls.provider, country_code='MT', restriction_type='REGULATED'),
+        ])
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_replace_only_touches_the_given_type(self):
+        response = self.client.post(self.url, {
+            'provider_ids': [self.provider.pk], 'mode': 'replace',
+            'restriction_type': 'REGULATED', 'country_codes': 'MT,DE',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual((body['added'], body['removed'], body['skipped']), (1, 1, 1))
+        self.assertEqual(
+            dict(self.provider.restrictions.values_list('country_code', 'restriction_type')),
+            {'US': 'RESTRICTED', 'FR': 'RESTRICTED', 'MT': 'REGULATED', 'DE': 'REGULATED'},
+        )
+
+    def test_codes_are_validated_before_writing(self):
+        cases = (
+            ('/api/admin/providers/bulk/restrictions/', {'country_codes': 'DE,' + 'X' * 11}),
+            ('/api/admin/providers/bulk/restrictions/', {'country_codes': [], 'mode': 'replace'}),
+            ('/api/admin/providers/bulk/restrictions/', {'country_codes': 5}),
+            ('/api/admin/providers/bulk/currencies/', {'currency_codes': 'B' * 11}),
+            ('/api/admin/providers/bulk/currencies/', {'currency_codes': 'B' * 21, 'type': 'crypto'}),
+            (f'/api/admin/providers/{self.provider.pk}/restrictions/', {'country_codes': 'X' * 30}),
+            (f'/api/admin/providers/{self.provider.pk}/currencies/', {'currency_codes': 'X' * 30}),
+        )
+        for url, data in cases:
+            with self.subTest(url=url, data=data):
+                response = self.client.post(
+                    url, {'provider_ids': [self.provider.pk], **data}, content_type='application/json',
+                )
+                self.assertEqual(response.status_code, 400)
+        self.assertIn('X' * 11, self.client.post(
+            self.url, {'provider_ids': [self.provider.pk], 'country_codes': 'X' * 11},
+            content_type='application/json',
+        ).json()['detail'])
+        self.assertEqual(self.provider.restrictions.count(), 4)
+        self.assertFalse(self.provider.fiat_currencies.exists())
+        # Up to the column length is fine: crypto codes may be 20 long
+        response = self.client.post('/api/admin/providers/bulk/currencies/', {
+            'provider_ids': [self.provider.pk], 'currency_codes': 'B' * 20, 'type': 'crypto',
+        }, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
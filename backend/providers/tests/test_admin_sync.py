@@ -0,0 +1,52 @@
+"""
+POST /api/admin/sync/ with the sync_providers command stubbed out (it calls the external API).
+
+Run with ``python manage.py test providers``.
+"""
+import threading
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+
+class AdminSyncTests(TestCase):
+    """The sync runs off the shared sync thread and its summary is parsed."""
+
+    url = '/api/admin/sync/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        cls.user = User.objects.create_user('user', 'user@example.com', 'pw')
+
+    def test_runs_the_command_on_its_own_thread(self):
+        threads = []
+
+        def sync_providers(name, stdout, stderr):
+            threads.append(threading.current_thread())
+            stdout.write('Providers processed: 4\nTotal games synced: 120\n')
+
+        self.client.force_login(self.admin)
+        with mock.patch('providers.admin_views.call_command', side_effect=sync_providers):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data['success'], data['providers_processed'], data['games_synced']), (True, 4, 120))
+        # Sync views and thread-sensitive calls run on the main thread here
+        self.assertIsNot(threads[0], threading.main_thread())
+
+    def test_failure_is_reported(self):
+        self.client.force_login(self.admin)
+        with mock.patch('providers.admin_views.call_command', side_effect=RuntimeError('API down')):
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json()['error'], 'API down')
+
+    def test_requires_staff(self):
+        with mock.patch('providers.admin_views.call_command') as command:
+            self.assertEqual(self.client.post(self.url).status_code, 403)
+            self.client.force_login(self.user)
+            self.assertEqual(self.client.post(self.url).status_code, 403)
+            self.assertEqual(self.client.get(self.url).status_code, 405)
+        command.assert_not_called()
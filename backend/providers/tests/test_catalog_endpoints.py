@@ -0,0 +1,183 @@
+"""
+Provider compare, availability and search endpoints.
+
+Run with ``python manage.py test providers``.
+"""
+from django.core.cache import cache
+from django.test import TestCase
+
+from providers.availability import refresh_availability
+from providers.models import Country, CryptoCurrency, FiatCurrency, Game, Provider, Restriction
+from providers.search import refresh_search_documents
+
+
+class ProviderCompareTests(TestCase):
+    """/api/providers/compare/?ids=..."""
+
+    url = '/api/providers/compare/'
+
+    @classmethod
+    def setUpTestData(cls):
+        Country.objects.create(iso3='DEU', iso2='DE', name='Germany')
+        cls.alpha, cls.beta, cls.gamma = Provider.objects.bulk_create([
+            Provider(provider_name='Alpha'), Provider(provider_name='Beta'), Provider(provider_name='Gamma'),
+        ])
+        FiatCurrency.objects.bulk_create([
+            FiatCurrency(provider=cls.alpha, currency_code='EUR'),
+            FiatCurrency(provider=cls.alpha, currency_code='USD'),
+            FiatCurrency(provider=cls.beta, currency_code='EUR'),
+        ])
+        CryptoCurrency.objects.create(provider=cls.beta, currency_code='BTC')
+        Restriction.objects.bulk_create([
+            Restriction(provider=cls.alpha, country_code='DE', restriction_type='RESTRICTED'),
+            Restriction(provider=cls.beta, country_code='XK', restriction_type='REGULATED'),
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def test_matrix(self):
+        a, b = self.alpha.pk, self.beta.pk
+        response = self.client.get(self.url, {'ids': f'{b},{a},{b}'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([p['id'] for p in data['providers']], [b, a])
+        self.assertEqual(data['fiat_currencies'], {
+            'matrix': {'EUR': [b, a], 'USD': [a]},
+            'all': ['EUR'],
+            'any': ['EUR', 'USD'],
+            'only': {str(b): [], str(a): ['USD']},
+        })
+        self.assertEqual(data['crypto_currencies']['only'], {str(b): ['BTC'], str(a): []})
+        self.assertEqual(data['restricted_countries']['matrix'], {'DE': [a]})
+        self.assertEqual(data['regulated_countries']['matrix'], {'XK': [b]})
+        # Codes without a Country row are named by their code
+        self.assertEqual(data['country_names'], {'DE': 'Germany', 'XK': 'XK'})
+
+    def test_invalid_ids(self):
+        for ids in ('', str(self.alpha.pk), 'a,b', ','.join(str(n) for n in range(1, 30))):
+            with self.subTest(ids=ids):
+                self.assertEqual(self.client.get(self.url, {'ids': ids}).status_code, 400)
+        response = self.client.get(self.url, {'ids': f'{self.alpha.pk},0'})
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('0', response.json()['detail'])
+
+
+class AvailabilityEndpointTests(TestCase):
+    """/api/availability/ over the precomputed table."""
+
+    url = '/api/availability/'
+
+    @classmethod
+    def setUpTestData(cls):
+        Country.objects.bulk_create([
+            Country(iso3='DEU', iso2='DE', name='Germany'),
+            Country(iso3='MLT', iso2='MT', name='Malta'),
+        ])
+        cls.alpha, cls.beta, draft = Provider.objects.bulk_create([
+            Provider(provider_name='Alpha', status=Provider.Status.ACTIVE,
+                     currency_mode=Provider.CurrencyMode.ALL_FIAT),
+            Provider(provider_name='Beta', status=Provider.Status.ACTIVE,
+                     currency_mode=Provider.CurrencyMode.LIST),
+            Provider(provider_name='Draft', status=Provider.Status.DRAFT,
+                     currency_mode=Provider.CurrencyMode.LIST),
+        ])
+        FiatCurrency.objects.bulk_create([
+            FiatCurrency(provider=cls.beta, currency_code='EUR'),
+            FiatCurrency(provider=cls.beta, currency_code='USD'),
+            FiatCurrency(provider=draft, currency_code='EUR'),
+        ])
+        CryptoCurrency.objects.create(provider=cls.beta, currency_code='BTC')
+        # Restricted by ISO3 code: still blocks the ISO2-keyed country
+        Restriction.objects.create(provider=cls.beta, country_code='DEU', restriction_type='RESTRICTED')
+        Game.objects.bulk_create([
+            Game(provider=cls.alpha, game_title='A1'),
+            Game(provider=cls.alpha, game_title='A2', enabled=False),
+            Game(provider=cls.beta, game_title='B1'),
+            Game(provider=cls.beta, game_title='B2'),
+            Game(provider=draft, game_title='D1'),
+        ])
+        refresh_availability()
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return {
+            (row['country'], row['currency']): (row['currency_type'], row['provider_ids'], row['game_count'])
+            for row in response.json()['results']
+        }
+
+    def test_country_and_currency(self):
+        a, b = self.alpha.pk, self.beta.pk
+        self.assertEqual(self.get(country='MT', currency='EUR'), {('MT', 'EUR'): ('FIAT', [a, b], 3)})
+        # ISO3 is accepted and resolved to the ISO2 key
+        self.assertEqual(self.get(country='deu', currency='eur'), {('DE', 'EUR'): ('FIAT', [a], 1)})
+
+    def test_country_only(self):
+        a, b = self.alpha.pk, self.beta.pk
+        self.assertEqual(self.get(country='MT'), {
+            ('MT', 'BTC'): ('CRYPTO', [b], 2),
+            ('MT', 'EUR'): ('FIAT', [a, b], 3),
+            ('MT', 'USD'): ('FIAT', [a, b], 3),
+        })
+
+    def test_currency_only(self):
+        b = self.beta.pk
+        # Beta is restricted in Germany, so there is no (DE, BTC) row
+        self.assertEqual(self.get(currency='BTC'), {('MT', 'BTC'): ('CRYPTO', [b], 2)})
+
+    def test_requires_a_parameter(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+
+
+class ProviderSearchTests(TestCase):
+    """/api/search/ over the provider search documents."""
+
+    url = '/api/search/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.bonanza, cls.pragmatic = Provider.objects.bulk_create([
+            Provider(provider_name='Bonanza Studios', status=Provider.Status.ACTIVE),
+            Provider(provider_name='Pragmatic Play', status=Provider.Status.ACTIVE),
+        ])
+        Game.objects.bulk_create([
+            Game(provider=cls.pragmatic, game_title='Sweet Bonanza', themes='["Candy"]'),
+            Game(provider=cls.pragmatic, game_title='Big Bass Bonanza'),
+            Game(provider=cls.pragmatic, game_title='Gates of Olympus', vendor='Reel Kingdom'),
+            Game(provider=cls.bonanza, game_title='Fruit Party'),
+        ])
+        refresh_search_documents()
+
+    def setUp(self):
+        cache.clear()
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_name_hits_rank_before_game_hits(self):
+        results = self.search(q='bonanza')
+        self.assertEqual([r['id'] for r in results], [self.bonanza.pk, self.pragmatic.pk])
+        self.assertEqual(results[0]['name_highlights'], [[0, 7]])
+        self.assertEqual(results[0]['game_match_count'], 0)
+        self.assertEqual(results[1]['game_match_count'], 2)
+        self.assertEqual(results[1]['games'][0], {'title': 'Big Bass Bonanza', 'highlights': [[9, 16]]})
+
+    def test_matches_vendors_and_themes(self):
+        self.assertEqual([r['id'] for r in self.search(q='Kingdom')], [self.pragmatic.pk])
+        self.assertEqual([r['id'] for r in self.search(q='candy')], [self.pragmatic.pk])
+        self.assertEqual(self.search(q='nothing like this'), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.search(q='bonanza', limit=1)), 1)
+
+    def test_invalid_parameters(self):
+        for params in ({}, {'q': 'a'}, {'q': 'bonanza', 'limit': 0}, {'q': 'bonanza', 'limit': 'x'},
+                       {'q': 'bonanza', 'limit': 51}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.url, params).status_code, 400)
@@ -0,0 +1,127 @@
+"""
+Derived tables after admin writes: only the touched providers are refreshed.
+
+Run with ``python manage.py test providers``.
+"""
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from providers.availability import refresh_availability
+from providers.models import (
+    Availability,
+    Country,
+    FiatCurrency,
+    Game,
+    Provider,
+    ProviderGameCount,
+    ProviderSearchDocument,
+    Restriction,
+)
+from providers.search import refresh_search_documents
+
+
+class CatalogRefreshTests(TestCase):
+    """catalog_changed listeners run on commit and rewrite only what changed."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+        Country.objects.bulk_create([
+            Country(iso3='DEU', iso2='DE', name='Germany'),
+            Country(iso3='MLT', iso2='MT', name='Malta'),
+        ])
+        cls.alpha, cls.beta = Provider.objects.bulk_create([
+            Provider(provider_name='Alpha', status=Provider.Status.ACTIVE,
+                     currency_mode=Provider.CurrencyMode.LIST),
+            Provider(provider_name='Beta', status=Provider.Status.ACTIVE,
+                     currency_mode=Provider.CurrencyMode.LIST),
+        ])
+        FiatCurrency.objects.bulk_create([
+            FiatCurrency(provider=cls.alpha, currency_code='EUR'),
+            FiatCurrency(provider=cls.beta, currency_code='EUR'),
+            FiatCurrency(provider=cls.beta, currency_code='USD'),
+        ])
+        Restriction.objects.create(provider=cls.beta, country_code='DE')
+        cls.game = Game.objects.create(provider=cls.alpha, game_title='Sweet Bonanza')
+        Game.objects.create(provider=cls.beta, game_title='Book of Dead')
+        refresh_availability()
+        refresh_search_documents()
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def availability(self):
+        return {
+            (row.country_code, row.currency_code): (row.provider_ids, row.game_count)
+            for row in Availability.objects.all()
+        }
+
+    def availability_writes(self, queries):
+        table = Availability._meta.db_table
+        return [
+            q['sql'] for q in queries
+            if table in q['sql'] and q['sql'].lstrip().startswith(('INSERT', 'UPDATE', 'DELETE'))
+        ]
+
+    def test_game_edit_rebuilds_only_its_providers_document(self):
+        ProviderSearchDocument.objects.filter(provider=self.beta).update(game_titles='sentinel')
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.put(
+                f'/api/admin/games/{self.game.pk}/', {'game_title': 'Gates of Olympus'},
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(callbacks), 2)
+        documents = dict(ProviderSearchDocument.objects.values_list('provider_id', 'game_titles'))
+        self.assertEqual(documents, {self.alpha.pk: 'Gates of Olympus', self.beta.pk: 'sentinel'})
+
+    def test_title_edit_writes_no_availability_rows(self):
+        before = self.availability()
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.put(
+                    f'/api/admin/games/{self.game.pk}/', {'game_title': 'Renamed'},
+                    content_type='application/json',
+                )
+        self.assertEqual(self.availability_writes(queries), [])
+        self.assertEqual(self.availability(), before)
+
+    def test_currency_edit_leaves_search_documents_alone(self):
+        ProviderSearchDocument.objects.update(game_titles='sentinel')
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post(
+                f'/api/admin/providers/{self.alpha.pk}/currencies/', {'currency_codes': 'USD'},
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(set(ProviderSearchDocument.objects.values_list('game_titles', flat=True)), {'sentinel'})
+        self.assertEqual(self.availability()[('MT', 'USD')], ([self.alpha.pk, self.beta.pk], 2))
+
+    def test_refresh_counts_only_touched_providers_and_writes_changed_rows(self):
+        # A stale count for Beta shows it is not recounted when only Alpha changed
+        ProviderGameCount.objects.filter(provider=self.beta).update(enabled_games=50)
+        Game.objects.filter(pk=self.game.pk).update(enabled=False)
+
+        written = refresh_availability({self.alpha.pk})
+
+        self.assertEqual(written, 3)
+        self.assertEqual(self.availability(), {
+            ('DE', 'EUR'): ([self.alpha.pk], 0),
+            ('MT', 'EUR'): ([self.alpha.pk, self.beta.pk], 50),
+            ('MT', 'USD'): ([self.beta.pk], 50),
+        })
+        # A full refresh recounts Beta: its two rows change, then nothing does
+        self.assertEqual(refresh_availability(), 2)
+        self.assertEqual(refresh_availability(), 0)
+
+    def test_provider_delete_drops_its_rows(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f'/api/admin/providers/{self.alpha.pk}/')
+        self.assertEqual(self.availability(), {
+            ('MT', 'EUR'): ([self.beta.pk], 1),
+            ('MT', 'USD'): ([self.beta.pk], 1),
+        })
+        self.assertEqual(list(ProviderSearchDocument.objects.values_list('provider_id', flat=True)), [self.beta.pk])
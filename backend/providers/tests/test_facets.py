@@ -0,0 +1,148 @@
+"""
+Facets: the provider bitmap index against SQL, and per-provider game counts.
+
+Run with ``python manage.py test providers``.
+"""
+import random
+from collections import Counter
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from providers.filters import ExactProviderFilter, ProviderFilter
+from providers.models import CryptoCurrency, FiatCurrency, Game, Provider, Restriction
+
+GAME_TYPES = ['Slots', 'Live', 'Crash', 'Table']
+FIAT = ['EUR', 'USD', 'GBP', 'CAD']
+CRYPTO = ['BTC', 'ETH', 'USDT']
+COUNTRIES = ['DE', 'FR', 'US', 'GB', 'MT']
+# Filter param -> values to draw from (XX matches nothing)
+PARAM_VALUES = {
+    'game_type': GAME_TYPES + ['XX'],
+    'fiat_currency': FIAT + ['XX'],
+    'crypto_currency': CRYPTO + ['XX'],
+    'restricted_country': COUNTRIES + ['XX'],
+    'regulated_country': COUNTRIES + ['XX'],
+}
+
+
+class FacetIndexParityTests(TestCase):
+    """ProviderFilter on the facet index matches ExactProviderFilter in SQL."""
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(44)
+        providers = Provider.objects.bulk_create([
+            Provider(provider_name=f'Provider {n:02d}', status=rng.choice(Provider.Status.values))
+            for n in range(30)
+        ])
+        games, fiat, crypto, restrictions = [], [], [], []
+        for provider in providers:
+            for n in range(rng.randint(0, 4)):
+                games.append(Game(provider=provider, game_title=f'Game {n}', game_type=rng.choice(GAME_TYPES)))
+            fiat += [FiatCurrency(provider=provider, currency_code=code)
+                     for code in rng.sample(FIAT, rng.randint(0, 3))]
+            crypto += [CryptoCurrency(provider=provider, currency_code=code)
+                       for code in rng.sample(CRYPTO, rng.randint(0, 2))]
+            restrictions += [
+                Restriction(provider=provider, country_code=code,
+                            restriction_type=rng.choice(Restriction.RestrictionType.values))
+                for code in rng.sample(COUNTRIES, rng.randint(0, 3))
+            ]
+        Game.objects.bulk_create(games)
+        FiatCurrency.objects.bulk_create(fiat)
+        CryptoCurrency.objects.bulk_create(crypto)
+        Restriction.objects.bulk_create(restrictions)
+
+    def setUp(self):
+        cache.clear()
+
+    def ids(self, filterset_class, params) -> set[int]:
+        filterset = filterset_class(params, queryset=Provider.objects.all())
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return set(filterset.qs.values_list('pk', flat=True))
+
+    def test_random_filter_combinations(self):
+        rng = random.Random(40)
+        for _ in range(200):
+            params = {
+                name: ','.join(rng.sample(values, rng.randint(1, 2)))
+                for name, values in rng.sample(sorted(PARAM_VALUES.items()), rng.randint(1, 3))
+            }
+            if rng.random() < 0.3:
+                params['status'] = rng.choice(Provider.Status.values)
+            with self.subTest(params=params):
+                self.assertEqual(self.ids(ProviderFilter, params), self.ids(ExactProviderFilter, params))
+
+    def test_index_follows_catalog_writes(self):
+        params = {'fiat_currency': 'JPY'}
+        self.assertEqual(self.ids(ProviderFilter, params), set())
+        provider = Provider.objects.first()
+        FiatCurrency.objects.create(provider=provider, currency_code='JPY')
+        cache.clear()
+        self.assertEqual(self.ids(ProviderFilter, params), {provider.pk})
+
+
+class GameFacetCountsTests(TestCase):
+    """/api/providers/<pk>/games/facets/ counts the provider's (filtered) games."""
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(46)
+        cls.provider, other = Provider.objects.bulk_create([
+            Provider(provider_name='Alpha'), Provider(provider_name='Beta'),
+        ])
+        rtps = [None, Decimal('85.00'), Decimal('90.00'), Decimal('93.99'), Decimal('94.00'),
+                Decimal('95.50'), Decimal('96.99'), Decimal('97.00'), Decimal('99.10')]
+        Game.objects.bulk_create([
+            Game(
+                provider=cls.provider if n % 5 else other,
+                game_title=f'Game {n}',
+                volatility=rng.choice(['low', 'medium', 'high', '']),
+                game_type=rng.choice(['Slots', 'Live']),
+                platform=rng.choice(['Desktop', 'Mobile', None]),
+                subtype=rng.choice(['Megaways', None]),
+                enabled=rng.random() < 0.8,
+                rtp=rng.choice(rtps),
+            )
+            for n in range(60)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def expected(self, games) -> dict:
+        data = {'total': len(games)}
+        for field in ('volatility', 'game_type', 'platform', 'subtype', 'enabled'):
+            values = Counter(
+                ('true' if value else 'false') if field == 'enabled' else value
+                for value in (getattr(game, field) for game in games)
+                if value not in (None, '')
+            )
+            data[field] = dict(sorted(values.items()))
+        bounds = ((None, 90), (90, 92), (92, 94), (94, 95), (95, 96), (96, 97), (97, None))
+        data['rtp'] = [
+            {'min': low, 'max': high, 'count': sum(
+                1 for game in games if game.rtp is not None
+                and (low is None or game.rtp >= low) and (high is None or game.rtp < high)
+            )}
+            for low, high in bounds
+        ]
+        data['rtp_unknown'] = sum(1 for game in games if game.rtp is None)
+        return data
+
+    def test_counts(self):
+        response = self.client.get(f'/api/providers/{self.provider.pk}/games/facets/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.expected(list(self.provider.games.all())))
+
+    def test_counts_follow_game_filters(self):
+        response = self.client.get(
+            f'/api/providers/{self.provider.pk}/games/facets/', {'volatility': 'high', 'rtp_min': '94'},
+        )
+        games = self.provider.games.filter(volatility__iexact='high', rtp__gte=94)
+        self.assertEqual(response.json(), self.expected(list(games)))
+
+    def test_unknown_provider(self):
+        self.assertEqual(self.client.get('/api/providers/0/games/facets/').status_code, 404)
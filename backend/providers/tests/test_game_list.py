@@ -0,0 +1,103 @@
+"""
+/api/games/: cursor pagination across providers.
+
+Run with ``python manage.py test providers``.
+"""
+import base64
+import json
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from providers.models import FiatCurrency, Game, Provider
+
+
+def encode(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+class GameListCursorTests(TestCase):
+    """Keyset pages are stable, complete and ordered; bad cursors are a 400."""
+
+    url = '/api/games/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alpha, cls.beta = Provider.objects.bulk_create([
+            Provider(provider_name='Alpha', status=Provider.Status.ACTIVE),
+            Provider(provider_name='Beta', status=Provider.Status.ACTIVE),
+        ])
+        FiatCurrency.objects.create(provider=cls.alpha, currency_code='EUR')
+        # Repeated titles and RTPs, and missing RTPs, so ties and nulls are exercised
+        Game.objects.bulk_create([
+            Game(
+                provider=cls.alpha if n % 3 else cls.beta,
+                game_title=f'Title {n % 5:02d}',
+                rtp=None if n % 4 == 0 else Decimal(90 + n % 6),
+            )
+            for n in range(17)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def walk(self, params, page_size=4) -> list[int]:
+        """Ids of every game, following ``next`` links from the first page."""
+        ids = []
+        response = self.client.get(self.url, {**params, 'page_size': page_size})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertLessEqual(len(body['results']), page_size)
+            ids += [game['id'] for game in body['results']]
+            if body['next'] is None:
+                return ids
+            response = self.client.get(body['next'])
+
+    def expected(self, field, descending) -> list[int]:
+        """(field, id) order with nulls last in both directions."""
+        rows = list(Game.objects.values_list(field, 'id'))
+        present = sorted((row for row in rows if row[0] is not None), reverse=descending)
+        missing = sorted((row for row in rows if row[0] is None), key=lambda row: row[1], reverse=descending)
+        return [pk for _, pk in present + missing]
+
+    def test_pages_cover_every_game_once_in_order(self):
+        for ordering in ('id', '-id', 'game_title', '-game_title', 'rtp', '-rtp'):
+            with self.subTest(ordering=ordering):
+                field = ordering.lstrip('-')
+                self.assertEqual(
+                    self.walk({'ordering': ordering}),
+                    self.expected(field, ordering.startswith('-')),
+                )
+
+    def test_pages_are_stable_under_inserts(self):
+        first = self.client.get(self.url, {'ordering': 'rtp', 'page_size': 5}).json()
+        seen = [game['id'] for game in first['results']]
+        # Sorts before the cursor: later pages must neither repeat nor skip rows
+        early = Game.objects.create(provider=self.alpha, game_title='Early', rtp=Decimal('80'))
+        cache.clear()
+        response = self.client.get(first['next'])
+        while True:
+            body = response.json()
+            seen += [game['id'] for game in body['results']]
+            if body['next'] is None:
+                break
+            response = self.client.get(body['next'])
+        self.assertEqual(seen, [pk for pk in self.expected('rtp', False) if pk != early.pk])
+
+    def test_provider_filters(self):
+        ids = self.walk({'fiat_currency': 'EUR'})
+        self.assertEqual(sorted(ids), sorted(self.alpha.games.values_list('id', flat=True)))
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        for ordering, cursor in (
+            ('rtp', 'not a cursor!'),
+            ('rtp', encode('just a string')),
+            ('rtp', encode(['abc', 1])),
+            ('id', encode([None, 'x'])),
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.client.get(self.url, {'ordering': ordering, 'cursor': cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor.'})
@@ -0,0 +1,47 @@
+"""
+Prometheus request metrics: recorded by default, written to METRICS_DIR off the request path.
+
+Run with ``python manage.py test providers``.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from providers import prometheus
+from providers.models import Provider
+
+
+@override_settings(REQUEST_METRICS=False)
+class RequestMetricsTests(TestCase):
+    """Per-route histograms without REQUEST_METRICS; snapshots only on flush."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Provider.objects.create(provider_name='Alpha', status=Provider.Status.ACTIVE)
+
+    def setUp(self):
+        cache.clear()
+
+    def latency_count(self, route) -> int:
+        slots = prometheus.collect().get(('http_request_duration_seconds', (('route', route),)))
+        return sum(slots[:-1]) if slots else 0
+
+    def test_latency_is_recorded_by_default(self):
+        before = self.latency_count('provider-list')
+        response = self.client.get('/api/providers/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(self.latency_count('provider-list'), before + 1)
+
+    def test_requests_do_not_write_the_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            path = Path(directory) / f'{os.getpid()}.json'
+            self.client.get('/api/providers/')
+            self.assertFalse(path.exists())
+            prometheus.flush()
+            names = {name for name, _, _ in json.loads(path.read_text())}
+        self.assertIn('http_request_duration_seconds', names)
@@ -0,0 +1,211 @@
+"""
+Query-count budgets for the public and admin API.
+
+Every endpoint is requested against the same catalog seeded at several sizes.
+Its query count must be identical at every size (no per-row queries) and no
+higher than the endpoint's declared budget. When a change legitimately adds a
+query, raise the budget in ENDPOINTS alongside it.
+
+``admin_sync`` is not covered: it calls the external provider API.
+
+Run with ``python manage.py test providers``.
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from providers import facets, reference
+from providers.bulk import bulk_load
+from providers.models import (
+    Country,
+    CryptoCurrency,
+    FiatCurrency,
+    Game,
+    Provider,
+    Restriction,
+)
+
+# (providers, games per provider); the largest spans several pages
+SCALES = ((2, 3), (12, 20), (40, 60))
+
+FIAT = ('USD', 'EUR', 'GBP', 'CAD')
+CRYPTO = ('BTC', 'ETH')
+COUNTRIES = (('USA', 'US', 'United States'), ('GBR', 'GB', 'United Kingdom'),
+             ('DEU', 'DE', 'Germany'), ('FRA', 'FR', 'France'))
+GAME_TYPES = ('Slots', 'Live Casino', 'Table Games')
+
+
+def seed(provider_count: int, games_per_provider: int):
+    """Create a catalog of the given size; every provider gets every relation."""
+    Country.objects.bulk_create([Country(iso3=a, iso2=b, name=c) for a, b, c in COUNTRIES])
+    synced = timezone.now() - timedelta(days=1)
+    providers = Provider.objects.bulk_create([
+        Provider(
+            provider_name=f'Provider {i:03}',
+            status=Provider.Status.ACTIVE if i % 3 else Provider.Status.DRAFT,
+            currency_mode=Provider.CurrencyMode.LIST,
+            last_synced=synced if i % 2 else None,
+        )
+        for i in range(provider_count)
+    ])
+    ids = [p.pk for p in providers]
+    columns = ('provider_id', 'game_title', 'game_type', 'platform', 'rtp', 'volatility', 'enabled', 'fun_mode')
+    bulk_load(Game, columns, (
+        (pk, f'Game {pk}-{n}', GAME_TYPES[n % 3], 'Desktop', 94 + n % 4, 'medium', n % 5 != 0, False)
+        for pk in ids for n in range(games_per_provider)
+    ))
+    bulk_load(FiatCurrency, ('provider_id', 'currency_code', 'display'),
+              ((pk, code, True) for pk in ids for code in FIAT))
+    bulk_load(CryptoCurrency, ('provider_id', 'currency_code', 'display'),
+              ((pk, code, True) for pk in ids for code in CRYPTO))
+    bulk_load(Restriction, ('provider_id', 'country_code', 'restriction_type'), (
+        (pk, iso3, Restriction.RestrictionType.RESTRICTED if n % 2 else Restriction.RestrictionType.REGULATED)
+        for pk in ids for n, (iso3, _, _) in enumerate(COUNTRIES)
+    ))
+    return providers[0]
+
+
+def import_file():
+    content = '﻿Provider Name\nImported One\nImported Two\nProvider 000\n'
+    return SimpleUploadedFile('providers.csv', content.encode(), content_type='text/csv')
+
+
+# (label, method, url, request kwargs, budget). URLs and payloads are callables
+# of the first seeded provider (``p``) and one of its games (``g``).
+ENDPOINTS = [
+    # Public
+    ('stats', 'get', lambda p, g: '/api/stats/', None, 2),
+    ('filters', 'get', lambda p, g: '/api/filters/', None, 0),
+    ('provider list', 'get', lambda p, g: '/api/providers/', None, 3),
+    ('provider list filtered', 'get',
+     lambda p, g: '/api/providers/?status=ACTIVE&game_type=Slots&fiat_currency=EUR'
+                  '&restricted_country=GBR&regulated_country=USA&ordering=-game_count', None, 3),
+    ('provider list sparse', 'get', lambda p, g: '/api/providers/?fields=id,provider_name', None, 2),
+    ('provider list facets', 'get',
+     lambda p, g: '/api/providers/?facets=true&status=ACTIVE&game_type=Slots&fields=id', None, 3),
+    ('provider list search', 'get', lambda p, g: '/api/providers/?search=Game 1', None, 2),
+    ('provider search', 'get', lambda p, g: '/api/search/?q=Game 1', None, 1),
+    ('provider compare', 'get',
+     lambda p, g: f'/api/providers/compare/?ids={p.pk},{p.pk + 1}', None, 2),
+    ('provider detail', 'get', lambda p, g: f'/api/providers/{p.pk}/', None, 5),
+    ('provider games', 'get', lambda p, g: f'/api/providers/{p.pk}/games/', None, 3),
+    ('provider games filtered', 'get',
+     lambda p, g: f'/api/providers/{p.pk}/games/?game_type=Slots&search=Game&ordering=-rtp', None, 3),
+    ('provider game facets', 'get',
+     lambda p, g: f'/api/providers/{p.pk}/games/facets/?search=Game&rtp_min=95', None, 2),
+    ('games', 'get', lambda p, g: '/api/games/', None, 1),
+    ('games filtered', 'get',
+     lambda p, g: '/api/games/?game_type=Slots&rtp_min=95&status=ACTIVE&fiat_currency=EUR'
+                  '&regulated_country=USA&ordering=-rtp&fields=id,game_title,provider_name', None, 1),
+    ('availability', 'get', lambda p, g: '/api/availability/?country=GBR&currency=EUR', None, 1),
+    ('availability by country', 'get', lambda p, g: '/api/availability/?country=DE', None, 1),
+    ('provider export', 'get', lambda p, g: '/api/providers/export/', None, 1),
+    ('provider games export', 'get', lambda p, g: f'/api/providers/{p.pk}/games/export/', None, 2),
+    ('countries', 'get', lambda p, g: '/api/countries/', None, 0),
+    # Admin
+    ('admin stats', 'get', lambda p, g: '/api/admin/stats/', None, 9),
+    ('admin metrics', 'get', lambda p, g: '/api/admin/metrics/', None, 3),
+    ('admin providers', 'get', lambda p, g: '/api/admin/providers/?stale_days=7', None, 5),
+    ('admin provider create', 'post', lambda p, g: '/api/admin/providers/',
+     lambda p, g: {'provider_name': 'New Provider'}, 9),
+    ('admin provider get', 'get', lambda p, g: f'/api/admin/providers/{p.pk}/', None, 7),
+    ('admin provider update', 'put', lambda p, g: f'/api/admin/providers/{p.pk}/',
+     lambda p, g: {'notes': 'updated'}, 8),
+    ('admin provider delete', 'delete', lambda p, g: f'/api/admin/providers/{p.pk}/', None, 13),
+    ('admin games', 'get', lambda p, g: f'/api/admin/games/?provider={p.pk}&search=Game', None, 3),
+    ('admin game create', 'post', lambda p, g: '/api/admin/games/',
+     lambda p, g: {'provider': p.pk, 'game_title': 'New Game', 'rtp': 96.5}, 4),
+    ('admin game get', 'get', lambda p, g: f'/api/admin/games/{g.pk}/', None, 3),
+    ('admin game update', 'put', lambda p, g: f'/api/admin/games/{g.pk}/',
+     lambda p, g: {'volatility': 'high'}, 4),
+    ('admin game delete', 'delete', lambda p, g: f'/api/admin/games/{g.pk}/', None, 4),
+    ('admin games batch create', 'post', lambda p, g: '/api/admin/games/bulk/',
+     lambda p, g: {'games': [{'provider': p.pk, 'game_title': f'Batch {n}'} for n in range(5)]}, 6),
+    ('admin games bulk update', 'patch', lambda p, g: '/api/admin/games/bulk/',
+     lambda p, g: {'filters': {'game_type': 'Slots'}, 'patch': {'volatility': 'high'}}, 6),
+    ('admin games bulk delete', 'delete', lambda p, g: '/api/admin/games/bulk/',
+     lambda p, g: {'filters': {'game_type': 'Slots'}}, 6),
+    ('admin providers bulk update', 'patch', lambda p, g: '/api/admin/providers/bulk/',
+     lambda p, g: {'filters': {'status': 'ACTIVE'}, 'patch': {'notes': 'bulk'}}, 6),
+    ('admin providers bulk delete', 'delete', lambda p, g: '/api/admin/providers/bulk/',
+     lambda p, g: {'filters': {'status': 'DRAFT'}}, 13),
+    ('admin currencies', 'get', lambda p, g: f'/api/admin/providers/{p.pk}/currencies/', None, 5),
+    ('admin currencies add', 'post', lambda p, g: f'/api/admin/providers/{p.pk}/currencies/',
+     lambda p, g: {'currency_codes': 'USD, JPY, AUD', 'type': 'fiat'}, 7),
+    ('admin currency delete', 'delete',
+     lambda p, g: f'/api/admin/providers/{p.pk}/currencies/EUR/?type=fiat', None, 4),
+    ('admin restrictions', 'get', lambda p, g: f'/api/admin/providers/{p.pk}/restrictions/', None, 4),
+    ('admin restrictions add', 'post', lambda p, g: f'/api/admin/providers/{p.pk}/restrictions/',
+     lambda p, g: {'country_codes': ['USA', 'FRA'], 'restriction_type': 'RESTRICTED'}, 7),
+    ('admin restriction delete', 'delete',
+     lambda p, g: f'/api/admin/providers/{p.pk}/restrictions/{p.restrictions.first().pk}/', None, 5),
+    ('admin bulk currencies', 'post', lambda p, g: '/api/admin/providers/bulk/currencies/',
+     lambda p, g: {'filters': {'status': 'ACTIVE'}, 'currency_codes': 'USD, JPY', 'mode': 'replace'}, 8),
+    ('admin bulk restrictions', 'post', lambda p, g: '/api/admin/providers/bulk/restrictions/',
+     lambda p, g: {'filters': {'status': 'ACTIVE'}, 'country_codes': ['USA', 'FRA'],
+                   'restriction_type': 'RESTRICTED', 'mode': 'add'}, 7),
+    ('admin import', 'post', lambda p, g: '/api/admin/import/',
+     lambda p, g: {'file': import_file()}, 7),
+]
+
+
+@override_settings(API_CACHE_TIMEOUT=0)
+class QueryBudgetTests(TestCase):
+    """Query counts must not depend on catalog size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+    def request(self, label, method, url, payload, provider):
+        game = provider.games.order_by('pk').first()
+        kwargs = {}
+        if payload is not None:
+            data = payload(provider, game)
+            if 'file' in data:
+                kwargs['data'] = data
+            else:
+                kwargs.update(data=data, content_type='application/json')
+        client = self.admin_client if label.startswith('admin') else self.client
+        # Cold caches, so session/user lookups count the same on every request;
+        # reference data and the facet index are per process, loaded once per
+        # catalog version
+        cache.clear()
+        reference.get()
+        facets.get()
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(client, method)(url(provider, game), **kwargs)
+            if response.streaming:
+                b''.join(response)
+        self.assertLess(response.status_code, 400, label)
+        return len(queries)
+
+    def measure(self, label, method, url, payload) -> list[int]:
+        """Query count of one request at every scale, each on a fresh catalog."""
+        counts = []
+        for scale in SCALES:
+            with transaction.atomic():
+                provider = seed(*scale)
+                counts.append(self.request(label, method, url, payload, provider))
+                transaction.set_rollback(True)
+        return counts
+
+    def setUp(self):
+        self.admin_client = self.client_class()
+        self.admin_client.force_login(self.admin)
+
+    def test_query_counts_are_constant_and_within_budget(self):
+        for label, method, url, payload, budget in ENDPOINTS:
+            with self.subTest(label):
+                counts = self.measure(label, method, url, payload)
+                self.assertEqual(
+                    len(set(counts)), 1,
+                    f'{label}: query count grows with the catalog {dict(zip(SCALES, counts))}',
+                )
+                self.assertLessEqual(counts[0], budget, f'{label}: over budget')
@@ -0,0 +1,69 @@
+"""
+ORJSONRenderer: byte-for-byte parity with DRF's JSONRenderer.
+
+Run with ``python manage.py test providers``.
+"""
+import datetime
+import uuid
+from decimal import Decimal
+
+from django import forms
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from providers.filters import GameFilter
+from providers.models import Provider
+from providers.renderers import ORJSONRenderer
+
+
+class ParityForm(forms.Form):
+    status = forms.ChoiceField(choices=Provider.Status.choices)
+    count = forms.IntegerField()
+
+
+class ParitySerializer(serializers.Serializer):
+    name = serializers.CharField()
+    rtp = serializers.DecimalField(max_digits=5, decimal_places=2)
+
+
+class ORJSONRendererParityTests(SimpleTestCase):
+    """Every payload renders to the same bytes as JSONRenderer."""
+
+    def assertSameBytes(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_plain_values(self):
+        self.assertSameBytes({
+            'text': 'Grüße     "quoted" \\ \n',
+            'numbers': [1, -2, 3.5, True, False, None],
+            'nested': {'a': [{'b': {}}], 'c': []},
+            1: 'non-string key',
+        })
+
+    def test_values_needing_the_encoder(self):
+        self.assertSameBytes({
+            'decimal': Decimal('96.50'),
+            'datetime': datetime.datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+            'date': datetime.date(2026, 1, 2),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('Provider not found.'),
+            'choice': Provider.Status.ACTIVE,
+        })
+
+    def test_form_and_filterset_errors(self):
+        form = ParityForm({'status': 'nope', 'count': 'x'})
+        self.assertFalse(form.is_valid())
+        self.assertSameBytes(form.errors)
+        self.assertIn(b'"status":["Select a valid choice.', ORJSONRenderer().render(form.errors))
+
+        filterset = GameFilter({'rtp_min': 'abc'})
+        self.assertFalse(filterset.is_valid())
+        self.assertSameBytes(filterset.errors)
+
+    def test_serializer_data_and_errors(self):
+        serializer = ParitySerializer(data={'rtp': 'abc'})
+        self.assertFalse(serializer.is_valid())
+        self.assertSameBytes(serializer.errors)
+        self.assertSameBytes(ParitySerializer([{'name': 'A', 'rtp': '96.5'}], many=True).data)
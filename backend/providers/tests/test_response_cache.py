@@ -0,0 +1,43 @@
+"""
+Response cache: warm hits run no queries, except where the cache isn't shared.
+
+Run with ``python manage.py test providers``.
+"""
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from providers import cache as catalog_cache
+from providers.models import Provider
+
+
+@override_settings(API_CACHE_TIMEOUT=300)
+class ResponseCacheTests(TestCase):
+    """A repeated request is served from the cache on a shared or single-worker setup."""
+
+    url = '/api/providers/'
+
+    @classmethod
+    def setUpTestData(cls):
+        Provider.objects.create(provider_name='Alpha', status=Provider.Status.ACTIVE)
+
+    def setUp(self):
+        cache.clear()
+
+    def repeat_queries(self) -> int:
+        """Queries run by the second of two identical requests."""
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        return len(queries)
+
+    def test_single_worker_hits_cache(self):
+        self.assertEqual(self.repeat_queries(), 0)
+
+    @override_settings(CACHE_SHARED=False, WEB_CONCURRENCY=2)
+    def test_per_process_cache_with_several_workers_is_not_used(self):
+        catalog_cache._warned_unshared = False
+        with self.assertLogs('providers.cache', 'WARNING'):
+            self.assertGreater(self.repeat_queries(), 0)
+        self.assertEqual(catalog_cache.response_cache_timeout(), 0)
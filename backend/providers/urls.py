@@ -9,13 +9,22 @@ from rest_framework.routers import DefaultRouter
 from . import admin_views, views
 
 router = DefaultRouter()
-router.register(r'providers', views.ProviderViewSet, basename='provider')
 router.register(r'countries', views.CountryViewSet, basename='country')
 
 urlpatterns = [
     path('health/', views.health_check, name='health-check'),
     path('stats/', views.stats, name='stats'),
     path('filters/', views.filter_options, name='filter-options'),
+    path('providers/', views.provider_list, name='provider-list'),
+    path('providers/export/', views.provider_export, name='provider-export'),
+    path('providers/compare/', views.provider_compare, name='provider-compare'),
+    path('providers/<int:pk>/', views.provider_detail, name='provider-detail'),
+    path('games/', views.game_list, name='game-list'),
+    path('search/', views.provider_search, name='provider-search'),
+    path('availability/', views.availability, name='availability'),
+    path('providers/<int:pk>/games/', views.provider_games, name='provider-games'),
+    path('providers/<int:pk>/games/facets/', views.provider_game_facets, name='provider-game-facets'),
+    path('providers/<int:pk>/games/export/', views.provider_games_export, name='provider-games-export'),
     # Auth endpoints
     path('auth/csrf/', views.get_csrf_token, name='auth-csrf'),
     path('auth/login/', views.login_view, name='auth-login'),
@@ -23,15 +32,20 @@ urlpatterns = [
     path('auth/me/', views.me_view, name='auth-me'),
     # Admin endpoints (superuser only)
     path('admin/stats/', admin_views.admin_stats, name='admin-stats'),
+    path('admin/metrics/', admin_views.admin_metrics, name='admin-metrics'),
     path('admin/sync/', admin_views.admin_sync, name='admin-sync'),
     path('admin/import/', admin_views.admin_import, name='admin-import'),
     path('admin/providers/', admin_views.admin_providers, name='admin-providers'),
+    path('admin/providers/bulk/', admin_views.admin_providers_bulk, name='admin-providers-bulk'),
+    path('admin/providers/bulk/currencies/', admin_views.admin_bulk_currencies, name='admin-bulk-currencies'),
+    path('admin/providers/bulk/restrictions/', admin_views.admin_bulk_restrictions, name='admin-bulk-restrictions'),
     path('admin/providers/<int:pk>/', admin_views.admin_provider_detail, name='admin-provider-detail'),
     path('admin/providers/<int:pk>/currencies/', admin_views.admin_provider_currencies, name='admin-provider-currencies'),
     path('admin/providers/<int:pk>/currencies/<str:code>/', admin_views.admin_provider_currency_delete, name='admin-provider-currency-delete'),
     path('admin/providers/<int:pk>/restrictions/', admin_views.admin_provider_restrictions, name='admin-provider-restrictions'),
     path('admin/providers/<int:pk>/restrictions/<int:restriction_id>/', admin_views.admin_provider_restriction_delete, name='admin-provider-restriction-delete'),
     path('admin/games/', admin_views.admin_games, name='admin-games'),
+    path('admin/games/bulk/', admin_views.admin_games_bulk, name='admin-games-bulk'),
     path('admin/games/<int:pk>/', admin_views.admin_game_detail, name='admin-game-detail'),
     path('', include(router.urls)),
 ]
@@ -1,29 +1,40 @@
 """
 Views for Game Providers Platform.
 
-Uses DRF ViewSets for CRUD operations.
+Hot public reads (stats, filters, providers, provider games, exports) are
+plain async Django views using the async ORM; everything else uses DRF.
 """
 import csv
+from functools import wraps
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth import authenticate, login, logout
-from django.db.models import Count
-from django.http import HttpResponse, StreamingHttpResponse
+from django.db.models import Case, CharField, Count, IntegerField, Value, When
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.middleware.csrf import get_token
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404
 from django.views.decorators.csrf import ensure_csrf_cookie
+from django.views.decorators.http import require_GET
 from rest_framework import status, viewsets
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import APIException
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from .filters import GameFilter, ProviderFilter
-from .models import Country, CryptoCurrency, FiatCurrency, Game, Provider, Restriction
+from . import prometheus, reference, search
+from .cache import cached_response
+from .filters import GameFilter, ProviderFilter, indexed_provider_ids
+from .instrumentation import span
+from .models import Availability, Country, CryptoCurrency, FiatCurrency, Game, Provider, Restriction
+from .pagination import acursor_paginate, apaginate
+from .renderers import ORJSONRenderer
 from .serializers import (
     CountrySerializer,
     FilterOptionsSerializer,
     GameSerializer,
     ProviderDetailSerializer,
     ProviderListSerializer,
+    RowSerializer,
     StatsSerializer,
 )
 
@@ -34,66 +45,496 @@ def health_check(request):
     return Response({'status': 'ok'})
 
 
-@api_view(['GET'])
-def stats(request):
-    """Return total counts for dashboard."""
-    data = {
-        'total_providers': Provider.objects.count(),
-        'total_games': Game.objects.count(),
-    }
-    serializer = StatsSerializer(data)
-    return Response(serializer.data)
+# ---------------------------------------------------------------------------
+# Async public reads (served natively under ASGI, see config/asgi.py)
+# ---------------------------------------------------------------------------
+
+PROVIDER_ORDERING_FIELDS = ('provider_name', 'game_count')
+PROVIDER_DEFAULT_ORDERING = ['provider_name']
+# With ?search= and no ?ordering=, best matches first
+PROVIDER_SEARCH_ORDERING = ['-search_rank', 'provider_name']
+
+PROVIDER_EXPORT_FIELDS = ['id', 'provider_name', 'status', 'currency_mode', 'game_count']
+PROVIDER_EXPORT_HEADERS = ['ID', 'Provider Name', 'Status', 'Currency Mode', 'Game Count']
+GAME_EXPORT_FIELDS = [
+    'id', 'game_title', 'game_type', 'platform', 'rtp', 'volatility',
+    'enabled', 'thumbnail'
+]
+GAME_EXPORT_HEADERS = [
+    'ID', 'Title', 'Type', 'Platform', 'RTP', 'Volatility',
+    'Enabled', 'Thumbnail'
+]
+
+
+# values_list() fast paths for list endpoints (same JSON as the serializers)
+PROVIDER_ROWS = RowSerializer(ProviderListSerializer, computed=['supported_game_types'])
+GAME_ROWS = RowSerializer(GameSerializer, computed=['provider_name'])
+
+# /api/games/ joins provider_name per row; provider-level params use the facet index
+ALL_GAME_ROWS = RowSerializer(GameSerializer)
+ALL_GAME_PROVIDER_FILTERS = ('fiat_currency', 'crypto_currency', 'restricted_country', 'regulated_country')
+ALL_GAME_ORDERING_FIELDS = ('id', 'game_title', 'rtp')
+
+COMPARE_MAX_PROVIDERS = 20
+
+SEARCH_MIN_LENGTH = 2
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 50
+# Response key -> kind column of the coverage rows (see _coverage_rows)
+COMPARE_DIMENSIONS = {
+    'fiat_currencies': 'fiat',
+    'crypto_currencies': 'crypto',
+    'restricted_countries': Restriction.RestrictionType.RESTRICTED,
+    'regulated_countries': Restriction.RestrictionType.REGULATED,
+}
+
+PROVIDER_DETAIL_COLUMNS = {field.name for field in Provider._meta.concrete_fields}
+PROVIDER_DETAIL_RELATIONS = ('fiat_currencies', 'crypto_currencies', 'restrictions')
+
+GAME_FACET_FIELDS = ('volatility', 'game_type', 'platform', 'subtype', 'enabled')
+# (min, max) RTP bucket bounds: min inclusive, max exclusive, None = open-ended
+RTP_BUCKETS = ((None, 90), (90, 92), (92, 94), (94, 95), (95, 96), (96, 97), (97, None))
+RTP_BUCKET = Case(
+    *[When(rtp__lt=high, then=Value(i)) for i, (_, high) in enumerate(RTP_BUCKETS[:-1])],
+    When(rtp__isnull=False, then=Value(len(RTP_BUCKETS) - 1)),
+    default=None,
+    output_field=IntegerField(),
+)
 
 
-def _build_country_list() -> list[dict]:
-    """Build country list with codes and names for filter dropdowns."""
-    codes = list(
-        Restriction.objects.values_list('country_code', flat=True)
-        .distinct()
+def json_response(data, status=200) -> HttpResponse:
+    """Render ``data`` exactly like DRF's JSONRenderer would."""
+    return HttpResponse(
+        ORJSONRenderer().render(data),
+        status=status,
+        content_type='application/json',
     )
-    # Build name lookup from Country table (match on iso2 and iso3)
-    name_map = {}
-    name_map.update(
-        dict(Country.objects.filter(iso2__in=codes).values_list('iso2', 'name'))
+
+
+def async_api_view(view):
+    """Turn Http404 and DRF API exceptions into ``{"detail": ...}`` responses for async views."""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            return await view(request, *args, **kwargs)
+        except Http404 as exc:
+            return json_response({'detail': str(exc)}, status=404)
+        except APIException as exc:
+            return json_response({'detail': exc.detail}, status=exc.status_code)
+    return require_GET(wrapper)
+
+
+def _fieldset(request, available) -> tuple[list[str] | None, HttpResponse | None]:
+    """
+    Apply ``?fields=a,b`` / ``?exclude=c`` to the ``available`` field names.
+
+    Returns ``(names, error_response)``; names keep the serializer's order.
+    """
+    def parse(param):
+        return [name.strip() for name in request.GET.get(param, '').split(',') if name.strip()]
+
+    fields, exclude = parse('fields'), parse('exclude')
+    unknown = [name for name in fields + exclude if name not in available]
+    if unknown:
+        return None, json_response(
+            {'detail': f'Unknown field(s): {", ".join(unknown)}. Available: {", ".join(available)}.'},
+            status=400,
+        )
+    names = [
+        name for name in available
+        if (not fields or name in fields) and name not in exclude
+    ]
+    return names, None
+
+
+def _ordering(request, allowed, default) -> list[str]:
+    """Parse ``?ordering=`` like DRF's OrderingFilter."""
+    param = request.GET.get('ordering', '')
+    fields = [f.strip() for f in param.split(',') if f.strip()]
+    valid = [f for f in fields if f.lstrip('-') in allowed]
+    return valid or default
+
+
+async def _filtered_providers(request):
+    """Return ``(queryset, error_response)`` for the provider list/export."""
+    filterset = ProviderFilter(
+        request.GET,
+        queryset=Provider.objects.with_game_count_subquery(),
     )
-    name_map.update(
-        dict(Country.objects.filter(iso3__in=codes).values_list('iso3', 'name'))
+    if not await sync_to_async(filterset.is_valid)():
+        errors = {field: list(messages) for field, messages in filterset.errors.items()}
+        return None, json_response(errors, status=400)
+    # Building qs may (re)load the facet index, which needs a sync context
+    queryset = await sync_to_async(lambda: filterset.qs)()
+    searching = bool(filterset.form.cleaned_data.get('search'))
+    ordering = _ordering(
+        request, PROVIDER_ORDERING_FIELDS,
+        PROVIDER_SEARCH_ORDERING if searching else PROVIDER_DEFAULT_ORDERING,
     )
-    return sorted(
-        [{'code': c, 'name': name_map.get(c, c)} for c in codes],
-        key=lambda x: x['name'],
+    return queryset.order_by(*ordering, 'id'), None
+
+
+async def _filtered_all_games(request):
+    """Return ``(queryset, error_response)`` for the cross-provider game list."""
+    filterset = GameFilter(request.GET, queryset=Game.objects.all())
+    if not await sync_to_async(filterset.is_valid)():
+        errors = {field: list(messages) for field, messages in filterset.errors.items()}
+        return None, json_response(errors, status=400)
+
+    def build():
+        queryset = filterset.qs
+        provider_ids = indexed_provider_ids(request.GET, ALL_GAME_PROVIDER_FILTERS)
+        if provider_ids is not None:
+            queryset = queryset.filter(provider_id__in=provider_ids)
+        return queryset
+    # The facet index may need (re)loading, which needs a sync context
+    return await sync_to_async(build)(), None
+
+
+def _facet_counts(params) -> dict:
+    """ProviderFilter facet counts for already-validated ``params``."""
+    filterset = ProviderFilter(params, queryset=Provider.objects.all())
+    filterset.is_valid()
+    return filterset.facet_counts()
+
+
+async def _filtered_games(request, provider):
+    """Games of ``provider`` narrowed by GameFilter (invalid params are ignored)."""
+    filterset = GameFilter(
+        request.GET,
+        queryset=Game.objects.filter(provider=provider),
     )
+    return await sync_to_async(lambda: filterset.qs)()
 
 
-@api_view(['GET'])
-def filter_options(request):
+@async_api_view
+@cached_response
+async def stats(request):
+    """Return total counts for dashboard."""
+    data = {
+        'total_providers': await Provider.objects.acount(),
+        'total_games': await Game.objects.acount(),
+    }
+    serializer = StatsSerializer(data)
+    return json_response(serializer.data)
+
+
+@async_api_view
+@cached_response
+async def filter_options(request):
     """Return available filter options for UI dropdowns."""
+    ref = await reference.aget()
     data = {
-        'game_types': list(
-            Game.objects.exclude(game_type__isnull=True)
-            .exclude(game_type='')
-            .values_list('game_type', flat=True)
-            .distinct()
-            .order_by('game_type')
-        ),
+        'game_types': ref.game_types,
         'currency_modes': [choice[0] for choice in Provider.CurrencyMode.choices],
-        'crypto_currencies': list(
-            CryptoCurrency.objects.values_list('currency_code', flat=True)
-            .distinct()
-            .order_by('currency_code')
-        ),
-        'fiat_currencies': list(
-            FiatCurrency.objects
-            .exclude(currency_code__in=CryptoCurrency.objects.values('currency_code'))
-            .values_list('currency_code', flat=True)
-            .distinct()
-            .order_by('currency_code')
-        ),
-        'countries': _build_country_list(),
+        'crypto_currencies': ref.crypto_currencies,
+        'fiat_currencies': ref.fiat_currencies,
+        'countries': ref.country_options,
     }
     serializer = FilterOptionsSerializer(data)
-    return Response(serializer.data)
+    return json_response(serializer.data)
+
+
+@async_api_view
+@cached_response
+async def provider_list(request):
+    """
+    Paginated provider list with ProviderFilter, ``search`` and ``ordering``.
+
+    ``?facets=true`` adds per-value provider counts for the facet filters.
+    """
+    names, error = _fieldset(request, PROVIDER_ROWS.names)
+    if error:
+        return error
+    queryset, error = await _filtered_providers(request)
+    if error:
+        return error
+    rows = PROVIDER_ROWS.only(names, extra_columns=['id'])
+    page = await apaginate(request, queryset.values_list(*rows.columns))
+    game_types = {}
+    if 'supported_game_types' in names:
+        id_index = rows.column_names.index('id')
+        game_types = await sync_to_async(Provider.objects.game_types_by_provider)(
+            [row[id_index] for row in page.objects]
+        )
+    with span('serialize'):
+        data = rows.serialize(
+            page.objects,
+            supported_game_types=lambda item: game_types[item['id']],
+        )
+    body = page.envelope(data)
+    if request.GET.get('facets', '').lower() in ('1', 'true'):
+        body['facets'] = await sync_to_async(_facet_counts)(request.GET)
+    return json_response(body)
+
+
+def _coverage_rows(ids):
+    """(provider_id, kind, code) for every currency and restriction of ``ids``, in one query."""
+    fiat = FiatCurrency.objects.filter(provider_id__in=ids).annotate(
+        kind=Value('fiat', output_field=CharField()),
+    ).values_list('provider_id', 'kind', 'currency_code').order_by()
+    crypto = CryptoCurrency.objects.filter(provider_id__in=ids).annotate(
+        kind=Value('crypto', output_field=CharField()),
+    ).values_list('provider_id', 'kind', 'currency_code').order_by()
+    restrictions = Restriction.objects.filter(provider_id__in=ids).values_list(
+        'provider_id', 'restriction_type', 'country_code',
+    ).order_by()
+    return fiat.union(crypto, restrictions, all=True)
+
+
+@async_api_view
+@cached_response
+async def provider_compare(request):
+    """
+    Fiat, crypto and country coverage of several providers side by side.
+
+    For each dimension: ``matrix`` (code -> ids of the providers that have
+    it), ``all`` (codes every provider has), ``any`` (codes at least one
+    has) and ``only`` (provider id -> codes no other compared provider has).
+    """
+    try:
+        ids = list(dict.fromkeys(
+            int(pk) for pk in request.GET.get('ids', '').split(',') if pk.strip()
+        ))
+    except ValueError:
+        return json_response({'detail': 'ids must be comma-separated integers.'}, status=400)
+    if not 2 <= len(ids) <= COMPARE_MAX_PROVIDERS:
+        return json_response(
+            {'detail': f'Pass between 2 and {COMPARE_MAX_PROVIDERS} provider ids.'}, status=400,
+        )
 
+    providers = {
+        row['id']: row async for row in
+        Provider.objects.filter(pk__in=ids).values('id', 'provider_name', 'currency_mode')
+    }
+    missing = [pk for pk in ids if pk not in providers]
+    if missing:
+        return json_response(
+            {'detail': f'Provider(s) not found: {", ".join(map(str, missing))}.'}, status=404,
+        )
+
+    holders = {kind: {} for kind in COMPARE_DIMENSIONS.values()}
+    async for provider_id, kind, code in _coverage_rows(ids):
+        holders[kind].setdefault(code, set()).add(provider_id)
+
+    data = {'providers': [providers[pk] for pk in ids]}
+    for key, kind in COMPARE_DIMENSIONS.items():
+        matrix = {code: sorted(owners, key=ids.index) for code, owners in sorted(holders[kind].items())}
+        data[key] = {
+            'matrix': matrix,
+            'all': [code for code, owners in matrix.items() if len(owners) == len(ids)],
+            'any': list(matrix),
+            'only': {
+                str(pk): [code for code, owners in matrix.items() if owners == [pk]]
+                for pk in ids
+            },
+        }
+    ref = await reference.aget()
+    codes = set(data['restricted_countries']['any']) | set(data['regulated_countries']['any'])
+    data['country_names'] = {code: ref.country_names.get(code, code) for code in sorted(codes)}
+    return json_response(data)
+
+
+@async_api_view
+@cached_response
+async def provider_detail(request, pk):
+    """Full provider detail with nested currencies and restrictions."""
+    names, error = _fieldset(request, ProviderDetailSerializer.Meta.fields)
+    if error:
+        return error
+    # Only read the columns, annotation and relations the fieldset needs
+    columns = [name for name in names if name in PROVIDER_DETAIL_COLUMNS]
+    queryset = (
+        Provider.objects.with_game_count_subquery() if 'game_count' in names
+        else Provider.objects.all()
+    )
+    queryset = queryset.only('id', *columns).prefetch_related(
+        *[name for name in PROVIDER_DETAIL_RELATIONS if name in names]
+    )
+    provider = await aget_object_or_404(queryset, pk=pk)
+    if 'supported_game_types' in names:
+        await sync_to_async(Provider.objects.attach_game_types)([provider])
+    context = {'reference': await reference.aget()} if 'restrictions' in names else {}
+    with span('serialize'):
+        data = ProviderDetailSerializer(provider, fields=names, context=context).data
+    return json_response(data)
+
+
+@async_api_view
+@cached_response
+async def provider_games(request, pk):
+    """Return paginated games for a specific provider."""
+    names, error = _fieldset(request, GAME_ROWS.names)
+    if error:
+        return error
+    provider = await aget_object_or_404(Provider.objects.only('id', 'provider_name'), pk=pk)
+    games = await _filtered_games(request, provider)
+    # provider_name comes from the provider already loaded, not a per-row join
+    rows = GAME_ROWS.only(names)
+    page = await apaginate(request, games.values_list(*rows.columns))
+    with span('serialize'):
+        data = rows.serialize(page.objects, provider_name=provider.provider_name)
+    return json_response(page.envelope(data))
+
+
+@async_api_view
+@cached_response
+async def game_list(request):
+    """
+    Games across all providers, cursor-paginated.
+
+    Takes the GameFilter params plus provider-level ``status``,
+    ``fiat_currency``, ``crypto_currency``, ``restricted_country`` and
+    ``regulated_country`` (resolved to provider ids on the facet index), and
+    ``ordering`` on id, game_title or rtp.
+    """
+    names, error = _fieldset(request, ALL_GAME_ROWS.names)
+    if error:
+        return error
+    queryset, error = await _filtered_all_games(request)
+    if error:
+        return error
+    ordering = _ordering(request, ALL_GAME_ORDERING_FIELDS, ['game_title'])[0]
+    rows = ALL_GAME_ROWS.only(names)
+    page = await acursor_paginate(request, queryset, rows.columns, ordering)
+    with span('serialize'):
+        data = rows.serialize(page.objects)
+    return json_response(page.envelope(data))
+
+
+@async_api_view
+@cached_response
+async def provider_game_facets(request, pk):
+    """
+    Game counts per volatility, type, platform, subtype, enabled state and RTP
+    bucket for a provider, under the current GameFilter params.
+
+    One GROUP BY over all facet columns; the per-facet totals are summed from
+    its rows. Empty values are left out of the per-facet counts.
+    """
+    provider = await aget_object_or_404(Provider.objects.only('id'), pk=pk)
+    games = await _filtered_games(request, provider)
+    groups = (
+        games.order_by()
+        .values(*GAME_FACET_FIELDS, rtp_bucket=RTP_BUCKET)
+        .annotate(count=Count('pk'))
+    )
+    total = 0
+    counts = {field: {} for field in GAME_FACET_FIELDS}
+    buckets = [0] * len(RTP_BUCKETS)
+    rtp_unknown = 0
+    async for row in groups:
+        total += row['count']
+        for field in GAME_FACET_FIELDS:
+            value = row[field]
+            if value is None or value == '':
+                continue
+            if field == 'enabled':
+                value = 'true' if value else 'false'
+            counts[field][value] = counts[field].get(value, 0) + row['count']
+        if row['rtp_bucket'] is None:
+            rtp_unknown += row['count']
+        else:
+            buckets[row['rtp_bucket']] += row['count']
+
+    data = {'total': total}
+    data.update({field: dict(sorted(values.items())) for field, values in counts.items()})
+    data['rtp'] = [
+        {'min': low, 'max': high, 'count': count}
+        for (low, high), count in zip(RTP_BUCKETS, buckets)
+    ]
+    data['rtp_unknown'] = rtp_unknown
+    return json_response(data)
+
+
+@async_api_view
+@cached_response
+async def provider_search(request):
+    """
+    Providers ranked by name and game-title hits for ``q``, with the matching
+    games highlighted, in one query over the provider search documents.
+
+    Highlights are ``[start, end)`` character ranges of the matching words.
+    ``limit`` caps the results (default 20, at most 50).
+    """
+    term = request.GET.get('q', '').strip()
+    if len(term) < SEARCH_MIN_LENGTH:
+        return json_response(
+            {'detail': f'q must be at least {SEARCH_MIN_LENGTH} characters.'}, status=400,
+        )
+    try:
+        limit = int(request.GET.get('limit', SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= SEARCH_MAX_LIMIT:
+        return json_response(
+            {'detail': f'limit must be between 1 and {SEARCH_MAX_LIMIT}.'}, status=400,
+        )
+
+    rows = search.ranked(term).values(
+        'provider_id', 'provider_name', 'provider__status', 'game_titles', 'rank',
+    )[:limit]
+    words = search.terms(term)
+    results = []
+    with span('serialize'):
+        async for row in rows:
+            games, count = search.matching_games(row['game_titles'], words)
+            results.append({
+                'id': row['provider_id'],
+                'provider_name': row['provider_name'],
+                'status': row['provider__status'],
+                'rank': round(row['rank'], 4),
+                'name_highlights': search.highlight(row['provider_name'], words, fuzzy=True) or [],
+                'games': games,
+                'game_match_count': count,
+            })
+    return json_response({'query': term, 'results': results})
+
+
+@async_api_view
+@cached_response
+async def availability(request):
+    """
+    Active providers usable in a country with a currency, from the
+    precomputed Availability table (see availability.py).
+
+    ``country`` (ISO2 or ISO3) and ``currency`` each narrow the rows; at
+    least one is required. Both together are a single unique-index lookup.
+    Combinations with no available provider have no row.
+    """
+    country = request.GET.get('country', '').strip().upper()
+    currency = request.GET.get('currency', '').strip().upper()
+    if not country and not currency:
+        return json_response({'detail': 'Pass country, currency or both.'}, status=400)
+
+    ref = await reference.aget()
+    lookup = {}
+    if country:
+        country = ref.iso2_codes.get(country, country)
+        lookup['country_code'] = country
+    if currency:
+        lookup['currency_code'] = currency
+    rows = Availability.objects.filter(**lookup).values(
+        'country_code', 'currency_code', 'currency_type', 'provider_count', 'game_count', 'provider_ids',
+    )
+    results = [
+        {
+            'country': row['country_code'],
+            'country_name': ref.country_names.get(row['country_code']),
+            'currency': row['currency_code'],
+            'currency_type': row['currency_type'],
+            'provider_count': row['provider_count'],
+            'game_count': row['game_count'],
+            'provider_ids': row['provider_ids'],
+        }
+        async for row in rows
+    ]
+    return json_response({'country': country or None, 'currency': currency or None, 'results': results})
+
+
+# ---------------------------------------------------------------------------
+# CSV exports (async streaming)
+# ---------------------------------------------------------------------------
 
 class Echo:
     """An object that implements just the write method of the file-like interface."""
@@ -102,134 +543,58 @@ class Echo:
         return value
 
 
-def generate_csv_rows(queryset, fields, headers):
-    """Generator for streaming CSV response with Excel compatibility."""
-    # UTF-8 BOM for Excel to recognize encoding
-    yield '\ufeff'
-
+async def generate_csv_rows(rows, fields, headers, export):
+    """Async generator streaming CSV lines with Excel compatibility."""
     pseudo_buffer = Echo()
     # Use semicolon delimiter for better Excel compatibility across locales
     writer = csv.writer(pseudo_buffer, delimiter=';')
-    yield writer.writerow(headers)
-
-    for obj in queryset:
-        row = []
-        for field in fields:
-            if '.' in field:
-                # Handle nested attributes like provider.provider_name
-                parts = field.split('.')
-                value = obj
-                for part in parts:
-                    value = getattr(value, part, '')
-            else:
-                value = getattr(obj, field, '')
-            row.append(value if value is not None else '')
-        yield writer.writerow(row)
-
-
-def build_csv_response(queryset, fields, headers, filename):
-    """Build a buffered CSV HttpResponse (works reliably through proxies)."""
-    import io
-
-    output = io.StringIO()
-    output.write('\ufeff')  # UTF-8 BOM
-    writer = csv.writer(output, delimiter=';')
-    writer.writerow(headers)
-
-    for obj in queryset:
-        row = []
-        for field in fields:
-            if '.' in field:
-                parts = field.split('.')
-                value = obj
-                for part in parts:
-                    value = getattr(value, part, '')
-            else:
-                value = getattr(obj, field, '')
-            row.append(value if value is not None else '')
-        writer.writerow(row)
-
-    content = output.getvalue()
-    response = HttpResponse(content, content_type='text/csv; charset=utf-8')
+    sent = 0
+    try:
+        # UTF-8 BOM for Excel to recognize encoding
+        line = '\ufeff' + writer.writerow(headers)
+        sent += len(line.encode())
+        yield line
+
+        async for row in rows:
+            line = writer.writerow(['' if row[f] is None else row[f] for f in fields])
+            sent += len(line.encode())
+            yield line
+    finally:
+        prometheus.inc('export_bytes_total', sent, export=export)
+
+
+def csv_response(queryset, fields, headers, filename, export) -> StreamingHttpResponse:
+    """Stream ``fields`` of ``queryset`` as a CSV download."""
+    # values() rather than values_list(): its iterable is lazy, which aiterator() needs
+    rows = queryset.values(*fields).aiterator(chunk_size=2000)
+    response = StreamingHttpResponse(
+        generate_csv_rows(rows, fields, headers, export),
+        content_type='text/csv; charset=utf-8',
+    )
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    response['Content-Length'] = len(content.encode('utf-8'))
     return response
 
 
-class ProviderViewSet(viewsets.ReadOnlyModelViewSet):
-    """ViewSet for Provider model."""
+@async_api_view
+async def provider_export(request):
+    """Export providers as CSV."""
+    queryset, error = await _filtered_providers(request)
+    if error:
+        return error
+    return csv_response(
+        queryset, PROVIDER_EXPORT_FIELDS, PROVIDER_EXPORT_HEADERS, 'providers.csv', 'providers',
+    )
 
-    filterset_class = ProviderFilter
-    search_fields = ['provider_name']
-    ordering_fields = ['provider_name', 'game_count']
-    ordering = ['provider_name']
 
-    def get_queryset(self):
-        """Return providers with game count annotation."""
-        return Provider.objects.with_game_count().prefetch_related(
-            'fiat_currencies',
-            'crypto_currencies',
-            'restrictions',
-        )
-
-    def get_serializer_class(self):
-        """Use lightweight serializer for list, full for detail."""
-        if self.action == 'list':
-            return ProviderListSerializer
-        return ProviderDetailSerializer
-
-    @action(detail=True, methods=['get'])
-    def games(self, request, pk=None):
-        """Return paginated games for a specific provider."""
-        provider = get_object_or_404(Provider, pk=pk)
-        games = Game.objects.filter(provider=provider).select_related('provider')
-
-        # Apply game filters
-        filterset = GameFilter(request.query_params, queryset=games)
-        filtered_games = filterset.qs
-
-        # Paginate
-        page = self.paginate_queryset(filtered_games)
-        if page is not None:
-            serializer = GameSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = GameSerializer(filtered_games, many=True)
-        return Response(serializer.data)
-
-    @action(detail=False, methods=['get'])
-    def export(self, request):
-        """Export providers as CSV."""
-        queryset = self.filter_queryset(self.get_queryset())
-
-        fields = ['id', 'provider_name', 'status', 'currency_mode', 'game_count']
-        headers = ['ID', 'Provider Name', 'Status', 'Currency Mode', 'Game Count']
-
-        return build_csv_response(queryset, fields, headers, 'providers.csv')
-
-    @action(detail=True, methods=['get'], url_path='games/export')
-    def games_export(self, request, pk=None):
-        """Export games for a specific provider as CSV."""
-        provider = get_object_or_404(Provider, pk=pk)
-        games = Game.objects.filter(provider=provider).select_related('provider')
-
-        # Apply game filters
-        filterset = GameFilter(request.query_params, queryset=games)
-        filtered_games = filterset.qs
-
-        fields = [
-            'id', 'game_title', 'game_type', 'platform', 'rtp', 'volatility',
-            'enabled', 'thumbnail'
-        ]
-        headers = [
-            'ID', 'Title', 'Type', 'Platform', 'RTP', 'Volatility',
-            'Enabled', 'Thumbnail'
-        ]
-
-        return build_csv_response(
-            filtered_games, fields, headers,
-            f'{provider.provider_name}_games.csv',
-        )
+@async_api_view
+async def provider_games_export(request, pk):
+    """Export games for a specific provider as CSV."""
+    provider = await aget_object_or_404(Provider, pk=pk)
+    games = await _filtered_games(request, provider)
+    return csv_response(
+        games, GAME_EXPORT_FIELDS, GAME_EXPORT_HEADERS,
+        f'{provider.provider_name}_games.csv', 'games',
+    )
 
 
 class CountryViewSet(viewsets.ReadOnlyModelViewSet):
@@ -239,6 +604,10 @@ class CountryViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = CountrySerializer
     pagination_class = None
 
+    def list(self, request, *args, **kwargs):
+        """All countries, served from the reference cache."""
+        return Response(reference.get().countries)
+
 
 # Auth views
 @api_view(['GET'])
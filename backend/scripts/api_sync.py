@@ -3,10 +3,12 @@ API Sync Module
 Fetches providers and games from external API, maps to existing DB providers.
 """
 from __future__ import annotations
+import json
 import logging
 import sqlite3
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -75,8 +77,12 @@ def load_secrets_toml():
         return tomllib.load(f)
 
 
+@lru_cache(maxsize=None)
 def get_api_config():
-    """Get API configuration from secrets.toml or Streamlit secrets."""
+    """
+    Get API configuration from secrets.toml or Streamlit secrets.
+    Cached for the lifetime of the process (call get_api_config.cache_clear() to reload).
+    """
     # Try Streamlit secrets first (when running in Streamlit app)
     try:
         if st is not None and hasattr(st, 'secrets') and "API_BASE_URL" in st.secrets:
@@ -266,21 +272,39 @@ def normalize_provider_name(api_name: str) -> str:
 # ============================================
 # Database
 # ============================================
-def db():
-    con = sqlite3.connect(DB_PATH)
-    con.execute("PRAGMA foreign_keys = ON;")
-    return con
+_con: sqlite3.Connection | None = None
+
+
+def db() -> sqlite3.Connection:
+    """
+    Return the shared SQLite connection, opening it on first use.
+    WAL + synchronous=NORMAL keep per-commit fsyncs cheap during a sync.
+    """
+    global _con
+    if _con is None:
+        _con = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _con.execute("PRAGMA foreign_keys = ON;")
+        _con.execute("PRAGMA journal_mode = WAL;")
+        _con.execute("PRAGMA synchronous = NORMAL;")
+    return _con
+
+
+def close_db() -> None:
+    """Close the shared SQLite connection (reopened lazily by db())."""
+    global _con
+    if _con is not None:
+        _con.close()
+        _con = None
 
 
 def get_provider_id_by_name(provider_name: str) -> int | None:
     """Get provider_id from DB by name. Returns None if not found."""
-    with db() as con:
-        cur = con.execute(
-            "SELECT provider_id FROM providers WHERE provider_name = ?",
-            (provider_name,)
-        )
-        row = cur.fetchone()
-        return row[0] if row else None
+    cur = db().execute(
+        "SELECT provider_id FROM providers WHERE provider_name = ?",
+        (provider_name,)
+    )
+    row = cur.fetchone()
+    return row[0] if row else None
 
 
 def upsert_provider(provider_name: str) -> int:
@@ -288,32 +312,54 @@ def upsert_provider(provider_name: str) -> int:
     Insert provider if not exists, return provider_id.
     Does NOT touch restrictions or currencies.
     """
+    provider_id = get_provider_id_by_name(provider_name)
+    if provider_id is not None:
+        return provider_id
+
     with db() as con:
         cur = con.execute(
-            "SELECT provider_id FROM providers WHERE provider_name = ?",
+            """INSERT INTO providers (provider_name, currency_mode, status)
+               VALUES (?, 'ALL_FIAT', 'ACTIVE')""",
             (provider_name,)
         )
-        row = cur.fetchone()
-
-        if row:
-            return row[0]
-        else:
-            cur = con.execute(
-                """INSERT INTO providers (provider_name, currency_mode, status)
-                   VALUES (?, 'ALL_FIAT', 'ACTIVE')""",
-                (provider_name,)
-            )
-            con.commit()
-            return cur.lastrowid
+        return cur.lastrowid
+
+
+def _game_row(provider_id: int, g: dict, source: str) -> tuple:
+    """Build an INSERT parameter tuple for one API game."""
+    details = g.get("details", {})
+    thumbnails = details.get("thumbnails", {})
+    # Pick a main thumbnail (prefer JPG version, then 440x590)
+    thumbnail = thumbnails.get("440x590-jpg") or thumbnails.get("440x590") or thumbnails.get("300x300") or next(iter(thumbnails.values()), None) if thumbnails else None
+
+    title = g.get("title") or "Unknown"
+    return (
+        provider_id,
+        g.get("id"),
+        title,  # game_title (old schema, NOT NULL)
+        title,  # title (new schema)
+        g.get("platform"),
+        g.get("type"),
+        g.get("subtype"),
+        g.get("enabled", 1),
+        g.get("fun_mode", 0),
+        details.get("rtp"),
+        details.get("volatility"),
+        json.dumps(details.get("features", [])),
+        json.dumps(details.get("themes", [])),
+        json.dumps(details.get("tags", [])),
+        thumbnail,
+        g.get("provider"),
+        source
+    )
 
 
 def replace_games_for_provider(provider_id: int, games: list[dict], source: str = "api_sync") -> dict:
     """
     Replace all games for a provider with new data from API.
+    Count, delete and insert run in a single transaction.
     Returns dict with old_count and new_count.
     """
-    import json
-
     with db() as con:
         # Count existing games before deleting
         cur = con.execute(
@@ -329,49 +375,24 @@ def replace_games_for_provider(provider_id: int, games: list[dict], source: str
         )
 
         # Insert new games
-        for g in games:
-            details = g.get("details", {})
-            thumbnails = details.get("thumbnails", {})
-            # Pick a main thumbnail (prefer JPG version, then 440x590)
-            thumbnail = thumbnails.get("440x590-jpg") or thumbnails.get("440x590") or thumbnails.get("300x300") or next(iter(thumbnails.values()), None) if thumbnails else None
-
-            title = g.get("title") or "Unknown"
-            con.execute(
-                """INSERT INTO games
-                   (provider_id, game_id, game_title, title, platform, game_type, subtype,
-                    enabled, fun_mode, rtp, volatility, features, themes, tags,
-                    thumbnail, api_provider, source)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    provider_id,
-                    g.get("id"),
-                    title,  # game_title (old schema, NOT NULL)
-                    title,  # title (new schema)
-                    g.get("platform"),
-                    g.get("type"),
-                    g.get("subtype"),
-                    g.get("enabled", 1),
-                    g.get("fun_mode", 0),
-                    details.get("rtp"),
-                    details.get("volatility"),
-                    json.dumps(details.get("features", [])),
-                    json.dumps(details.get("themes", [])),
-                    json.dumps(details.get("tags", [])),
-                    thumbnail,
-                    g.get("provider"),
-                    source
-                )
-            )
-        con.commit()
-
-        return {"old_count": old_count, "new_count": len(games)}
+        con.executemany(
+            """INSERT INTO games
+               (provider_id, game_id, game_title, title, platform, game_type, subtype,
+                enabled, fun_mode, rtp, volatility, features, themes, tags,
+                thumbnail, api_provider, source)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (_game_row(provider_id, g, source) for g in games)
+        )
+
+    return {"old_count": old_count, "new_count": len(games)}
 
 
 # ============================================
 # API Calls
 # ============================================
+@lru_cache(maxsize=None)
 def get_headers() -> dict:
-    """Build request headers with API credentials."""
+    """Build request headers with API credentials (cached with the config)."""
     config = get_api_config()
     return {
         "X-Operator-Id": config["operator_id"],
@@ -380,6 +401,18 @@ def get_headers() -> dict:
     }
 
 
+_session: requests.Session | None = None
+
+
+def get_session() -> requests.Session:
+    """Return a shared keep-alive HTTP session carrying the API headers."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update(get_headers())
+    return _session
+
+
 def fetch_providers() -> list[str]:
     """
     Fetch all providers from API.
@@ -389,7 +422,7 @@ def fetch_providers() -> list[str]:
     url = f"{config['base_url']}/api/generic/games/v2/providers"
 
     log.debug(f"GET {url}")
-    response = requests.get(url, headers=get_headers())
+    response = get_session().get(url)
     log.debug(f"Response: {response.status_code}")
     response.raise_for_status()
 
@@ -410,7 +443,7 @@ def fetch_games_for_provider(provider_name: str) -> list[dict]:
     params = {"providers": provider_name}
 
     log.debug(f"GET {url}?providers={provider_name}")
-    response = requests.get(url, headers=get_headers(), params=params)
+    response = get_session().get(url, params=params)
     log.debug(f"Response: {response.status_code}")
     response.raise_for_status()
 
@@ -487,7 +520,7 @@ def sync_all() -> dict:
 
         # Upsert provider (preserves restrictions/currencies)
         existing_id = get_provider_id_by_name(db_name)
-        provider_id = upsert_provider(db_name)
+        provider_id = existing_id if existing_id is not None else upsert_provider(db_name)
         if existing_id is None:
             new_providers.append(db_name)
             log.info(f"  NEW provider created (ID: {provider_id})")
@@ -604,4 +637,7 @@ def sync_all() -> dict:
 # CLI
 # ============================================
 if __name__ == "__main__":
-    sync_all()
+    try:
+        sync_all()
+    finally:
+        close_db()
@@ -147,6 +147,7 @@ export function CountryManager({ providerId, providerName, onUpdate }) {
             {restrictedCountries.map((r) => (
               <span
                 key={r.id}
+                title={r.country_name || undefined}
                 className="inline-flex items-center gap-1.5 px-2.5 py-1 bg-error/10 text-error text-sm rounded-full"
               >
                 {r.country_code}
@@ -175,6 +176,7 @@ export function CountryManager({ providerId, providerName, onUpdate }) {
             {regulatedCountries.map((r) => (
               <span
                 key={r.id}
+                title={r.country_name || undefined}
                 className="inline-flex items-center gap-1.5 px-2.5 py-1 bg-warning/10 text-warning text-sm rounded-full"
               >
                 {r.country_code}
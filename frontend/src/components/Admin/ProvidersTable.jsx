@@ -3,6 +3,7 @@ import { api } from '../../api/client'
 import { FormModal, FormField, TextInput, Select } from './FormModal'
 import { ConfirmDialog } from './ConfirmDialog'
 import { LogoPreview } from './LogoPreview'
+import { Pagination } from '../shared/Pagination'
 import { useTheme } from '../../hooks/useTheme'
 import { useToast } from '../../hooks/useToast'
 
@@ -52,11 +53,27 @@ const CURRENCY_MODE_OPTIONS = [
   { value: 'LIST', label: 'List (specific currencies)' },
 ]
 
+const SORT_OPTIONS = [
+  { value: 'name', label: 'Name' },
+  { value: '-game_count', label: 'Most games' },
+  { value: '-last_synced', label: 'Recently synced' },
+  { value: 'last_synced', label: 'Least recently synced' },
+  { value: 'status', label: 'Status' },
+]
+
+const PAGE_SIZE = 50
+const STALE_DAYS = 7
+
 export function ProvidersTable({ selectedProvider, onSelectProvider }) {
   const { isDark } = useTheme()
   const { showSuccess, showError } = useToast()
   const [providers, setProviders] = useState([])
+  const [totalCount, setTotalCount] = useState(0)
+  const [page, setPage] = useState(1)
   const [search, setSearch] = useState('')
+  const [ordering, setOrdering] = useState('name')
+  const [statusFilter, setStatusFilter] = useState('')
+  const [staleOnly, setStaleOnly] = useState(false)
   const [isLoading, setIsLoading] = useState(true)
   const [error, setError] = useState(null)
 
@@ -80,15 +97,28 @@ export function ProvidersTable({ selectedProvider, onSelectProvider }) {
     setIsLoading(true)
     setError(null)
     try {
-      const params = search ? `?search=${encodeURIComponent(search)}` : ''
-      const data = await api.get(`/admin/providers/${params}`)
-      setProviders(data)
+      const params = new URLSearchParams({
+        page: page.toString(),
+        page_size: PAGE_SIZE.toString(),
+        ordering,
+      })
+      if (search) params.set('search', search)
+      if (statusFilter) params.set('status', statusFilter)
+      if (staleOnly) params.set('stale_days', STALE_DAYS.toString())
+      const data = await api.get(`/admin/providers/?${params}`)
+      setProviders(data.results)
+      setTotalCount(data.count)
     } catch (err) {
       setError(err.message || 'Failed to load providers')
     } finally {
       setIsLoading(false)
     }
-  }, [search])
+  }, [page, search, ordering, statusFilter, staleOnly])
+
+  // Reset to first page whenever the result set changes
+  useEffect(() => {
+    setPage(1)
+  }, [search, ordering, statusFilter, staleOnly])
 
   useEffect(() => {
     const timeout = setTimeout(fetchProviders, 300)
@@ -188,6 +218,42 @@ export function ProvidersTable({ selectedProvider, onSelectProvider }) {
             <SearchIcon />
           </div>
         </div>
+        <div className="flex items-center gap-2 mt-2">
+          <select
+            value={ordering}
+            onChange={(e) => setOrdering(e.target.value)}
+            className="flex-1 px-2 py-1.5 bg-surface border border-input-border rounded-lg text-xs text-text
+                       focus:outline-none focus:border-primary transition-colors"
+            title="Sort by"
+          >
+            {SORT_OPTIONS.map((opt) => (
+              <option key={opt.value} value={opt.value}>{opt.label}</option>
+            ))}
+          </select>
+          <select
+            value={statusFilter}
+            onChange={(e) => setStatusFilter(e.target.value)}
+            className="flex-1 px-2 py-1.5 bg-surface border border-input-border rounded-lg text-xs text-text
+                       focus:outline-none focus:border-primary transition-colors"
+            title="Filter by status"
+          >
+            <option value="">All statuses</option>
+            {STATUS_OPTIONS.map((opt) => (
+              <option key={opt.value} value={opt.value}>{opt.label}</option>
+            ))}
+          </select>
+          <label
+            className="flex items-center gap-1 text-xs text-text-muted whitespace-nowrap cursor-pointer"
+            title={`Not synced in the last ${STALE_DAYS} days`}
+          >
+            <input
+              type="checkbox"
+              checked={staleOnly}
+              onChange={(e) => setStaleOnly(e.target.checked)}
+            />
+            Stale
+          </label>
+        </div>
       </div>
 
       {/* List */}
@@ -255,6 +321,18 @@ export function ProvidersTable({ selectedProvider, onSelectProvider }) {
         )}
       </div>
 
+      {totalCount > PAGE_SIZE && (
+        <div className="p-3 border-t border-border">
+          <Pagination
+            currentPage={page}
+            totalPages={Math.ceil(totalCount / PAGE_SIZE)}
+            totalCount={totalCount}
+            pageSize={PAGE_SIZE}
+            onPageChange={setPage}
+          />
+        </div>
+      )}
+
       {/* Add/Edit Form Modal */}
       <FormModal
         isOpen={isFormOpen}
@@ -32,7 +32,7 @@ function CheckCircleIcon() {
 
 function CountryBadge({ country, type, countryLookup = {} }) {
   const code = country.country_code
-  const name = countryLookup[code]
+  const name = country.country_name || countryLookup[code]
   return (
     <span className={`flex items-center gap-1.5 py-2 px-2 text-sm font-medium ${
       type === 'restricted' ? 'color-restricted' : 'color-regulated'
@@ -24,7 +24,7 @@ function CheckCircleIcon() {
 
 function CountryBadge({ country, type, countryLookup = {} }) {
   const code = country.country_code
-  const name = countryLookup[code]
+  const name = country.country_name || countryLookup[code]
   return (
     <span className={`inline-flex items-center gap-1.5 px-3.5 py-1.5 text-sm font-medium rounded-full ${
       type === 'restricted' ? 'badge-restricted' : 'badge-regulated'
@@ -1,5 +1,6 @@
 import { useState, useMemo, useCallback, useSyncExternalStore } from 'react'
 import { useProviderGames } from '../../../hooks/useProviderGames'
+import { useProviderGameFacets } from '../../../hooks/useProviderGameFacets'
 import { GameCard } from '../GameCard'
 import { ExportButton, downloadCSV, arrayToCSV } from '../../shared'
 import { api } from '../../../api/client'
@@ -81,6 +82,23 @@ export function GamesTab({ provider }) {
     isFetching,
   } = useProviderGames(provider?.id, filters, 1, { enabled: !!provider?.id })
 
+  // Volatility options come from the provider's games, counted without the volatility filter
+  const facetFilters = useMemo(() => ({ search: debouncedSearch }), [debouncedSearch])
+  const { facets } = useProviderGameFacets(provider?.id, facetFilters, { enabled: !!provider?.id })
+  const volatilityOptions = useMemo(() => {
+    if (!facets) return VOLATILITY_OPTIONS
+    const counts = { ...facets.volatility }
+    // Keep the current selection listed even when the search leaves no games with it
+    if (volatilityFilter && !(volatilityFilter in counts)) counts[volatilityFilter] = 0
+    return [
+      VOLATILITY_OPTIONS[0],
+      ...Object.entries(counts).map(([value, count]) => ({
+        value,
+        label: `${value.charAt(0).toUpperCase()}${value.slice(1)} (${count})`,
+      })),
+    ]
+  }, [facets, volatilityFilter])
+
   const previewGames = games.slice(0, previewLimit)
   const hasMore = totalCount > previewLimit
 
@@ -134,7 +152,7 @@ export function GamesTab({ provider }) {
             className="px-3 py-2 bg-surface border border-input-border rounded-lg text-text text-sm
                        focus:outline-none focus:border-primary focus:ring-1 focus:ring-primary"
           >
-            {VOLATILITY_OPTIONS.map(opt => (
+            {volatilityOptions.map(opt => (
               <option key={opt.value} value={opt.value}>{opt.label}</option>
             ))}
           </select>
@@ -0,0 +1,34 @@
+import { useQuery } from '@tanstack/react-query'
+import { api } from '../api/client'
+
+function buildQueryParams(filters) {
+  const params = new URLSearchParams()
+
+  if (filters.search) params.set('search', filters.search)
+  if (filters.volatility) params.set('volatility', filters.volatility)
+  if (filters.game_type) params.set('game_type', filters.game_type)
+  if (filters.rtp_min) params.set('rtp_min', filters.rtp_min)
+  if (filters.rtp_max) params.set('rtp_max', filters.rtp_max)
+  if (filters.theme) params.set('theme', filters.theme)
+
+  return params.toString()
+}
+
+// Per-value game counts (volatility, type, platform, RTP buckets) for a provider
+export function useProviderGameFacets(providerId, filters = {}, { enabled = true } = {}) {
+  const queryString = buildQueryParams(filters)
+
+  const { data, isLoading, isError } = useQuery({
+    queryKey: ['providerGameFacets', providerId, filters],
+    queryFn: () => api.get(`/providers/${providerId}/games/facets/?${queryString}`),
+    enabled: enabled && !!providerId,
+    staleTime: 2 * 60 * 1000,
+    placeholderData: (previousData) => previousData,
+  })
+
+  return {
+    facets: data ?? null,
+    isLoading,
+    isError,
+  }
+}
@@ -1,6 +1,9 @@
 import { useQuery } from '@tanstack/react-query'
 import { api } from '../api/client'
 
+// Only the columns GameCard / GameListModal render (skips tags, ids, etc.)
+const GAME_CARD_FIELDS = 'id,game_title,thumbnail,rtp,volatility,themes,features'
+
 function buildQueryParams(filters, page) {
   const params = new URLSearchParams()
 
@@ -12,6 +15,7 @@ function buildQueryParams(filters, page) {
   if (filters.theme) params.set('theme', filters.theme)
 
   params.set('page', page.toString())
+  params.set('fields', GAME_CARD_FIELDS)
 
   return params.toString()
 }
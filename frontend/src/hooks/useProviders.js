@@ -1,6 +1,9 @@
 import { useQuery } from '@tanstack/react-query'
 import { api } from '../api/client'
 
+// Only the columns ProviderCard renders; the expanded card loads the detail endpoint
+const PROVIDER_CARD_FIELDS = 'id,provider_name,logo_url_dark,logo_url_light,game_count,supported_game_types'
+
 function buildQueryParams(filters, page = 1) {
   const params = new URLSearchParams()
 
@@ -15,6 +18,7 @@ function buildQueryParams(filters, page = 1) {
   if (filters.regulated_country.length) params.set('regulated_country', filters.regulated_country.join(','))
 
   params.set('page', page.toString())
+  params.set('fields', PROVIDER_CARD_FIELDS)
 
   return params.toString()
 }